@@ -1,6 +1,7 @@
 "use server"
 
 import { revalidatePath } from "next/cache"
+import { buildUserQuery, DEFAULT_PAGE_SIZE } from "@/lib/api-service"
 
 const API_URL = process.env.NEXT_PUBLIC_API_URL || process.env.NEXT_PUBLIC_BACKEND_API_URL || 'http://127.0.0.1:8000';
 
@@ -127,28 +128,15 @@ export async function deleteClientLGPD(clientId: string) {
   }
 }
 
-export async function searchClients(searchTerm: string) {
+export async function searchClients(searchTerm: string, skip: number = 0, limit: number = DEFAULT_PAGE_SIZE) {
   try {
-    // Fetch all users and filter client-side for now (inefficient but works for small data)
-    // Ideally backend should support ?search=...
-    const response = await fetch(`${API_URL}/users/`, { cache: 'no-store' });
+    // Backend filters by role and matches CPF prefix / name via indexes, one page at a time
+    const query = buildUserQuery({ role: 'client', search: searchTerm, skip, limit });
+    const response = await fetch(`${API_URL}/users/${query}`, { cache: 'no-store' });
     if (!response.ok) return { success: false, error: "Failed to fetch clients" };
 
-    const users = await response.json();
-    const roleId = await getClientRoleId();
-
-    const filtered = users.filter((u: any) => {
-      const isClient = u.role_id === roleId;
-      if (!isClient) return false;
-
-      const term = searchTerm.toLowerCase();
-      const nameMatch = u.name.toLowerCase().includes(term);
-      const cpfMatch = u.cpf && u.cpf.includes(searchTerm.replace(/\D/g, ""));
-      
-      return nameMatch || cpfMatch;
-    });
-
-    return { success: true, data: filtered };
+    const data = await response.json();
+    return { success: true, data, hasMore: data.length === limit };
   } catch (error: any) {
     return { success: false, error: "An unexpected error occurred" };
   }
@@ -1,6 +1,7 @@
 "use server"
 
 import { revalidatePath } from "next/cache"
+import { publishInventoryEvents } from "@/lib/inventory-publisher"
 
 const API_URL = process.env.NEXT_PUBLIC_API_URL || process.env.NEXT_PUBLIC_BACKEND_API_URL || 'http://127.0.0.1:8000';
 
@@ -153,11 +154,22 @@ export async function updateProductStock(productId: string, newQuantity: number,
   }
 }
 
-export async function createSupplierOrder(productId: string, quantity: number, expectedDate?: string) {
+export async function createSupplierOrder(
+  productId: string,
+  quantity: number,
+  expectedDate?: string,
+  extra?: {
+    status?: string
+    created_at?: string
+    batch_number?: string
+    expiration_date?: string
+  },
+) {
   try {
     const payload: any = {
       product_id: parseInt(productId),
-      quantity: quantity
+      quantity: quantity,
+      ...extra
     };
 
     if (expectedDate) {
@@ -176,8 +188,19 @@ export async function createSupplierOrder(productId: string, quantity: number, e
       return { success: false, error: "Failed to create supplier order" }
     }
 
+    const data = await response.json().catch(() => ({}));
+
+    const order = { ...payload, ...data };
+    // Without an id, listeners can't place the order; they pick it up on the next refetch
+    if (order.id !== undefined && order.id !== null) {
+      publishInventoryEvents({ type: "order", order });
+    }
+    if (order.status === 'received') {
+      publishInventoryEvents({ type: "stock", product_id: productId, delta: quantity });
+    }
+
     revalidatePath("/orders")
-    return { success: true }
+    return { success: true, data: order }
   } catch (error) {
     return { success: false, error: "An unexpected error occurred" }
   }
@@ -197,9 +220,20 @@ export async function receiveSupplierOrder(orderId: string, batchData: { batch_n
       return { success: false, error: "Failed to receive order" }
     }
 
+    const data = await response.json().catch(() => ({}));
+
+    const order = { status: 'received', received_at: new Date().toISOString(), ...data, id: data.id ?? orderId };
+    publishInventoryEvents({ type: "order", order });
+    if (order.product_id != null && order.quantity != null) {
+      const productId = String(order.product_id);
+      publishInventoryEvents(
+        { type: "stock", product_id: productId, delta: order.quantity },
+        { type: "batch", product_id: productId, batch: { ...batchData, quantity: order.quantity } },
+      );
+    }
+
     revalidatePath("/orders")
-    revalidatePath("/products")
-    return { success: true }
+    return { success: true, data: order }
   } catch (error) {
     return { success: false, error: "An unexpected error occurred" }
   }
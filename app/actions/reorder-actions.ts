@@ -0,0 +1,155 @@
+"use server"
+
+import { revalidatePath } from "next/cache"
+import { publishInventoryEvents } from "@/lib/inventory-publisher"
+import {
+  aggregateUnitsSold,
+  computeReorderPlan,
+  DEFAULT_REORDER_OPTIONS,
+  lastSupplierByProduct,
+  type SupplierReorder,
+} from "@/lib/reorder-engine"
+
+const API_URL = process.env.NEXT_PUBLIC_API_URL || process.env.NEXT_PUBLIC_BACKEND_API_URL || 'http://127.0.0.1:8000';
+
+// Concurrent POSTs when the backend has no bulk endpoint
+const FANOUT_CONCURRENCY = 8;
+
+// Order events for rows the backend returned an id for; listeners key orders
+// by id, the rest show up on the next refetch
+function publishCreatedOrders(created: any[]) {
+  publishInventoryEvents(
+    ...created
+      .filter((order) => order.id !== undefined && order.id !== null)
+      .map((order) => ({ type: "order" as const, order }))
+  );
+}
+
+// Runs fn over items with at most `limit` calls in flight, keeping input order
+async function mapWithConcurrency<T, R>(items: T[], limit: number, fn: (item: T) => Promise<R>): Promise<R[]> {
+  const results = new Array<R>(items.length);
+  let next = 0;
+  const worker = async () => {
+    while (next < items.length) {
+      const index = next++;
+      results[index] = await fn(items[index]);
+    }
+  };
+  await Promise.all(Array.from({ length: Math.min(limit, items.length) }, worker));
+  return results;
+}
+
+async function getUnitsSold(days: number) {
+  // Prefer the backend's aggregated velocity; fall back to summing recent orders
+  const response = await fetch(`${API_URL}/reports/sales-velocity?days=${days}`, { cache: 'no-store' });
+  if (response.ok) {
+    const rows = await response.json();
+    return new Map<string, number>(rows.map((r: any) => [r.product_id.toString(), r.units_sold]));
+  }
+
+  const ordersRes = await fetch(`${API_URL}/orders/`, { cache: 'no-store' });
+  if (!ordersRes.ok) throw new Error("Failed to fetch sales history");
+  const since = new Date(Date.now() - days * 24 * 60 * 60 * 1000);
+  return aggregateUnitsSold(await ordersRes.json(), since);
+}
+
+export async function previewBulkReorder() {
+  try {
+    const options = DEFAULT_REORDER_OPTIONS;
+    const [productsRes, unitsSold, supplierOrdersRes] = await Promise.all([
+      fetch(`${API_URL}/products/`, { cache: 'no-store' }),
+      getUnitsSold(options.velocityDays),
+      fetch(`${API_URL}/supplier-orders/`, { cache: 'no-store' }).catch(() => null)
+    ]);
+
+    if (!productsRes.ok) {
+      return { success: false, error: "Failed to fetch products" };
+    }
+
+    // Products don't carry a supplier; reuse the one from each product's last supplier order
+    const supplierOrders = supplierOrdersRes?.ok ? await supplierOrdersRes.json().catch(() => []) : [];
+    const suppliers = lastSupplierByProduct(Array.isArray(supplierOrders) ? supplierOrders : []);
+    const plan = computeReorderPlan(await productsRes.json(), unitsSold, options, suppliers);
+    return { success: true, data: plan };
+  } catch (error: any) {
+    console.error("Bulk reorder preview error:", error);
+    return { success: false, error: `Connection error: ${error.message}` };
+  }
+}
+
+export async function createBulkReorder(plan: SupplierReorder[], expectedDate?: string) {
+  try {
+    const payload = {
+      orders: plan.map((group) => ({
+        supplier_id: group.supplier_id ? parseInt(group.supplier_id) : null,
+        expected_delivery_date: expectedDate || null,
+        items: group.lines.map((line) => ({
+          product_id: parseInt(line.product_id),
+          quantity: line.quantity
+        }))
+      }))
+    };
+
+    const response = await fetch(`${API_URL}/supplier-orders/bulk`, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify(payload),
+    });
+
+    // The bulk endpoint groups lines into one purchase order per supplier and
+    // returns the created supplier-order rows, same shape as /supplier-orders/
+    let created: any[];
+    if (response.ok) {
+      created = await response.json();
+    } else if (response.status === 404 || response.status === 405) {
+      // Backend without the bulk endpoint: still a single round trip from the
+      // browser, fanned out server-side with bounded parallelism
+      const items = payload.orders.flatMap((order) =>
+        order.items.map((item) => ({
+          ...item,
+          ...(order.expected_delivery_date ? { expected_delivery_date: order.expected_delivery_date } : {})
+        }))
+      );
+      const results = await mapWithConcurrency(items, FANOUT_CONCURRENCY, async (item) => {
+        try {
+          const res = await fetch(`${API_URL}/supplier-orders/`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(item),
+          });
+          return res.ok ? { ...item, ...(await res.json().catch(() => ({}))) } : null;
+        } catch (e) {
+          return null;
+        }
+      });
+      created = results.filter((r) => r !== null);
+      if (created.length < results.length) {
+        // Report what was created so the caller can retry only the rest
+        publishCreatedOrders(created);
+        revalidatePath("/orders")
+        return {
+          success: false,
+          error: `${results.length - created.length} of ${results.length} supplier orders failed`,
+          data: created,
+          orderedProductIds: created.map((order) => order.product_id.toString()),
+        };
+      }
+    } else {
+      const errorText = await response.text();
+      let errorDetail = errorText;
+      try {
+          const errorJson = JSON.parse(errorText);
+          errorDetail = errorJson.detail || errorText;
+      } catch (e) {}
+      return { success: false, error: errorDetail || "Failed to create supplier orders" };
+    }
+
+    publishCreatedOrders(created);
+
+    revalidatePath("/orders")
+    return { success: true, data: created }
+  } catch (error: any) {
+    console.error("Bulk reorder error:", error);
+    return { success: false, error: `Connection error: ${error.message}` };
+  }
+}
@@ -1,6 +1,7 @@
 "use server"
 
 import { revalidatePath } from "next/cache"
+import { publishInventoryEvents } from "@/lib/inventory-publisher"
 
 const API_URL = process.env.NEXT_PUBLIC_API_URL || process.env.NEXT_PUBLIC_BACKEND_API_URL || 'http://127.0.0.1:8000';
 
@@ -69,8 +70,16 @@ export async function createSale(saleData: {
       })),
     }
 
+    // Open registers apply the stock deltas instead of reloading the catalog
+    publishInventoryEvents(
+      ...saleData.items.map((item) => ({
+        type: "stock" as const,
+        product_id: String(item.product_id),
+        delta: -item.quantity,
+      })),
+    )
+
     revalidatePath("/sales")
-    revalidatePath("/products")
     return { success: true, data: receiptData }
   } catch (error: any) {
     console.error("Sale creation error:", error)
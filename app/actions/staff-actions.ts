@@ -1,14 +1,15 @@
 "use server"
 
 import { revalidatePath } from "next/cache"
+import { buildUserQuery } from "@/lib/api-service"
 
 const API_URL = process.env.NEXT_PUBLIC_API_URL || process.env.NEXT_PUBLIC_BACKEND_API_URL || 'http://127.0.0.1:8000';
 
 export async function getStaffMembers() {
   try {
-    // Fetch users and roles in parallel
+    // Staff are filtered by role on the backend; roles is a small lookup table
     const [usersRes, rolesRes] = await Promise.all([
-      fetch(`${API_URL}/users/`, { cache: 'no-store' }),
+      fetch(`${API_URL}/users/${buildUserQuery({ exclude_role: 'client' })}`, { cache: 'no-store' }),
       fetch(`${API_URL}/roles/`, { cache: 'no-store' })
     ]);
 
@@ -23,20 +24,17 @@ export async function getStaffMembers() {
     const roleMap = new Map();
     roles.forEach((r: any) => roleMap.set(r.id, r.name));
 
-    // Filter and map users
     const staff = users
       .filter((u: any) => {
-        const roleName = roleMap.get(u.role_id);
-        // Filter out clients/customers AND ensure we only show staff roles
-        // Assuming roles: 1=Admin, 2=Pharmacist, 3=Manager, 4=Client
-        // We want to exclude Client (4) and potentially others if defined
+        const roleName = u.role_name || roleMap.get(u.role_id);
+        // Guard against backends that ignore exclude_role
         return roleName && !['client', 'customer'].includes(roleName.toLowerCase());
       })
       .map((u: any) => ({
         id: u.id.toString(),
         full_name: u.name,
         email: u.email,
-        role: roleMap.get(u.role_id) || 'unknown',
+        role: u.role_name || roleMap.get(u.role_id) || 'unknown',
         created_at: new Date().toISOString() // Backend doesn't return created_at yet
       }));
 
@@ -2,6 +2,8 @@
 
 import { createClient } from "@/lib/supabase/server"
 import { revalidatePath } from "next/cache"
+import { headers } from "next/headers"
+import { enqueueAuditWrites } from "@/lib/audit-queue"
 
 export async function adjustStock(productId: string, newQuantity: number, reason: string) {
   const supabase = await createClient()
@@ -20,6 +22,12 @@ export async function adjustStock(productId: string, newQuantity: number, reason
 
     const difference = newQuantity - currentProduct.stock_quantity
 
+    // The audit queue flushes with the service role, so the acting user has to
+    // be captured here
+    const {
+      data: { user },
+    } = await supabase.auth.getUser()
+
     // Update product stock
     const { error: updateError } = await supabase
       .from("products")
@@ -33,18 +41,38 @@ export async function adjustStock(productId: string, newQuantity: number, reason
       return { success: false, error: updateError.message }
     }
 
-    // Record stock movement
-    const { error: movementError } = await supabase.from("stock_movements").insert([
-      {
-        product_id: productId,
-        movement_type: "adjustment",
-        quantity: difference,
-        notes: reason,
-      },
-    ])
-
-    if (movementError) {
-      console.error("Failed to record stock movement:", movementError)
+    // Movement and audit rows are written behind the request by the audit queue
+    const requestHeaders = await headers()
+    try {
+      await enqueueAuditWrites(
+        {
+          table: "stock_movements",
+          row: {
+            product_id: productId,
+            movement_type: "adjustment",
+            quantity: difference,
+            notes: reason,
+            user_id: user?.id ?? null,
+            created_at: new Date().toISOString(),
+          },
+        },
+        {
+          table: "audit_log",
+          row: {
+            user_id: user?.id ?? null,
+            action: "stock_adjustment",
+            table_name: "products",
+            record_id: productId,
+            old_values: { stock_quantity: currentProduct.stock_quantity },
+            new_values: { stock_quantity: newQuantity, reason },
+            ip_address: requestHeaders.get("x-forwarded-for")?.split(",")[0].trim() || null,
+            user_agent: requestHeaders.get("user-agent"),
+            created_at: new Date().toISOString(),
+          },
+        },
+      )
+    } catch (auditError) {
+      console.error("Failed to record stock movement:", auditError)
       // Don't fail the entire operation if movement recording fails
     }
 
@@ -1,16 +1,22 @@
 "use client"
 
 import { useEffect, useState } from "react"
+import dynamic from "next/dynamic"
 import { useRouter } from "next/navigation"
 import { DashboardHeader } from "@/components/dashboard/dashboard-header"
 import { AdminStats } from "@/components/admin/admin-stats"
-import { AdminCharts } from "@/components/admin/admin-charts"
 import { authService } from "@/lib/auth-service"
 import { apiService } from "@/lib/api-service"
 import { Button } from "@/components/ui/button"
 import { Users } from "lucide-react"
 import Link from "next/link"
 
+// recharts is only needed here; load it after the stats render instead of in the page bundle
+const AdminCharts = dynamic(() => import("@/components/admin/admin-charts").then((m) => m.AdminCharts), {
+  ssr: false,
+  loading: () => <div className="h-[300px] mt-6 rounded-lg border bg-white animate-pulse" />,
+})
+
 export default function AdminPage() {
   const router = useRouter()
   const [user, setUser] = useState<any>(null)
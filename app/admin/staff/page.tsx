@@ -1,6 +1,7 @@
 "use client"
 
 import { useEffect, useState } from "react"
+import dynamic from "next/dynamic"
 import { useRouter } from "next/navigation"
 import { DashboardHeader } from "@/components/dashboard/dashboard-header"
 import { StaffActivity } from "@/components/staff/staff-activity"
@@ -10,7 +11,11 @@ import { Button } from "@/components/ui/button"
 import { Plus } from "lucide-react"
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card"
 
-import { StaffRegistration } from "@/components/staff/staff-registration"
+// Registration form is rarely opened; fetched on first open
+const StaffRegistration = dynamic(
+  () => import("@/components/staff/staff-registration").then((m) => m.StaffRegistration),
+  { ssr: false },
+)
 
 export default function StaffPage() {
   const router = useRouter()
@@ -82,11 +87,13 @@ export default function StaffPage() {
           <StaffActivity staff={staffMembers} />
         </div>
 
-        <StaffRegistration 
-          open={isRegistrationOpen} 
-          onOpenChange={setIsRegistrationOpen}
-          onSuccess={refreshStaff}
-        />
+        {isRegistrationOpen && (
+          <StaffRegistration 
+            open={isRegistrationOpen} 
+            onOpenChange={setIsRegistrationOpen}
+            onSuccess={refreshStaff}
+          />
+        )}
       </main>
     </div>
   )
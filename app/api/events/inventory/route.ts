@@ -0,0 +1,63 @@
+import { publishInventoryEvents, subscribeInventoryEvents } from "@/lib/inventory-publisher"
+
+export const dynamic = "force-dynamic"
+export const runtime = "nodejs"
+
+const KEEP_ALIVE_MS = 15000
+
+export async function GET(request: Request) {
+  const encoder = new TextEncoder()
+  let cleanup = () => {}
+
+  const stream = new ReadableStream({
+    start(controller) {
+      const send = (chunk: string) => {
+        try {
+          controller.enqueue(encoder.encode(chunk))
+        } catch {
+          cleanup()
+        }
+      }
+
+      send(": connected\n\n")
+      const unsubscribe = subscribeInventoryEvents((event) => send(`data: ${JSON.stringify(event)}\n\n`))
+      // Comment frames keep proxies from closing an idle stream
+      const keepAlive = setInterval(() => send(": ping\n\n"), KEEP_ALIVE_MS)
+
+      cleanup = () => {
+        clearInterval(keepAlive)
+        unsubscribe()
+      }
+      request.signal.addEventListener("abort", () => {
+        cleanup()
+        try {
+          controller.close()
+        } catch {}
+      })
+    },
+    cancel() {
+      cleanup()
+    },
+  })
+
+  return new Response(stream, {
+    headers: {
+      "Content-Type": "text/event-stream",
+      "Cache-Control": "no-cache, no-transform",
+      Connection: "keep-alive",
+    },
+  })
+}
+
+// Manual publishing for local testing only; in production events come from
+// server actions (or the backend stream via NEXT_PUBLIC_INVENTORY_EVENTS_URL)
+export async function POST(request: Request) {
+  if (process.env.NODE_ENV === "production") {
+    return new Response("Not found", { status: 404 })
+  }
+
+  const body = await request.json()
+  const events = Array.isArray(body) ? body : [body]
+  publishInventoryEvents(...events)
+  return Response.json({ published: events.length })
+}
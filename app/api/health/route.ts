@@ -0,0 +1,14 @@
+import { NextResponse } from "next/server"
+
+export const dynamic = "force-dynamic"
+export const runtime = "nodejs"
+
+// Set by server-warmup.js; absent when running `next dev` / `next start`
+const globalForWarmup = globalThis as unknown as { __routeWarmup?: "pending" | "done" }
+
+export function GET() {
+  if (globalForWarmup.__routeWarmup === "pending") {
+    return NextResponse.json({ status: "warming" }, { status: 503 })
+  }
+  return NextResponse.json({ status: "ok" })
+}
@@ -0,0 +1,148 @@
+import { NextResponse, type NextRequest } from "next/server"
+import { authService } from "@/lib/auth-service"
+import { apiService } from "@/lib/api-service"
+import {
+  createReportStream,
+  isValidTimeZone,
+  ordersToReportRows,
+  REPORT_COLUMNS,
+  type ReportFormat,
+  type ReportLevel,
+  type ReportPageFetcher,
+  type ReportRow,
+} from "@/lib/sales-report"
+
+export const dynamic = "force-dynamic"
+export const runtime = "nodejs"
+
+const API_URL = process.env.NEXT_PUBLIC_API_URL || process.env.NEXT_PUBLIC_BACKEND_API_URL || 'http://127.0.0.1:8000';
+
+// Roles allowed to export sales; anything else, or a role we can't resolve, is refused
+const REPORT_ROLES = ["owner", "admin", "manager", "pharmacist", "seller"]
+
+const CONTENT_TYPES: Record<ReportFormat, string> = {
+  csv: "text/csv; charset=utf-8",
+  ndjson: "application/x-ndjson; charset=utf-8",
+}
+
+// Same resolution as the staff list: role_name, then role_id through /roles/
+async function resolveRoleName(user: any): Promise<string | null> {
+  if (user.role_name) return user.role_name
+  if (typeof user.role === "string" && user.role && isNaN(Number(user.role))) return user.role
+  const roleId = user.role_id ?? user.role
+  if (roleId === undefined || roleId === null) return null
+  const roles = await apiService.getRoles()
+  return roles.find((r: any) => r.id.toString() === roleId.toString())?.name ?? null
+}
+
+// GET /api/reports/sales?from=<ISO>&to=<ISO>&level=lines|daily&format=csv|ndjson&tz=<IANA zone>
+// Add &count=1 to get { rows } for progress reporting instead of the export;
+// rows is null when the backend can't count without loading every order.
+export async function GET(request: NextRequest) {
+  const token = request.cookies.get("token")?.value
+  if (!token) {
+    return NextResponse.json({ detail: "Not authenticated" }, { status: 401 })
+  }
+  let user: any
+  try {
+    user = await authService.getMe(token)
+  } catch {
+    return NextResponse.json({ detail: "Not authenticated" }, { status: 401 })
+  }
+  try {
+    const roleName = await resolveRoleName(user)
+    if (!roleName || !REPORT_ROLES.includes(roleName.toLowerCase())) {
+      return NextResponse.json({ detail: "Not allowed" }, { status: 403 })
+    }
+  } catch {
+    return NextResponse.json({ detail: "Not allowed" }, { status: 403 })
+  }
+
+  const params = request.nextUrl.searchParams
+  const from = params.get("from")
+  const to = params.get("to")
+  const level = (params.get("level") || "lines") as ReportLevel
+  const format = (params.get("format") || "csv") as ReportFormat
+  // Days in the daily report are calendar days in this zone (the browser's)
+  const tz = params.get("tz") || "UTC"
+  if (!from || !to || isNaN(Date.parse(from)) || isNaN(Date.parse(to)) || Date.parse(from) >= Date.parse(to)) {
+    return NextResponse.json({ detail: "from and to must be ISO timestamps with from < to" }, { status: 400 })
+  }
+  if (!(level in REPORT_COLUMNS) || !(format in CONTENT_TYPES)) {
+    return NextResponse.json({ detail: "Unsupported level or format" }, { status: 400 })
+  }
+  if (!isValidTimeZone(tz)) {
+    return NextResponse.json({ detail: "Unknown time zone" }, { status: 400 })
+  }
+
+  // Backends without /orders/report: build every row from /orders/ once, the
+  // same load the Sales History page puts on them, and page through it
+  let fallbackRows: Promise<ReportRow[]> | null = null
+  const loadFallbackRows = () => {
+    if (!fallbackRows) {
+      fallbackRows = Promise.all([apiService.getOrders(), apiService.getStaff()]).then(([orders, staff]) => {
+        const sellers = new Map<string, string>(staff.map((s: any) => [s.id.toString(), s.name]))
+        return ordersToReportRows(orders, sellers, level, { from, to, tz })
+      })
+    }
+    return fallbackRows
+  }
+
+  if (params.get("count") === "1") {
+    try {
+      const query = new URLSearchParams({ level, from, to, tz })
+      const response = await fetch(`${API_URL}/orders/report/count?${query}`, { cache: "no-store" })
+      if (response.ok) {
+        const data = await response.json()
+        return NextResponse.json({ rows: Number(data.rows) })
+      }
+      if (response.status !== 404 && response.status !== 405) {
+        return NextResponse.json({ detail: "Failed to count report rows" }, { status: 502 })
+      }
+      // The export itself loads all of /orders/ on this path; don't load it a second time for a progress bar
+      return NextResponse.json({ rows: null })
+    } catch (error: any) {
+      return NextResponse.json({ detail: error.message }, { status: 500 })
+    }
+  }
+
+  let useFallback = false
+  const fetchPage: ReportPageFetcher = async (cursor, limit) => {
+    if (!useFallback) {
+      const query = new URLSearchParams({ level, from, to, tz, limit: limit.toString() })
+      if (cursor && level === "lines") {
+        query.set("after_date", cursor.sale_date)
+        query.set("after_sale", cursor.sale_id.toString())
+        query.set("after_item", cursor.item_id.toString())
+      } else if (cursor) {
+        query.set("after_day", cursor.day)
+      }
+      const response = await fetch(`${API_URL}/orders/report?${query}`, { cache: "no-store" })
+      if (response.ok) return response.json()
+      // Only switch sources before the first page, so cursors never mix
+      if (cursor || (response.status !== 404 && response.status !== 405)) {
+        throw new Error(`Failed to fetch report page (${response.status})`)
+      }
+      useFallback = true
+    }
+    const rows = await loadFallbackRows()
+    const start = cursor ? cursor.__index + 1 : 0
+    return rows.slice(start, start + limit)
+  }
+
+  const stream = createReportStream({
+    fetchPage,
+    columns: REPORT_COLUMNS[level],
+    format,
+    onError: (error) => console.error("Sales report export failed:", error),
+  })
+
+  const filename = `sales-${level}-${from.slice(0, 10)}-${to.slice(0, 10)}.${format}`
+  return new Response(stream, {
+    headers: {
+      "Content-Type": CONTENT_TYPES[format],
+      "Content-Disposition": `attachment; filename="${filename}"`,
+      "Cache-Control": "no-store",
+    },
+  })
+}
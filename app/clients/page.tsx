@@ -7,7 +7,7 @@ import { ClientList } from "@/components/clients/client-list"
 import { ClientRegistration } from "@/components/clients/client-registration"
 import { Tabs, TabsContent, TabsList, TabsTrigger } from "@/components/ui/tabs"
 import { authService } from "@/lib/auth-service"
-import { apiService } from "@/lib/api-service"
+import { apiService, DEFAULT_PAGE_SIZE } from "@/lib/api-service"
 
 export default function ClientsPage() {
   const router = useRouter()
@@ -15,10 +15,13 @@ export default function ClientsPage() {
   const [loading, setLoading] = useState(true)
   const [clients, setClients] = useState<any[]>([])
 
-  const fetchClients = async () => {
+  const [searchTerm, setSearchTerm] = useState("")
+  const [hasMore, setHasMore] = useState(false)
+
+  const fetchClients = async (search: string = searchTerm, skip: number = 0) => {
     try {
-      const allUsers = await apiService.getClients()
-      const mappedClients = allUsers
+      const page = await apiService.getClients({ search, skip, limit: DEFAULT_PAGE_SIZE })
+      const mappedClients = page
         .filter((u: any) => (u.role_name && u.role_name.toLowerCase() === 'client') || u.client_type) 
         .map((u: any) => ({
           id: u.id.toString(),
@@ -32,12 +35,18 @@ export default function ClientsPage() {
           is_active: u.is_active,
           created_at: new Date().toISOString()
         }))
-      setClients(mappedClients)
+      setClients((prev) => (skip > 0 ? [...prev, ...mappedClients] : mappedClients))
+      setHasMore(page.length === DEFAULT_PAGE_SIZE)
     } catch (err) {
       console.error("Failed to fetch clients:", err)
     }
   }
 
+  const handleSearch = (term: string) => {
+    setSearchTerm(term)
+    fetchClients(term, 0)
+  }
+
   useEffect(() => {
     const fetchData = async () => {
       const token = authService.getToken()
@@ -81,11 +90,16 @@ export default function ClientsPage() {
           </TabsList>
 
           <TabsContent value="list" className="space-y-6">
-            <ClientList clients={clients} />
+            <ClientList
+              clients={clients}
+              onSearch={handleSearch}
+              hasMore={hasMore}
+              onLoadMore={() => fetchClients(searchTerm, clients.length)}
+            />
           </TabsContent>
 
           <TabsContent value="register" className="space-y-6">
-            <ClientRegistration onSuccess={fetchClients} />
+            <ClientRegistration onSuccess={() => fetchClients(searchTerm, 0)} />
           </TabsContent>
         </Tabs>
       </main>
@@ -10,6 +10,16 @@ import { StockOverview } from "@/components/stock/stock-overview"
 import { ExpirationOverview } from "@/components/expiration/expiration-overview"
 import { authService } from "@/lib/auth-service"
 import { apiService } from "@/lib/api-service"
+import {
+  EXPIRATION_WINDOW_DAYS,
+  computeExpirationAlerts,
+  computeStockAlerts,
+  summarizeAlerts,
+  toAlertSummary,
+  toExpirationAlert,
+  toStockAlert,
+  type AlertSummary,
+} from "@/lib/inventory-alerts"
 
 export default function DashboardPage() {
   const router = useRouter()
@@ -17,6 +27,7 @@ export default function DashboardPage() {
   const [loading, setLoading] = useState(true)
   const [lowStockProducts, setLowStockProducts] = useState<any[]>([])
   const [expiringProducts, setExpiringProducts] = useState<any[]>([])
+  const [alertSummary, setAlertSummary] = useState<AlertSummary | undefined>()
   const [recentSales, setRecentSales] = useState<any[]>([])
 
   useEffect(() => {
@@ -35,48 +46,44 @@ export default function DashboardPage() {
 
         setUser(userData)
 
-        // Fetch products, orders, and users for dashboard widgets
-        const [products, orders, users] = await Promise.all([
+        // Fetch products, orders and the precomputed alert feed for dashboard widgets.
+        // The cards list the top entries only; their counts come from the summary.
+        const [products, orders, stockFeed, expirationFeed, summary] = await Promise.all([
           apiService.getProducts(),
           apiService.getOrders(),
-          apiService.getClients()
+          apiService.getStockAlerts({ limit: 3 }).catch(() => null),
+          apiService.getExpirationAlerts({ within_days: EXPIRATION_WINDOW_DAYS, limit: 3 }).catch(() => null),
+          apiService.getAlertSummary({ within_days: EXPIRATION_WINDOW_DAYS }).catch(() => null)
         ])
-        
-        // Process Low Stock (threshold dynamic)
-        const lowStock = products
-          .filter((p: any) => p.stock_quantity <= (p.min_stock_level || 10))
-          .map((p: any) => ({
-            product_id: p.id.toString(),
-            product_name: p.name,
-            current_stock: p.stock_quantity,
-            min_stock_level: p.min_stock_level || 10
-          }))
-        setLowStockProducts(lowStock)
-
-        // Process Expiration
-        const today = new Date()
-        const expiring = products
-          .filter((p: any) => p.validity)
-          .map((p: any) => {
-            const validityDate = new Date(p.validity)
-            const diffTime = validityDate.getTime() - today.getTime()
-            const diffDays = Math.ceil(diffTime / (1000 * 60 * 60 * 24))
-            return {
-              product_id: p.id.toString(),
-              product_name: p.name,
-              expiration_date: p.validity,
-              days_until_expiration: diffDays
-            }
-          })
-          .filter((p: any) => p.days_until_expiration <= 90) // Show items expiring in next 90 days
-          .sort((a: any, b: any) => a.days_until_expiration - b.days_until_expiration)
-          
-        setExpiringProducts(expiring)
+
+        // Fall back to scanning the catalog only if the alert feed is unavailable
+        if (stockFeed && expirationFeed && summary) {
+          setLowStockProducts(stockFeed.map(toStockAlert))
+          setExpiringProducts(expirationFeed.map(toExpirationAlert))
+          setAlertSummary(toAlertSummary(summary))
+        } else {
+          const stockAlerts = computeStockAlerts(products)
+          const expirationAlerts = computeExpirationAlerts(products, EXPIRATION_WINDOW_DAYS)
+          setLowStockProducts(stockAlerts)
+          setExpiringProducts(expirationAlerts)
+          setAlertSummary(summarizeAlerts(stockAlerts, expirationAlerts))
+        }
 
         // Process Recent Sales
-        const processedSales = orders
+        const recentOrders = orders
           .sort((a: any, b: any) => new Date(b.created_at).getTime() - new Date(a.created_at).getTime())
           .slice(0, 5) // Get top 5 recent sales
+
+        // Resolve only the clients and sellers referenced by the recent orders
+        const userIds = Array.from(new Set<string>(
+          recentOrders
+            .flatMap((order: any) => [order.user_id, order.seller_id])
+            .filter((id: any) => id != null)
+            .map((id: any) => id.toString())
+        ))
+        const users = userIds.length > 0 ? await apiService.getUsers({ ids: userIds }) : []
+
+        const processedSales = recentOrders
           .map((order: any) => {
             const client = users.find((u: any) => u.id === order.user_id)
             const seller = users.find((u: any) => u.id === order.seller_id)
@@ -134,8 +141,8 @@ export default function DashboardPage() {
 
           <div className="space-y-8">
             <QuickActions userRole={user?.role || "staff"} />
-            <StockOverview lowStockProducts={lowStockProducts} />
-            <ExpirationOverview expiringProducts={expiringProducts} />
+            <StockOverview lowStockProducts={lowStockProducts} summary={alertSummary} />
+            <ExpirationOverview expiringProducts={expiringProducts} summary={alertSummary} />
           </div>
         </div>
       </main>
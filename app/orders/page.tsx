@@ -8,9 +8,18 @@ import { Button } from "@/components/ui/button"
 import { Truck, Calendar, Package, CheckCircle, History, Plus } from "lucide-react"
 import { DashboardHeader } from "@/components/dashboard/dashboard-header"
 import { StockAlerts } from "@/components/stock/stock-alerts"
+import { BulkReorderDialog } from "@/components/stock/bulk-reorder-dialog"
 import { authService } from "@/lib/auth-service"
-import { apiService } from "@/lib/api-service"
-import { receiveSupplierOrder } from "@/app/actions/product-actions"
+import { apiService, DEFAULT_PAGE_SIZE } from "@/lib/api-service"
+import { createSupplierOrder, receiveSupplierOrder } from "@/app/actions/product-actions"
+import { applyStockEventToState, upsertOrder, useInventoryEvents, type StockAlertState } from "@/lib/inventory-events"
+import {
+  appendAlertPage,
+  computeStockAlerts,
+  summarizeAlerts,
+  toAlertSummary,
+  toStockAlert,
+} from "@/lib/inventory-alerts"
 import {
   Dialog,
   DialogContent,
@@ -28,9 +37,10 @@ export default function OrdersPage() {
   const router = useRouter()
   const [user, setUser] = useState<any>(null)
   const [loading, setLoading] = useState(true)
-  const [lowStockProducts, setLowStockProducts] = useState<any[]>([])
   const [supplierOrders, setSupplierOrders] = useState<any[]>([])
-  const [products, setProducts] = useState<any[]>([])
+  // Products, stock alerts and alert totals move together on live stock events
+  const [inventory, setInventory] = useState<StockAlertState<any>>({ products: [], alerts: [], hasMore: false })
+  const { products, alerts: lowStockProducts, summary: alertSummary, hasMore: stockHasMore } = inventory
   
   // Receive Order State
   const [isReceiveDialogOpen, setIsReceiveDialogOpen] = useState(false)
@@ -61,19 +71,28 @@ export default function OrdersPage() {
       const userData = await authService.getMe(token)
       setUser(userData)
 
-      // Fetch products
-      const productsData = await apiService.getProducts()
-      setProducts(productsData)
-      
-      const lowStock = productsData
-        .filter((p: any) => p.stock_quantity <= (p.min_stock_level || 5))
-        .map((p: any) => ({
-          product_id: p.id.toString(),
-          product_name: p.name,
-          current_stock: p.stock_quantity,
-          min_stock_level: p.min_stock_level || 5
-        }))
-      setLowStockProducts(lowStock)
+      // Products feed the test-order picker; alerts come from the precomputed feed
+      const [productsData, stockFeed, summary] = await Promise.all([
+        apiService.getProducts(),
+        apiService.getStockAlerts().catch(() => null),
+        apiService.getAlertSummary().catch(() => null)
+      ])
+      if (stockFeed && summary) {
+        setInventory({
+          products: productsData,
+          alerts: stockFeed.map(toStockAlert),
+          summary: toAlertSummary(summary),
+          hasMore: stockFeed.length === DEFAULT_PAGE_SIZE,
+        })
+      } else {
+        const stockAlerts = computeStockAlerts(productsData)
+        setInventory({
+          products: productsData,
+          alerts: stockAlerts,
+          summary: summarizeAlerts(stockAlerts, []),
+          hasMore: false,
+        })
+      }
 
       // Fetch supplier orders
       try {
@@ -95,6 +114,28 @@ export default function OrdersPage() {
     fetchData()
   }, [router])
 
+  const loadMoreStockAlerts = async () => {
+    try {
+      const page = await apiService.getStockAlerts({ skip: lowStockProducts.length })
+      setInventory((prev) => ({
+        ...prev,
+        alerts: appendAlertPage(prev.alerts, page.map(toStockAlert)),
+        hasMore: page.length === DEFAULT_PAGE_SIZE,
+      }))
+    } catch (error) {
+      console.error("Failed to load stock alerts", error)
+    }
+  }
+
+  // Stock and order changes (from any register) are applied incrementally
+  const live = useInventoryEvents((event) => {
+    if (event.type === "stock") {
+      setInventory((prev) => applyStockEventToState(prev, event))
+    } else if (event.type === "order") {
+      setSupplierOrders((prev) => upsertOrder(prev, event.order))
+    }
+  })
+
   const openReceiveDialog = (orderId: string) => {
     setSelectedOrderId(orderId)
     setReceiveData({ batch_number: "", expiration_date: "" })
@@ -110,7 +151,7 @@ export default function OrdersPage() {
     try {
       await receiveSupplierOrder(selectedOrderId, receiveData)
       setIsReceiveDialogOpen(false)
-      fetchData()
+      if (!live) fetchData()
     } catch (e) {
       alert("Failed to receive order")
     }
@@ -118,19 +159,16 @@ export default function OrdersPage() {
 
   const handleCreateTestOrder = async () => {
     try {
-      const payload = {
-        product_id: parseInt(testOrderData.product_id),
-        quantity: parseInt(testOrderData.quantity),
-        expected_delivery_date: testOrderData.date,
+      const result = await createSupplierOrder(testOrderData.product_id, parseInt(testOrderData.quantity), testOrderData.date, {
         status: 'received',
         created_at: new Date(testOrderData.date).toISOString(),
         batch_number: testOrderData.batch_number || `TEST-${Date.now()}`,
         expiration_date: testOrderData.expiration_date || new Date(new Date().setFullYear(new Date().getFullYear() + 1)).toISOString().split('T')[0]
-      }
-      
-      await apiService.createSupplierOrder(payload)
+      })
+      if (!result.success) throw new Error(result.error)
+
       setIsTestDialogOpen(false)
-      fetchData()
+      if (!live) fetchData()
     } catch (e) {
       alert("Failed to create test order")
     }
@@ -188,79 +226,83 @@ export default function OrdersPage() {
             </DialogContent>
           </Dialog>
 
-          <Dialog open={isTestDialogOpen} onOpenChange={setIsTestDialogOpen}>
-            <DialogTrigger asChild>
-              <Button variant="outline">
-                <Plus className="h-4 w-4 mr-2" />
-                Add Past Order (Test)
-              </Button>
-            </DialogTrigger>
-            <DialogContent>
-              <DialogHeader>
-                <DialogTitle>Create Past Order Record</DialogTitle>
-                <DialogDescription>
-                  Simulate a received order for testing history.
-                </DialogDescription>
-              </DialogHeader>
-              <div className="grid gap-4 py-4">
-                <div className="grid grid-cols-4 items-center gap-4">
-                  <Label className="text-right">Product</Label>
-                  <Select 
-                    value={testOrderData.product_id} 
-                    onValueChange={(val) => setTestOrderData({...testOrderData, product_id: val})}
-                  >
-                    <SelectTrigger className="col-span-3">
-                      <SelectValue placeholder="Select product" />
-                    </SelectTrigger>
-                    <SelectContent>
-                      {products.map(p => (
-                        <SelectItem key={p.id} value={p.id.toString()}>{p.name}</SelectItem>
-                      ))}
-                    </SelectContent>
-                  </Select>
-                </div>
-                <div className="grid grid-cols-4 items-center gap-4">
-                  <Label className="text-right">Quantity</Label>
-                  <Input 
-                    type="number" 
-                    value={testOrderData.quantity}
-                    onChange={(e) => setTestOrderData({...testOrderData, quantity: e.target.value})}
-                    className="col-span-3"
-                  />
-                </div>
-                <div className="grid grid-cols-4 items-center gap-4">
-                  <Label className="text-right">Date</Label>
-                  <Input 
-                    type="date" 
-                    value={testOrderData.date}
-                    onChange={(e) => setTestOrderData({...testOrderData, date: e.target.value})}
-                    className="col-span-3"
-                  />
-                </div>
-                <div className="grid grid-cols-4 items-center gap-4">
-                  <Label className="text-right">Batch #</Label>
-                  <Input 
-                    value={testOrderData.batch_number}
-                    onChange={(e) => setTestOrderData({...testOrderData, batch_number: e.target.value})}
-                    className="col-span-3"
-                    placeholder="Optional (Auto-generated)"
-                  />
-                </div>
-                <div className="grid grid-cols-4 items-center gap-4">
-                  <Label className="text-right">Expires</Label>
-                  <Input 
-                    type="date" 
-                    value={testOrderData.expiration_date}
-                    onChange={(e) => setTestOrderData({...testOrderData, expiration_date: e.target.value})}
-                    className="col-span-3"
-                  />
+          <div className="flex items-center gap-2">
+            <BulkReorderDialog onSuccess={() => { if (!live) fetchData() }} />
+
+            <Dialog open={isTestDialogOpen} onOpenChange={setIsTestDialogOpen}>
+              <DialogTrigger asChild>
+                <Button variant="outline">
+                  <Plus className="h-4 w-4 mr-2" />
+                  Add Past Order (Test)
+                </Button>
+              </DialogTrigger>
+              <DialogContent>
+                <DialogHeader>
+                  <DialogTitle>Create Past Order Record</DialogTitle>
+                  <DialogDescription>
+                    Simulate a received order for testing history.
+                  </DialogDescription>
+                </DialogHeader>
+                <div className="grid gap-4 py-4">
+                  <div className="grid grid-cols-4 items-center gap-4">
+                    <Label className="text-right">Product</Label>
+                    <Select 
+                      value={testOrderData.product_id} 
+                      onValueChange={(val) => setTestOrderData({...testOrderData, product_id: val})}
+                    >
+                      <SelectTrigger className="col-span-3">
+                        <SelectValue placeholder="Select product" />
+                      </SelectTrigger>
+                      <SelectContent>
+                        {products.map(p => (
+                          <SelectItem key={p.id} value={p.id.toString()}>{p.name}</SelectItem>
+                        ))}
+                      </SelectContent>
+                    </Select>
+                  </div>
+                  <div className="grid grid-cols-4 items-center gap-4">
+                    <Label className="text-right">Quantity</Label>
+                    <Input 
+                      type="number" 
+                      value={testOrderData.quantity}
+                      onChange={(e) => setTestOrderData({...testOrderData, quantity: e.target.value})}
+                      className="col-span-3"
+                    />
+                  </div>
+                  <div className="grid grid-cols-4 items-center gap-4">
+                    <Label className="text-right">Date</Label>
+                    <Input 
+                      type="date" 
+                      value={testOrderData.date}
+                      onChange={(e) => setTestOrderData({...testOrderData, date: e.target.value})}
+                      className="col-span-3"
+                    />
+                  </div>
+                  <div className="grid grid-cols-4 items-center gap-4">
+                    <Label className="text-right">Batch #</Label>
+                    <Input 
+                      value={testOrderData.batch_number}
+                      onChange={(e) => setTestOrderData({...testOrderData, batch_number: e.target.value})}
+                      className="col-span-3"
+                      placeholder="Optional (Auto-generated)"
+                    />
+                  </div>
+                  <div className="grid grid-cols-4 items-center gap-4">
+                    <Label className="text-right">Expires</Label>
+                    <Input 
+                      type="date" 
+                      value={testOrderData.expiration_date}
+                      onChange={(e) => setTestOrderData({...testOrderData, expiration_date: e.target.value})}
+                      className="col-span-3"
+                    />
+                  </div>
                 </div>
-              </div>
-              <DialogFooter>
-                <Button onClick={handleCreateTestOrder}>Create Record</Button>
-              </DialogFooter>
-            </DialogContent>
-          </Dialog>
+                <DialogFooter>
+                  <Button onClick={handleCreateTestOrder}>Create Record</Button>
+                </DialogFooter>
+              </DialogContent>
+            </Dialog>
+          </div>
         </div>
 
         <div className="grid grid-cols-1 gap-6">
@@ -362,7 +404,12 @@ export default function OrdersPage() {
               </CardContent>
             </Card>
 
-            <StockAlerts products={lowStockProducts} />
+            <StockAlerts
+              products={lowStockProducts}
+              summary={alertSummary}
+              hasMore={stockHasMore}
+              onLoadMore={loadMoreStockAlerts}
+            />
         </div>
       </main>
     </div>
@@ -9,24 +9,45 @@ import { StockAlerts } from "@/components/stock/stock-alerts"
 import { ExpirationAlerts } from "@/components/expiration/expiration-alerts"
 import { Tabs, TabsContent, TabsList, TabsTrigger } from "@/components/ui/tabs"
 import { authService } from "@/lib/auth-service"
-import { apiService } from "@/lib/api-service"
+import { apiService, DEFAULT_PAGE_SIZE } from "@/lib/api-service"
+import { applyStockEventToState, useInventoryEvents, type StockAlertState } from "@/lib/inventory-events"
+import {
+  EXPIRING_SOON_DAYS,
+  appendAlertPage,
+  computeExpirationAlerts,
+  computeStockAlerts,
+  summarizeAlerts,
+  toAlertSummary,
+  toExpirationAlert,
+  toStockAlert,
+  type ExpirationAlert,
+} from "@/lib/inventory-alerts"
 
 export default function ProductsPage() {
   const router = useRouter()
   const [user, setUser] = useState<any>(null)
   const [loading, setLoading] = useState(true)
   const [error, setError] = useState<string | null>(null)
-  const [products, setProducts] = useState<any[]>([])
+  // Products, stock alerts and alert totals move together on live stock events
+  const [inventory, setInventory] = useState<StockAlertState<any>>({ products: [], alerts: [], hasMore: false })
+  const { products, alerts: lowStockProducts, summary: alertSummary, hasMore: stockHasMore } = inventory
   const [activeTab, setActiveTab] = useState("list")
   const [editingProduct, setEditingProduct] = useState<any>(null)
+  const [expiringProducts, setExpiringProducts] = useState<ExpirationAlert[]>([])
+  const [expirationHasMore, setExpirationHasMore] = useState(false)
 
   const fetchProducts = async () => {
     try {
       console.log("Fetching products from API...");
-      const productsData = await apiService.getProducts()
+      const [productsData, stockFeed, expirationFeed, summary] = await Promise.all([
+        apiService.getProducts(),
+        apiService.getStockAlerts().catch(() => null),
+        apiService.getExpirationAlerts({ within_days: EXPIRING_SOON_DAYS }).catch(() => null),
+        apiService.getAlertSummary({ within_days: EXPIRING_SOON_DAYS }).catch(() => null)
+      ])
       console.log("Raw products data:", productsData);
       
-      setProducts(productsData.map((p: any) => ({
+      const mappedProducts = productsData.map((p: any) => ({
         id: p.id.toString(),
         name: p.name,
         barcode: p.barcode || "N/A",
@@ -38,13 +59,60 @@ export default function ProductsPage() {
         expiration_date: p.next_expiration_date || p.validity, // Use next batch expiration if available
         next_batch_number: p.next_batch_number,
         min_stock_level: p.min_stock_level || 10
-      })))
+      }))
+
+      // Alerts come from the paged feed with totals from the summary; scan the
+      // whole catalog only if either is unavailable
+      if (stockFeed && expirationFeed && summary) {
+        setInventory({
+          products: mappedProducts,
+          alerts: stockFeed.map(toStockAlert),
+          summary: toAlertSummary(summary),
+          hasMore: stockFeed.length === DEFAULT_PAGE_SIZE,
+        })
+        setExpiringProducts(expirationFeed.map(toExpirationAlert))
+        setExpirationHasMore(expirationFeed.length === DEFAULT_PAGE_SIZE)
+      } else {
+        const stockAlerts = computeStockAlerts(mappedProducts)
+        const expirationAlerts = computeExpirationAlerts(mappedProducts, EXPIRING_SOON_DAYS)
+        setInventory({
+          products: mappedProducts,
+          alerts: stockAlerts,
+          summary: summarizeAlerts(stockAlerts, expirationAlerts),
+          hasMore: false,
+        })
+        setExpiringProducts(expirationAlerts)
+        setExpirationHasMore(false)
+      }
     } catch (error: any) {
       console.error("Failed to fetch data", error)
       setError(error.message || "An error occurred while fetching data")
     }
   }
 
+  const loadMoreStockAlerts = async () => {
+    try {
+      const page = await apiService.getStockAlerts({ skip: lowStockProducts.length })
+      setInventory((prev) => ({
+        ...prev,
+        alerts: appendAlertPage(prev.alerts, page.map(toStockAlert)),
+        hasMore: page.length === DEFAULT_PAGE_SIZE,
+      }))
+    } catch (error) {
+      console.error("Failed to load stock alerts", error)
+    }
+  }
+
+  const loadMoreExpirationAlerts = async () => {
+    try {
+      const page = await apiService.getExpirationAlerts({ within_days: EXPIRING_SOON_DAYS, skip: expiringProducts.length })
+      setExpiringProducts((prev) => appendAlertPage(prev, page.map(toExpirationAlert)))
+      setExpirationHasMore(page.length === DEFAULT_PAGE_SIZE)
+    } catch (error) {
+      console.error("Failed to load expiration alerts", error)
+    }
+  }
+
   const handleEditProduct = (product: any) => {
     setEditingProduct(product)
     setActiveTab("register")
@@ -77,6 +145,23 @@ export default function ProductsPage() {
     fetchData()
   }, [router])
 
+  useInventoryEvents((event) => {
+    if (event.type === "stock") {
+      setInventory((prev) => applyStockEventToState(prev, event))
+    } else if (event.type === "batch") {
+      // A received batch can become the next one to expire
+      setInventory((prev) => ({
+        ...prev,
+        products: prev.products.map((p) => {
+          if (p.id !== event.product_id) return p
+          const current = p.expiration_date ? new Date(p.expiration_date).getTime() : Infinity
+          if (new Date(event.batch.expiration_date).getTime() >= current) return p
+          return { ...p, expiration_date: event.batch.expiration_date, next_batch_number: event.batch.batch_number }
+        }),
+      }))
+    }
+  })
+
   if (loading) {
     return <div>Loading...</div>
   }
@@ -145,34 +230,6 @@ export default function ProductsPage() {
     { id: "sup3", name: "Global Health Logistics" }
   ]
   
-  const lowStockProducts = products
-    .filter(p => p.stock_quantity <= p.min_stock_level)
-    .map(p => ({
-      product_id: p.id,
-      product_name: p.name,
-      current_stock: p.stock_quantity,
-      min_stock_level: p.min_stock_level
-    }))
-  
-  const expiringProducts = products
-    .filter(p => {
-      const expDate = new Date(p.expiration_date)
-      const today = new Date()
-      const daysUntilExpiration = Math.ceil((expDate.getTime() - today.getTime()) / (1000 * 60 * 60 * 24))
-      return daysUntilExpiration <= 30
-    })
-    .map(p => {
-      const expDate = new Date(p.expiration_date)
-      const today = new Date()
-      const daysUntilExpiration = Math.ceil((expDate.getTime() - today.getTime()) / (1000 * 60 * 60 * 24))
-      return {
-        product_id: p.id,
-        product_name: p.name,
-        expiration_date: p.expiration_date,
-        days_until_expiration: daysUntilExpiration
-      }
-    })
-
   const canManageProducts = user && ['owner', 'admin', 'manager', 'pharmacist'].includes(user.role);
 
   return (
@@ -229,11 +286,23 @@ export default function ProductsPage() {
           )}
 
           <TabsContent value="stock-alerts" className="space-y-6">
-            <StockAlerts products={lowStockProducts} canManage={canManageProducts} />
+            <StockAlerts
+              products={lowStockProducts}
+              canManage={canManageProducts}
+              summary={alertSummary}
+              hasMore={stockHasMore}
+              onLoadMore={loadMoreStockAlerts}
+            />
           </TabsContent>
 
           <TabsContent value="expiration" className="space-y-6">
-            <ExpirationAlerts products={expiringProducts} canManage={canManageProducts} />
+            <ExpirationAlerts
+              products={expiringProducts}
+              canManage={canManageProducts}
+              summary={alertSummary}
+              hasMore={expirationHasMore}
+              onLoadMore={loadMoreExpirationAlerts}
+            />
           </TabsContent>
         </Tabs>
       </main>
@@ -6,6 +6,7 @@ import { DashboardHeader } from "@/components/dashboard/dashboard-header"
 import { SalesInterface } from "@/components/sales/sales-interface"
 import { authService } from "@/lib/auth-service"
 import { apiService } from "@/lib/api-service"
+import { applyStockEvent, useInventoryEvents } from "@/lib/inventory-events"
 
 import { Button } from "@/components/ui/button"
 import { ArrowLeft } from "lucide-react"
@@ -15,7 +16,6 @@ export default function NewSalePage() {
   const router = useRouter()
   const [user, setUser] = useState<any>(null)
   const [products, setProducts] = useState<any[]>([])
-  const [clients, setClients] = useState<any[]>([])
   const [loading, setLoading] = useState(true)
 
   const loadData = async () => {
@@ -31,11 +31,8 @@ export default function NewSalePage() {
           setUser(userData)
       }
 
-      // Fetch products and clients from Python Backend
-      const [productsData, clientsData] = await Promise.all([
-        apiService.getProducts(),
-        apiService.getClients()
-      ])
+      // Clients are looked up on demand by the ClientPicker, not preloaded
+      const productsData = await apiService.getProducts()
 
       // Map backend data to frontend interfaces
       const mappedProducts = productsData.map((p: any) => ({
@@ -49,17 +46,7 @@ export default function NewSalePage() {
         max_quantity_per_sale: null // Backend doesn't seem to have this yet
       }))
 
-      const mappedClients = clientsData
-        .filter((c: any) => c.role_name === 'client')
-        .map((c: any) => ({
-          id: c.id.toString(),
-          name: c.name,
-          cpf: c.cpf || "000.000.000-00", // Backend might not have CPF on User model yet
-          client_type: "standard" // Default
-        }))
-
       setProducts(mappedProducts)
-      setClients(mappedClients)
     } catch (error) {
       console.error("Failed to fetch data:", error)
     } finally {
@@ -71,6 +58,13 @@ export default function NewSalePage() {
     loadData()
   }, [router])
 
+  // Sales on other registers update stock in place instead of reloading the catalog
+  const live = useInventoryEvents((event) => {
+    if (event.type === "stock") {
+      setProducts((prev) => applyStockEvent(prev, event))
+    }
+  })
+
   if (loading) {
     return <div className="flex items-center justify-center min-h-screen">Loading...</div>
   }
@@ -102,11 +96,12 @@ export default function NewSalePage() {
 
         <SalesInterface
           products={products}
-          clients={clients}
           paymentMethods={paymentMethods}
           sellerId={user?.id?.toString() || "1"}
           sellerName={user?.name || user?.full_name || "Unknown Seller"}
-          onSaleComplete={loadData}
+          onSaleComplete={() => {
+            if (!live) loadData()
+          }}
         />
       </main>
     </div>
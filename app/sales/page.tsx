@@ -4,6 +4,7 @@ import { useEffect, useState } from "react"
 import { useRouter } from "next/navigation"
 import { DashboardHeader } from "@/components/dashboard/dashboard-header"
 import { SalesList } from "@/components/sales/sales-list"
+import { SalesReportExport } from "@/components/sales/sales-report"
 import { Button } from "@/components/ui/button"
 import { Plus } from "lucide-react"
 import Link from "next/link"
@@ -29,9 +30,10 @@ export default function SalesPage() {
         userData.role = userData.role || 'staff';
         setUser(userData)
 
+        // Only staff are needed to resolve seller names; clients come embedded in each order
         const [ordersData, usersData] = await Promise.all([
           apiService.getOrders(),
-          apiService.getClients()
+          apiService.getStaff()
         ])
         
         const mappedSales = ordersData.map((order: any) => {
@@ -102,7 +104,10 @@ export default function SalesPage() {
           </Button>
         </div>
 
-        <SalesList sales={sales} />
+        <div className="space-y-6">
+          <SalesReportExport />
+          <SalesList sales={sales} />
+        </div>
       </main>
     </div>
   )
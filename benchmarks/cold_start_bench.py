@@ -0,0 +1,179 @@
+"""Cold-start benchmark for the standalone Next.js build.
+
+For every route and run it starts a fresh `node server.js` from
+.next/standalone (the same thing the Dockerfile runs), then loads the route in
+headless Chrome and records:
+
+  ready  time from spawn until the server answers /api/health with 200
+  ttfb   navigation responseStart, first hit on the cold process
+  tti    first quiet window of 2s with no long tasks after DOMContentLoaded
+
+The same route is then loaded a second time on the same process for the warm
+numbers. Use --warmup to start through server-warmup.js instead and compare.
+
+Usage:
+  npm run build
+  python benchmarks/cold_start_bench.py
+  python benchmarks/cold_start_bench.py --warmup --runs 5 --routes /auth/login,/sales/new
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "selenium_tests"))
+from driver_pool import resolve_driver_path  # noqa: E402
+
+STANDALONE = os.path.join(ROOT, ".next", "standalone")
+QUIET_WINDOW_MS = 2000
+TTI_TIMEOUT_S = 30
+
+# Registered before any page script runs, so early long tasks are not missed
+LONG_TASK_OBSERVER_JS = """
+window.__longTasks = [];
+new PerformanceObserver((list) => {
+  for (const entry of list.getEntries()) window.__longTasks.push(entry.startTime + entry.duration);
+}).observe({ type: 'longtask', buffered: true });
+"""
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Cold-start TTFB / TTI benchmark for the standalone build")
+    parser.add_argument("--routes", default="/auth/login,/dashboard,/sales/new,/sales,/orders,/products")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--port", type=int, default=3100)
+    parser.add_argument("--warmup", action="store_true", help="start through server-warmup.js")
+    parser.add_argument("--token", default=os.environ.get("BENCH_TOKEN", "bench"),
+                        help="value for the token cookie, so protected routes are not redirected")
+    parser.add_argument("--out", help="write raw results as JSON")
+    return parser.parse_args()
+
+
+def prepare_standalone():
+    """Lays out .next/standalone the way the Dockerfile does."""
+    if not os.path.exists(os.path.join(STANDALONE, "server.js")):
+        sys.exit("No standalone build found; run `npm run build` first.")
+    shutil.copytree(os.path.join(ROOT, ".next", "static"), os.path.join(STANDALONE, ".next", "static"), dirs_exist_ok=True)
+    if os.path.isdir(os.path.join(ROOT, "public")):
+        shutil.copytree(os.path.join(ROOT, "public"), os.path.join(STANDALONE, "public"), dirs_exist_ok=True)
+    shutil.copy(os.path.join(ROOT, "server-warmup.js"), STANDALONE)
+
+
+def start_server(port, warmup):
+    env = {**os.environ, "NODE_ENV": "production", "PORT": str(port), "HOSTNAME": "127.0.0.1"}
+    if not warmup:
+        env["WARMUP_ROUTES"] = ""
+    entry = "server-warmup.js" if warmup else "server.js"
+    started = time.perf_counter()
+    process = subprocess.Popen(["node", entry], cwd=STANDALONE, env=env,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    deadline = started + 120
+    while time.perf_counter() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/api/health", timeout=1) as response:
+                if response.status == 200:
+                    return process, (time.perf_counter() - started) * 1000
+        except (urllib.error.URLError, ConnectionError, TimeoutError):
+            pass
+        time.sleep(0.05)
+    process.kill()
+    raise RuntimeError("Server did not become ready within 120s")
+
+
+def measure(driver, url):
+    """Loads url with an empty browser cache; returns (ttfb_ms, tti_ms)."""
+    driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+    driver.get(url)
+
+    deadline = time.time() + TTI_TIMEOUT_S
+    while True:
+        timing = driver.execute_script("""
+            const nav = performance.getEntriesByType('navigation')[0];
+            return {
+              ttfb: nav.responseStart,
+              dcl: nav.domContentLoadedEventEnd,
+              last_long_task: Math.max(0, ...(window.__longTasks || [])),
+              now: performance.now(),
+              complete: document.readyState === 'complete',
+            };
+        """)
+        interactive_from = max(timing["dcl"], timing["last_long_task"])
+        if timing["complete"] and timing["now"] - interactive_from >= QUIET_WINDOW_MS:
+            return timing["ttfb"], interactive_from
+        if time.time() > deadline:
+            return timing["ttfb"], None
+        time.sleep(0.1)
+
+
+def median(values):
+    values = [v for v in values if v is not None]
+    return statistics.median(values) if values else None
+
+
+def fmt(value):
+    return f"{value:8.0f}" if value is not None else "       -"
+
+
+def main():
+    args = parse_args()
+    routes = [route.strip() for route in args.routes.split(",") if route.strip()]
+    prepare_standalone()
+
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    driver = webdriver.Chrome(service=Service(resolve_driver_path()), options=options)
+    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": LONG_TASK_OBSERVER_JS})
+
+    base = f"http://127.0.0.1:{args.port}"
+    results = {route: [] for route in routes}
+    try:
+        for route in routes:
+            for run in range(args.runs):
+                process, ready_ms = start_server(args.port, args.warmup)
+                try:
+                    driver.get(f"{base}/api/health")
+                    driver.add_cookie({"name": "token", "value": args.token})
+                    cold_ttfb, cold_tti = measure(driver, base + route)
+                    warm_ttfb, warm_tti = measure(driver, base + route)
+                finally:
+                    process.kill()
+                    process.wait()
+                results[route].append({
+                    "ready": ready_ms,
+                    "cold_ttfb": cold_ttfb,
+                    "cold_tti": cold_tti,
+                    "warm_ttfb": warm_ttfb,
+                    "warm_tti": warm_tti,
+                })
+                print(f"   {route} run {run + 1}: ready {ready_ms:.0f}ms, cold TTFB {fmt(cold_ttfb).strip()}ms")
+    finally:
+        driver.quit()
+
+    mode = "server-warmup.js" if args.warmup else "server.js"
+    print(f"\nMedian over {args.runs} cold starts of {mode} (ms)")
+    print(f"{'route':<16}{'ready':>8}{'TTFB':>8}{'TTI':>8}{'warm TTFB':>11}{'warm TTI':>10}")
+    for route, runs in results.items():
+        print(f"{route:<16}{fmt(median([r['ready'] for r in runs]))}"
+              f"{fmt(median([r['cold_ttfb'] for r in runs]))}"
+              f"{fmt(median([r['cold_tti'] for r in runs]))}"
+              f"   {fmt(median([r['warm_ttfb'] for r in runs]))}"
+              f"  {fmt(median([r['warm_tti'] for r in runs]))}")
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump({"mode": mode, "runs": args.runs, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
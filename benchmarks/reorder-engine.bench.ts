@@ -0,0 +1,72 @@
+// Benchmark for the bulk reorder engine on a synthetic catalog.
+//
+// Usage:
+//   npm run bench:reorder
+//   npm run bench:reorder -- --products 500000 --suppliers 200 --sales 5000000 --runs 7
+
+import { aggregateUnitsSold, computeReorderPlan, DEFAULT_REORDER_OPTIONS } from "../lib/reorder-engine"
+
+function arg(name: string, fallback: number) {
+  const index = process.argv.indexOf(`--${name}`)
+  return index !== -1 ? Number(process.argv[index + 1]) : fallback
+}
+
+const PRODUCTS = arg("products", 200000)
+const SUPPLIERS = arg("suppliers", 100)
+const SALE_LINES = arg("sales", 2000000)
+const RUNS = arg("runs", 5)
+
+// Deterministic PRNG so runs are comparable between commits
+let seed = 42
+function random() {
+  seed = (seed * 1664525 + 1013904223) % 4294967296
+  return seed / 4294967296
+}
+
+function median(values: number[]) {
+  const sorted = [...values].sort((a, b) => a - b)
+  return sorted[Math.floor(sorted.length / 2)]
+}
+
+const products = Array.from({ length: PRODUCTS }, (_, i) => ({
+  id: i + 1,
+  name: `Product ${i + 1}`,
+  stock_quantity: Math.floor(random() * 200),
+  min_stock_level: 5 + Math.floor(random() * 20),
+  supplier_id: 1 + Math.floor(random() * SUPPLIERS),
+}))
+
+// Orders of ~4 lines spread over the last 60 days
+const now = Date.now()
+const orders: any[] = []
+for (let line = 0; line < SALE_LINES; line += 4) {
+  orders.push({
+    created_at: new Date(now - random() * 60 * 24 * 60 * 60 * 1000).toISOString(),
+    items: Array.from({ length: 4 }, () => ({
+      product_id: 1 + Math.floor(random() * PRODUCTS),
+      quantity: 1 + Math.floor(random() * 3),
+    })),
+  })
+}
+
+console.log(`Catalog: ${PRODUCTS} products, ${SUPPLIERS} suppliers, ${orders.length * 4} sale lines`)
+
+const since = new Date(now - DEFAULT_REORDER_OPTIONS.velocityDays * 24 * 60 * 60 * 1000)
+const aggregateTimes: number[] = []
+const planTimes: number[] = []
+let plan = computeReorderPlan([], new Map())
+
+for (let run = 0; run < RUNS; run++) {
+  let start = performance.now()
+  const unitsSold = aggregateUnitsSold(orders, since)
+  aggregateTimes.push(performance.now() - start)
+
+  start = performance.now()
+  plan = computeReorderPlan(products, unitsSold)
+  planTimes.push(performance.now() - start)
+}
+
+const lines = plan.reduce((sum, group) => sum + group.lines.length, 0)
+console.log(`Plan: ${plan.length} supplier orders, ${lines} lines`)
+console.log(`aggregateUnitsSold  median ${median(aggregateTimes).toFixed(1)} ms over ${RUNS} runs`)
+console.log(`computeReorderPlan  median ${median(planTimes).toFixed(1)} ms over ${RUNS} runs`)
@@ -0,0 +1,122 @@
+// Throughput benchmark for the streaming sales report export.
+//
+// In-process mode drives createReportStream with a synthetic keyset page
+// source, so it measures encoding and streaming cost and shows that memory
+// stays flat as the row count grows; it says nothing about the database.
+// With --url it reads a running export end to end (route handler + backend
+// /orders/report), which is the number to quote for real throughput.
+//
+// Usage:
+//   npm run bench:report
+//   npm run bench:report -- --items 5000000 --format ndjson --latency 5
+//   npm run bench:report -- --url "http://localhost:3000/api/reports/sales?from=...&to=..." --cookie "token=..."
+
+import { createReportStream, REPORT_COLUMNS, REPORT_PAGE_SIZE, type ReportFormat, type ReportRow } from "../lib/sales-report"
+
+function arg(name: string, fallback: number) {
+  const index = process.argv.indexOf(`--${name}`)
+  return index !== -1 ? Number(process.argv[index + 1]) : fallback
+}
+
+function stringArg(name: string, fallback: string) {
+  const index = process.argv.indexOf(`--${name}`)
+  return index !== -1 ? process.argv[index + 1] : fallback
+}
+
+const ITEMS = arg("items", 2000000)
+const PAGE_SIZE = arg("page-size", REPORT_PAGE_SIZE)
+const LATENCY_MS = arg("latency", 0) // Simulated database round trip per page
+const FORMAT = stringArg("format", "csv") as ReportFormat
+const URL_ARG = stringArg("url", "")
+const COOKIE = stringArg("cookie", "")
+
+// Deterministic PRNG so runs are comparable between commits
+let seed = 42
+function random() {
+  seed = (seed * 1664525 + 1013904223) % 4294967296
+  return seed / 4294967296
+}
+
+const start = Date.parse("2025-01-01T00:00:00Z")
+const ITEMS_PER_SALE = 4
+
+// Generates the page after `cursor` the way sales_report_lines would return it
+async function syntheticPage(cursor: ReportRow | null, limit: number): Promise<ReportRow[]> {
+  const offset = cursor ? cursor.__index + 1 : 0
+  const end = Math.min(offset + limit, ITEMS)
+  const rows: ReportRow[] = []
+  for (let i = offset; i < end; i++) {
+    const sale = Math.floor(i / ITEMS_PER_SALE)
+    const quantity = 1 + Math.floor(random() * 3)
+    const unitPrice = Math.round(random() * 10000) / 100
+    rows.push({
+      __index: i,
+      sale_date: new Date(start + sale * 15000).toISOString(),
+      invoice_number: String(sale).padStart(8, "0"),
+      sale_id: `00000000-0000-4000-8000-${String(sale).padStart(12, "0")}`,
+      item_id: `00000000-0000-4000-9000-${String(i).padStart(12, "0")}`,
+      product_name: `Product ${i % 5000}, 500mg`,
+      barcode: String(7890000000000 + (i % 5000)),
+      quantity,
+      unit_price: unitPrice,
+      discount_applied: 0,
+      total_price: Math.round(quantity * unitPrice * 100) / 100,
+      client_name: sale % 3 === 0 ? null : `Client ${sale % 20000}`,
+      client_cpf: sale % 3 === 0 ? null : String(10000000000 + (sale % 20000)),
+      seller_name: `Seller ${sale % 25}`,
+      payment_method: sale % 2 === 0 ? "Cash" : "Card",
+    })
+  }
+  if (LATENCY_MS > 0) await new Promise((resolve) => setTimeout(resolve, LATENCY_MS))
+  return rows
+}
+
+async function drain(stream: ReadableStream<Uint8Array>) {
+  const reader = stream.getReader()
+  let bytes = 0
+  let lines = 0
+  let peakHeap = 0
+  let peakRss = 0
+  let chunks = 0
+  while (true) {
+    const { done, value } = await reader.read()
+    if (done) break
+    bytes += value.length
+    for (let i = 0; i < value.length; i++) {
+      if (value[i] === 10) lines++
+    }
+    if (++chunks % 10 === 0) {
+      const memory = process.memoryUsage()
+      peakHeap = Math.max(peakHeap, memory.heapUsed)
+      peakRss = Math.max(peakRss, memory.rss)
+    }
+  }
+  return { bytes, lines, peakHeap, peakRss }
+}
+
+async function main() {
+  let stream: ReadableStream<Uint8Array>
+  if (URL_ARG) {
+    console.log(`Reading ${URL_ARG}`)
+    const response = await fetch(URL_ARG, { headers: COOKIE ? { cookie: COOKIE } : {} })
+    if (!response.ok || !response.body) throw new Error(`Export failed with ${response.status}`)
+    stream = response.body
+  } else {
+    console.log(`Synthetic export: ${ITEMS} sale_items, ${FORMAT}, pages of ${PAGE_SIZE}, ${LATENCY_MS}ms per page`)
+    stream = createReportStream({ fetchPage: syntheticPage, columns: REPORT_COLUMNS.lines, format: FORMAT, pageSize: PAGE_SIZE })
+  }
+
+  const baseline = process.memoryUsage()
+  const started = performance.now()
+  const result = await drain(stream)
+  const seconds = (performance.now() - started) / 1000
+
+  const rows = FORMAT === "csv" && !URL_ARG ? result.lines - 1 : result.lines
+  console.log(`Rows:        ${rows.toLocaleString()} in ${seconds.toFixed(2)} s`)
+  console.log(`Throughput:  ${Math.round(rows / seconds).toLocaleString()} rows/s, ${(result.bytes / 1048576 / seconds).toFixed(1)} MB/s`)
+  console.log(`Output:      ${(result.bytes / 1048576).toFixed(1)} MB`)
+  console.log(`Peak heap:   ${(result.peakHeap / 1048576).toFixed(1)} MB (baseline ${(baseline.heapUsed / 1048576).toFixed(1)} MB)`)
+  console.log(`Peak RSS:    ${(result.peakRss / 1048576).toFixed(1)} MB`)
+}
+
+main()
@@ -0,0 +1,115 @@
+// Per-route bundle-size report for the App Router build, run after every
+// `next build` (npm "postbuild").
+//
+// For each page it collects the JS and CSS a first visit downloads (root main
+// files plus every layout/loading/template/page chunk on the route's path),
+// gzips them to approximate transfer size and compares the totals with the
+// budgets in bundle-budgets.json. Chunks loaded through next/dynamic are not
+// counted, which is the point: they stay off the route until used.
+//
+// Only warns by default: the budgets in bundle-budgets.json are estimates until
+// they are replaced with sizes from a real build. Set BUNDLE_BUDGET_ENFORCE=1
+// (e.g. in CI once the numbers are measured) to exit 1 when a route is over.
+// The full report is written to .next/bundle-report.json for diffing.
+
+const fs = require('fs');
+const path = require('path');
+const zlib = require('zlib');
+
+const NEXT_DIR = path.join(__dirname, '.next');
+const SEGMENT_FILES = ['layout', 'template', 'loading', 'page'];
+
+function readJson(file) {
+  return JSON.parse(fs.readFileSync(file, 'utf8'));
+}
+
+const sizeCache = new Map();
+function gzipSize(file) {
+  if (!sizeCache.has(file)) {
+    const content = fs.readFileSync(path.join(NEXT_DIR, file));
+    sizeCache.set(file, zlib.gzipSync(content, { level: 9 }).length);
+  }
+  return sizeCache.get(file);
+}
+
+function kb(bytes) {
+  return `${(bytes / 1024).toFixed(1)} kB`;
+}
+
+function routeEntries(route, entries) {
+  const segments = route === '/' ? [''] : ['', ...route.slice(1).split('/')];
+  const keys = [];
+  for (let i = 0; i < segments.length; i++) {
+    const prefix = segments.slice(1, i + 1).map((s) => `/${s}`).join('');
+    for (const name of SEGMENT_FILES) {
+      if (name === 'page' && i !== segments.length - 1) continue;
+      const key = `${prefix}/${name}`;
+      if (entries[key]) keys.push(key);
+    }
+  }
+  return keys;
+}
+
+function main() {
+  const appManifestPath = path.join(NEXT_DIR, 'app-build-manifest.json');
+  if (!fs.existsSync(appManifestPath)) {
+    console.error('No .next/app-build-manifest.json found; run `next build` first.');
+    process.exit(1);
+  }
+
+  const entries = readJson(appManifestPath).pages;
+  const rootMainFiles = readJson(path.join(NEXT_DIR, 'build-manifest.json')).rootMainFiles || [];
+  const budgets = readJson(path.join(__dirname, 'bundle-budgets.json'));
+
+  const routes = Object.keys(entries)
+    .filter((key) => key.endsWith('/page'))
+    .map((key) => key.slice(0, -'/page'.length) || '/')
+    .filter((route) => !route.startsWith('/_'))
+    .sort();
+
+  const report = [];
+  for (const route of routes) {
+    const files = new Set(rootMainFiles);
+    for (const key of routeEntries(route, entries)) {
+      for (const file of entries[key]) files.add(file);
+    }
+
+    let js = 0;
+    let css = 0;
+    for (const file of files) {
+      if (file.endsWith('.js')) js += gzipSize(file);
+      else if (file.endsWith('.css')) css += gzipSize(file);
+    }
+
+    const budget = { ...budgets.default, ...(budgets.routes[route] || {}) };
+    report.push({
+      route,
+      js,
+      css,
+      budget,
+      overJs: js > budget.js * 1024,
+      overCss: css > budget.css * 1024,
+    });
+  }
+
+  const width = Math.max(...report.map((r) => r.route.length), 5) + 2;
+  console.log('\nFirst-load transfer size per route (gzip)');
+  console.log(`${'Route'.padEnd(width)}${'JS'.padStart(12)}${'budget'.padStart(10)}${'CSS'.padStart(12)}${'budget'.padStart(10)}`);
+  for (const r of report) {
+    const flag = r.overJs || r.overCss ? '  OVER BUDGET' : '';
+    console.log(
+      `${r.route.padEnd(width)}${kb(r.js).padStart(12)}${`${r.budget.js} kB`.padStart(10)}` +
+        `${kb(r.css).padStart(12)}${`${r.budget.css} kB`.padStart(10)}${flag}`,
+    );
+  }
+
+  fs.writeFileSync(path.join(NEXT_DIR, 'bundle-report.json'), JSON.stringify(report, null, 2));
+
+  const over = report.filter((r) => r.overJs || r.overCss);
+  if (over.length > 0) {
+    console.error(`\n${over.length} route(s) over budget: ${over.map((r) => r.route).join(', ')}`);
+    if (process.env.BUNDLE_BUDGET_ENFORCE === '1') process.exit(1);
+  }
+}
+
+main();
@@ -1,6 +1,7 @@
 "use client"
 
-import { useState, useEffect } from "react"
+import { useState, useEffect, useRef } from "react"
+import dynamic from "next/dynamic"
 import { Button } from "@/components/ui/button"
 import { Input } from "@/components/ui/input"
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card"
@@ -17,7 +18,9 @@ import {
 import { Alert, AlertDescription } from "@/components/ui/alert"
 import { apiService } from "@/lib/api-service"
 import { Search, Edit, Trash2, AlertTriangle, Shield } from "lucide-react"
-import { ClientEditDialog } from "./client-edit-dialog"
+
+// Edit form is fetched the first time a client is edited
+const ClientEditDialog = dynamic(() => import("./client-edit-dialog").then((m) => m.ClientEditDialog), { ssr: false })
 
 interface Client {
   id: string
@@ -34,9 +37,12 @@ interface Client {
 
 interface ClientListProps {
   clients: Client[]
+  onSearch?: (term: string) => void
+  hasMore?: boolean
+  onLoadMore?: () => void
 }
 
-export function ClientList({ clients: initialClients }: ClientListProps) {
+export function ClientList({ clients: initialClients, onSearch, hasMore, onLoadMore }: ClientListProps) {
   const [clients, setClients] = useState(initialClients)
   const [searchTerm, setSearchTerm] = useState("")
   const [selectedClient, setSelectedClient] = useState<Client | null>(null)
@@ -48,7 +54,20 @@ export function ClientList({ clients: initialClients }: ClientListProps) {
     setClients(initialClients)
   }, [initialClients])
 
-  const filteredClients = clients.filter(
+  // Debounce server-side search so each keystroke doesn't hit the backend
+  const initialSearch = useRef(true)
+  useEffect(() => {
+    if (initialSearch.current) {
+      initialSearch.current = false
+      return
+    }
+    if (!onSearch) return
+    const timer = setTimeout(() => onSearch(searchTerm), 300)
+    return () => clearTimeout(timer)
+  }, [searchTerm])
+
+  // When searching server-side the page already holds only matching clients
+  const filteredClients = onSearch ? clients : clients.filter(
     (client) => {
       const searchLower = searchTerm.toLowerCase()
       const nameMatch = client.name && client.name.toLowerCase().includes(searchLower)
@@ -197,6 +216,14 @@ export function ClientList({ clients: initialClients }: ClientListProps) {
               ))
             )}
           </div>
+
+          {hasMore && onLoadMore && (
+            <div className="flex justify-center mt-6">
+              <Button variant="outline" onClick={onLoadMore}>
+                Load more
+              </Button>
+            </div>
+          )}
         </CardContent>
       </Card>
 
@@ -5,10 +5,13 @@ import { Badge } from "@/components/ui/badge"
 import { Button } from "@/components/ui/button"
 import { Alert, AlertDescription } from "@/components/ui/alert"
 import { Calendar, AlertTriangle, Trash2 } from "lucide-react"
+import { EXPIRING_SOON_DAYS, alertKey, type AlertSummary } from "@/lib/inventory-alerts"
 
 interface ExpiringProduct {
   product_id: string
   product_name: string
+  batch_id?: string
+  batch_number?: string
   expiration_date: string
   days_until_expiration: number
 }
@@ -16,11 +19,17 @@ interface ExpiringProduct {
 interface ExpirationAlertsProps {
   products: ExpiringProduct[]
   canManage?: boolean
+  // Totals for the headers when `products` is only the loaded feed pages
+  summary?: AlertSummary
+  hasMore?: boolean
+  onLoadMore?: () => void
 }
 
-export function ExpirationAlerts({ products, canManage = true }: ExpirationAlertsProps) {
+export function ExpirationAlerts({ products, canManage = true, summary, hasMore, onLoadMore }: ExpirationAlertsProps) {
   const expiredProducts = products.filter((p) => p.days_until_expiration <= 0)
-  const expiringSoonProducts = products.filter((p) => p.days_until_expiration > 0 && p.days_until_expiration <= 30)
+  const expiringSoonProducts = products.filter((p) => p.days_until_expiration > 0 && p.days_until_expiration <= EXPIRING_SOON_DAYS)
+  const expiredCount = summary?.expired ?? expiredProducts.length
+  const expiringSoonCount = summary?.expiring ?? expiringSoonProducts.length
 
   const formatDate = (dateString: string) => {
     return new Date(dateString).toLocaleDateString("pt-BR")
@@ -47,14 +56,14 @@ export function ExpirationAlerts({ products, canManage = true }: ExpirationAlert
             <Calendar className="h-5 w-5 text-orange-600" />
             Expiration Monitoring
           </CardTitle>
-          <CardDescription>Products expiring within 30 days or already expired</CardDescription>
+          <CardDescription>Products expiring within {EXPIRING_SOON_DAYS} days or already expired</CardDescription>
         </CardHeader>
         <CardContent>
-          {products.length === 0 ? (
+          {products.length === 0 && !hasMore ? (
             <div className="text-center py-8">
               <Calendar className="h-12 w-12 text-green-500 mx-auto mb-4" />
               <h3 className="text-lg font-semibold text-green-700 mb-2">No Expiration Concerns!</h3>
-              <p className="text-gray-600">No products are expiring within the next 30 days.</p>
+              <p className="text-gray-600">No products are expiring within the next {EXPIRING_SOON_DAYS} days.</p>
             </div>
           ) : (
             <div className="space-y-6">
@@ -63,7 +72,7 @@ export function ExpirationAlerts({ products, canManage = true }: ExpirationAlert
                 <div className="space-y-4">
                   <h3 className="text-lg font-semibold text-red-700 flex items-center gap-2">
                     <AlertTriangle className="h-5 w-5" />
-                    Expired Products ({expiredProducts.length})
+                    Expired Products ({expiredCount})
                   </h3>
                   <Alert className="border-red-200 bg-red-50">
                     <AlertTriangle className="h-4 w-4 text-red-600" />
@@ -74,11 +83,12 @@ export function ExpirationAlerts({ products, canManage = true }: ExpirationAlert
                   </Alert>
                   <div className="space-y-3">
                     {expiredProducts.map((product) => (
-                      <Card key={product.product_id} className="border-red-200 bg-red-50">
+                      <Card key={alertKey(product)} className="border-red-200 bg-red-50">
                         <CardContent className="p-4">
                           <div className="flex items-center justify-between">
                             <div>
                               <div className="font-semibold text-red-800">{product.product_name}</div>
+                              {product.batch_number && <div className="text-sm text-red-700">Batch {product.batch_number}</div>}
                               <div className="text-red-700">
                                 Expired on: {formatDate(product.expiration_date)}
                                 <Badge className="ml-2 bg-red-100 text-red-800">
@@ -105,15 +115,16 @@ export function ExpirationAlerts({ products, canManage = true }: ExpirationAlert
                 <div className="space-y-4">
                   <h3 className="text-lg font-semibold text-orange-700 flex items-center gap-2">
                     <Calendar className="h-5 w-5" />
-                    Expiring Soon ({expiringSoonProducts.length})
+                    Expiring Soon ({expiringSoonCount})
                   </h3>
                   <div className="space-y-3">
                     {expiringSoonProducts.map((product) => (
-                      <Card key={product.product_id} className="border-orange-200 bg-orange-50">
+                      <Card key={alertKey(product)} className="border-orange-200 bg-orange-50">
                         <CardContent className="p-4">
                           <div className="flex items-center justify-between">
                             <div>
                               <div className="font-semibold text-orange-800">{product.product_name}</div>
+                              {product.batch_number && <div className="text-sm text-orange-700">Batch {product.batch_number}</div>}
                               <div className="text-orange-700">
                                 Expires: {formatDate(product.expiration_date)}
                                 <Badge className={`ml-2 ${getDaysColor(product.days_until_expiration)}`}>
@@ -146,6 +157,14 @@ export function ExpirationAlerts({ products, canManage = true }: ExpirationAlert
                   </div>
                 </div>
               )}
+
+              {hasMore && onLoadMore && (
+                <div className="flex justify-center">
+                  <Button variant="outline" onClick={onLoadMore}>
+                    Load more
+                  </Button>
+                </div>
+              )}
             </div>
           )}
         </CardContent>
@@ -6,23 +6,28 @@ import { Button } from "@/components/ui/button"
 import { Alert, AlertDescription } from "@/components/ui/alert"
 import { Calendar, AlertTriangle, Clock, Eye } from "lucide-react"
 import Link from "next/link"
+import { alertKey, type AlertSummary } from "@/lib/inventory-alerts"
 
 interface ExpiringProduct {
   product_id: string
   product_name: string
+  batch_id?: string
   expiration_date: string
   days_until_expiration: number
 }
 
 interface ExpirationOverviewProps {
+  // Most urgent first; may be only the first feed page
   expiringProducts: ExpiringProduct[]
+  summary?: AlertSummary
 }
 
-export function ExpirationOverview({ expiringProducts }: ExpirationOverviewProps) {
-  const expiredProducts = expiringProducts.filter((p) => p.days_until_expiration <= 0)
-  const expiringSoonProducts = expiringProducts.filter(
-    (p) => p.days_until_expiration > 0 && p.days_until_expiration <= 7,
-  )
+export function ExpirationOverview({ expiringProducts, summary }: ExpirationOverviewProps) {
+  const expiredCount = summary?.expired ?? expiringProducts.filter((p) => p.days_until_expiration <= 0).length
+  const expiringSoonCount =
+    summary?.expiring_this_week ??
+    expiringProducts.filter((p) => p.days_until_expiration > 0 && p.days_until_expiration <= 7).length
+  const totalCount = summary ? summary.expired + summary.expiring : expiringProducts.length
 
   const getDaysText = (days: number) => {
     if (days <= 0) return "EXPIRED"
@@ -40,20 +45,20 @@ export function ExpirationOverview({ expiringProducts }: ExpirationOverviewProps
         <CardDescription>Products expiring soon</CardDescription>
       </CardHeader>
       <CardContent>
-        {expiringProducts.length === 0 ? (
+        {totalCount === 0 ? (
           <div className="text-center py-4">
             <Calendar className="h-8 w-8 text-green-500 mx-auto mb-2" />
             <p className="text-sm text-green-700 font-medium">No expiration concerns!</p>
           </div>
         ) : (
           <div className="space-y-4">
-            {expiredProducts.length > 0 && (
+            {expiredCount > 0 && (
               <Alert className="border-red-200 bg-red-50">
                 <AlertTriangle className="h-4 w-4 text-red-600" />
                 <AlertDescription className="text-red-800">
                   <div className="flex items-center justify-between">
                     <div>
-                      <strong>{expiredProducts.length} products expired</strong>
+                      <strong>{expiredCount} products expired</strong>
                       <div className="text-sm mt-1">Remove from sale immediately</div>
                     </div>
                     <Badge className="bg-red-100 text-red-800">Expired</Badge>
@@ -62,13 +67,13 @@ export function ExpirationOverview({ expiringProducts }: ExpirationOverviewProps
               </Alert>
             )}
 
-            {expiringSoonProducts.length > 0 && (
+            {expiringSoonCount > 0 && (
               <Alert className="border-orange-200 bg-orange-50">
                 <Clock className="h-4 w-4 text-orange-600" />
                 <AlertDescription className="text-orange-800">
                   <div className="flex items-center justify-between">
                     <div>
-                      <strong>{expiringSoonProducts.length} products expiring this week</strong>
+                      <strong>{expiringSoonCount} products expiring this week</strong>
                       <div className="text-sm mt-1">Consider discounting or returning</div>
                     </div>
                     <Badge className="bg-orange-100 text-orange-800">Expiring Soon</Badge>
@@ -80,7 +85,7 @@ export function ExpirationOverview({ expiringProducts }: ExpirationOverviewProps
             <div className="space-y-2">
               <h4 className="font-medium text-sm">Most Urgent:</h4>
               {expiringProducts.slice(0, 3).map((product) => (
-                <div key={product.product_id} className="flex items-center justify-between text-sm">
+                <div key={alertKey(product)} className="flex items-center justify-between text-sm">
                   <span className="truncate">{product.product_name}</span>
                   <Badge
                     className={
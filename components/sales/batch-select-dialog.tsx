@@ -0,0 +1,60 @@
+"use client"
+
+import { Badge } from "@/components/ui/badge"
+import {
+  Dialog,
+  DialogContent,
+  DialogDescription,
+  DialogHeader,
+  DialogTitle,
+} from "@/components/ui/dialog"
+
+export interface Batch {
+  id: string
+  batch_number: string
+  quantity: number
+  expiration_date: string
+}
+
+interface BatchSelectDialogProps {
+  open: boolean
+  onOpenChange: (open: boolean) => void
+  product: { name: string }
+  batches: Batch[]
+  onSelect: (batch: Batch) => void
+}
+
+// Loaded on demand by SalesInterface (next/dynamic), so the POS bundle does not carry it
+export function BatchSelectDialog({ open, onOpenChange, product, batches, onSelect }: BatchSelectDialogProps) {
+  return (
+    <Dialog open={open} onOpenChange={onOpenChange}>
+      <DialogContent className="max-w-md">
+        <DialogHeader>
+          <DialogTitle>Select Batch</DialogTitle>
+          <DialogDescription>
+            Select a specific batch for {product.name}
+          </DialogDescription>
+        </DialogHeader>
+        <div className="space-y-4">
+          {batches.length === 0 ? (
+            <div className="text-center py-4 text-gray-500">No batches available</div>
+          ) : (
+            batches.map((batch) => (
+              <div
+                key={batch.id}
+                className="flex items-center justify-between p-3 border rounded-lg hover:bg-gray-50 cursor-pointer"
+                onClick={() => onSelect(batch)}
+              >
+                <div>
+                  <div className="font-medium">Batch: {batch.batch_number}</div>
+                  <div className="text-sm text-gray-600">Expires: {new Date(batch.expiration_date).toLocaleDateString()}</div>
+                </div>
+                <Badge variant="outline">{batch.quantity} units</Badge>
+              </div>
+            ))
+          )}
+        </div>
+      </DialogContent>
+    </Dialog>
+  )
+}
@@ -0,0 +1,147 @@
+"use client"
+
+import { useState, useEffect, useRef } from "react"
+import { Button } from "@/components/ui/button"
+import { Input } from "@/components/ui/input"
+import { apiService } from "@/lib/api-service"
+import { ChevronDown, Search } from "lucide-react"
+
+export interface PickerClient {
+  id: string
+  name: string
+  cpf: string
+  client_type: string
+}
+
+interface ClientPickerProps {
+  value: PickerClient | null
+  onChange: (client: PickerClient | null) => void
+}
+
+const SEARCH_DEBOUNCE_MS = 250
+const MAX_RESULTS = 20
+
+export function ClientPicker({ value, onChange }: ClientPickerProps) {
+  const [open, setOpen] = useState(false)
+  const [query, setQuery] = useState("")
+  const [results, setResults] = useState<PickerClient[]>([])
+  const [loading, setLoading] = useState(false)
+  const containerRef = useRef<HTMLDivElement>(null)
+
+  // Only the top matches are fetched; the backend resolves CPF/name via its indexes
+  useEffect(() => {
+    if (!open) return
+
+    let cancelled = false
+    const timer = setTimeout(async () => {
+      setLoading(true)
+      try {
+        const data = await apiService.searchClients(query, MAX_RESULTS)
+        if (cancelled) return
+        // searchClients drops rows outside the role/search filter if the backend ignored it
+        setResults(
+          data
+            .map((c: any) => ({
+              id: c.id.toString(),
+              name: c.name,
+              cpf: c.cpf || "000.000.000-00",
+              client_type: c.client_type || "standard",
+            })),
+        )
+      } catch (error) {
+        console.error("Failed to search clients", error)
+        if (!cancelled) setResults([])
+      } finally {
+        if (!cancelled) setLoading(false)
+      }
+    }, SEARCH_DEBOUNCE_MS)
+
+    return () => {
+      cancelled = true
+      clearTimeout(timer)
+    }
+  }, [query, open])
+
+  useEffect(() => {
+    if (!open) return
+
+    const handleClickOutside = (e: MouseEvent) => {
+      if (containerRef.current && !containerRef.current.contains(e.target as Node)) {
+        setOpen(false)
+      }
+    }
+    document.addEventListener("mousedown", handleClickOutside)
+    return () => document.removeEventListener("mousedown", handleClickOutside)
+  }, [open])
+
+  const formatCPF = (cpf: string) => {
+    return cpf.replace(/(\d{3})(\d{3})(\d{3})(\d{2})/, "$1.$2.$3-$4")
+  }
+
+  const select = (client: PickerClient | null) => {
+    onChange(client)
+    setOpen(false)
+    setQuery("")
+  }
+
+  return (
+    <div ref={containerRef} className="relative">
+      <Button
+        type="button"
+        variant="outline"
+        role="combobox"
+        aria-expanded={open}
+        className="w-full justify-between font-normal"
+        onClick={() => setOpen(!open)}
+      >
+        <span className="truncate">{value ? value.name : "No client selected"}</span>
+        <ChevronDown className="h-4 w-4 opacity-50" />
+      </Button>
+
+      {open && (
+        <div className="absolute z-50 mt-1 w-full rounded-md border bg-white shadow-md">
+          <div className="flex items-center gap-2 border-b px-3 py-2">
+            <Search className="h-4 w-4 text-gray-400" />
+            <Input
+              autoFocus
+              placeholder="Search by name or CPF..."
+              value={query}
+              onChange={(e) => setQuery(e.target.value)}
+              className="h-8 border-0 p-0 shadow-none focus-visible:ring-0"
+            />
+          </div>
+          <div role="listbox" className="max-h-64 overflow-y-auto p-1">
+            <div
+              role="option"
+              aria-selected={!value}
+              className="cursor-pointer rounded-sm px-2 py-1.5 text-sm hover:bg-gray-100"
+              onClick={() => select(null)}
+            >
+              No client selected
+            </div>
+            {loading && results.length === 0 ? (
+              <div className="px-2 py-1.5 text-sm text-gray-500">Searching...</div>
+            ) : results.length === 0 ? (
+              <div className="px-2 py-1.5 text-sm text-gray-500">No clients found</div>
+            ) : (
+              results.map((client) => (
+                <div
+                  key={client.id}
+                  role="option"
+                  aria-selected={value?.id === client.id}
+                  className="cursor-pointer rounded-sm px-2 py-1.5 hover:bg-gray-100"
+                  onClick={() => select(client)}
+                >
+                  <div className="font-medium">{client.name}</div>
+                  <div className="text-sm text-gray-600">
+                    {formatCPF(client.cpf)} • {client.client_type}
+                  </div>
+                </div>
+              ))
+            )}
+          </div>
+        </div>
+      )}
+    </div>
+  )
+}
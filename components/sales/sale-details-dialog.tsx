@@ -0,0 +1,173 @@
+"use client"
+
+import { Badge } from "@/components/ui/badge"
+import {
+  Dialog,
+  DialogContent,
+  DialogDescription,
+  DialogHeader,
+  DialogTitle,
+} from "@/components/ui/dialog"
+import { Separator } from "@/components/ui/separator"
+import { Receipt } from "lucide-react"
+
+export interface Sale {
+  id: string
+  invoice_number: string
+  total_amount: number
+  discount_amount: number
+  final_amount: number
+  sale_date: string
+  prescription_required: boolean
+  clients?: {
+    name: string
+    cpf: string
+  }
+  profiles?: {
+    full_name: string
+  }
+  payment_methods?: {
+    name: string
+  }
+  sale_items: Array<{
+    quantity: number
+    unit_price: number
+    total_price: number
+    discount_applied: number
+    batch_number?: string
+    products: {
+      name: string
+      anvisa_label: string
+    }
+  }>
+}
+
+function formatCPF(cpf: string) {
+  return cpf.replace(/(\d{3})(\d{3})(\d{3})(\d{2})/, "$1.$2.$3-$4")
+}
+
+function getAnvisaLabelColor(label: string) {
+  switch (label) {
+    case "over-the-counter":
+      return "bg-green-100 text-green-800"
+    case "red-label":
+      return "bg-red-100 text-red-800"
+    case "black-label":
+      return "bg-gray-900 text-white"
+    default:
+      return "bg-gray-100 text-gray-800"
+  }
+}
+
+interface SaleDetailsDialogProps {
+  sale: Sale | null
+  open: boolean
+  onOpenChange: (open: boolean) => void
+}
+
+// Loaded on demand by SalesList (next/dynamic), so the dialog code stays out of the /sales bundle
+export function SaleDetailsDialog({ sale, open, onOpenChange }: SaleDetailsDialogProps) {
+  return (
+    <Dialog open={open} onOpenChange={onOpenChange}>
+      <DialogContent className="max-w-md">
+        {sale && (
+          <>
+            <DialogHeader>
+              <DialogTitle className="flex items-center gap-2">
+                <Receipt className="h-5 w-5" />
+                Sale Details
+              </DialogTitle>
+              <DialogDescription>#{sale.invoice_number}</DialogDescription>
+            </DialogHeader>
+
+            <div className="space-y-4">
+              <div className="text-center">
+                <h3 className="font-bold text-lg">PharmaCare</h3>
+                <p className="text-sm text-gray-600">Sale Receipt</p>
+                <p className="text-sm text-gray-600">#{sale.invoice_number}</p>
+              </div>
+
+              <Separator />
+
+              <div className="space-y-2">
+                <div className="text-sm">
+                  <strong>Date:</strong> {new Date(sale.sale_date).toLocaleString()}
+                </div>
+                <div className="text-sm">
+                  <strong>Client:</strong>{" "}
+                  {sale.clients
+                    ? `${sale.clients.name} (${formatCPF(sale.clients.cpf)})`
+                    : "Unspecified User"}
+                </div>
+                <div className="text-sm">
+                  <strong>Seller:</strong> {sale.profiles?.full_name || "Unknown"}
+                </div>
+                <div className="text-sm">
+                  <strong>Payment:</strong> {sale.payment_methods?.name || "Unknown"}
+                </div>
+              </div>
+
+              <Separator />
+
+              <div className="space-y-2">
+                {sale.sale_items.map((item, index) => (
+                  <div key={index} className="flex justify-between text-sm">
+                    <div className="flex-1">
+                      <div className="flex items-center gap-2">
+                        <span>{item.products.name}</span>
+                        <Badge className={getAnvisaLabelColor(item.products.anvisa_label)}>
+                          {item.products.anvisa_label === "over-the-counter"
+                            ? "OTC"
+                            : item.products.anvisa_label === "red-label"
+                              ? "Red"
+                              : "Black"}
+                        </Badge>
+                      </div>
+                      <div className="text-xs text-gray-500">
+                        {item.quantity} x R$ {item.unit_price.toFixed(2)}
+                        {item.batch_number && (
+                          <span className="ml-2 text-gray-400">
+                            (Batch: {item.batch_number})
+                          </span>
+                        )}
+                        {item.discount_applied > 0 && (
+                          <span className="text-green-600 ml-1">
+                            (-R$ {item.discount_applied.toFixed(2)})
+                          </span>
+                        )}
+                      </div>
+                    </div>
+                    <span>R$ {item.total_price.toFixed(2)}</span>
+                  </div>
+                ))}
+              </div>
+
+              <Separator />
+
+              <div className="space-y-1">
+                <div className="flex justify-between">
+                  <span>Subtotal:</span>
+                  <span>R$ {sale.total_amount.toFixed(2)}</span>
+                </div>
+                {sale.discount_amount > 0 && (
+                  <div className="flex justify-between text-green-600">
+                    <span>Discount:</span>
+                    <span>-R$ {sale.discount_amount.toFixed(2)}</span>
+                  </div>
+                )}
+                <div className="flex justify-between font-bold">
+                  <span>Total:</span>
+                  <span>R$ {sale.final_amount.toFixed(2)}</span>
+                </div>
+              </div>
+
+              <div className="text-center text-xs text-gray-500">
+                <p>Thank you for your purchase!</p>
+              </div>
+            </div>
+          </>
+        )}
+      </DialogContent>
+    </Dialog>
+  )
+}
@@ -0,0 +1,88 @@
+"use client"
+
+import { Button } from "@/components/ui/button"
+import {
+  Dialog,
+  DialogContent,
+  DialogDescription,
+  DialogFooter,
+  DialogHeader,
+  DialogTitle,
+} from "@/components/ui/dialog"
+import { Separator } from "@/components/ui/separator"
+import { Receipt, FileText } from "lucide-react"
+
+interface SaleReceiptDialogProps {
+  open: boolean
+  onOpenChange: (open: boolean) => void
+  receipt: any
+}
+
+// Loaded on demand by SalesInterface (next/dynamic), so the POS bundle does not carry it
+export function SaleReceiptDialog({ open, onOpenChange, receipt }: SaleReceiptDialogProps) {
+  return (
+    <Dialog open={open} onOpenChange={onOpenChange}>
+      <DialogContent className="max-w-md">
+        <DialogHeader>
+          <DialogTitle className="flex items-center gap-2">
+            <Receipt className="h-5 w-5" />
+            Sale Receipt
+          </DialogTitle>
+          <DialogDescription>Sale completed successfully</DialogDescription>
+        </DialogHeader>
+
+        <div className="space-y-4">
+          <div className="text-center">
+            <h3 className="font-bold text-lg">PharmaCare</h3>
+            <p className="text-sm text-gray-600">Sale Receipt</p>
+            <p className="text-sm text-gray-600">#{receipt.invoice_number}</p>
+          </div>
+
+          <Separator />
+
+          <div className="space-y-2">
+            {receipt.items?.map((item: any, index: number) => (
+              <div key={index} className="flex justify-between text-sm">
+                <span>
+                  {item.product_name} x{item.quantity}
+                </span>
+                <span>R$ {item.total_price.toFixed(2)}</span>
+              </div>
+            ))}
+          </div>
+
+          <Separator />
+
+          <div className="space-y-1">
+            <div className="flex justify-between">
+              <span>Subtotal:</span>
+              <span>R$ {receipt.total_amount.toFixed(2)}</span>
+            </div>
+            {receipt.discount_amount > 0 && (
+              <div className="flex justify-between text-green-600">
+                <span>Discount:</span>
+                <span>-R$ {receipt.discount_amount.toFixed(2)}</span>
+              </div>
+            )}
+            <div className="flex justify-between font-bold">
+              <span>Total:</span>
+              <span>R$ {receipt.final_amount.toFixed(2)}</span>
+            </div>
+          </div>
+
+          <div className="text-center text-xs text-gray-500">
+            <p>Thank you for your purchase!</p>
+            <p>{new Date().toLocaleString()}</p>
+          </div>
+        </div>
+
+        <DialogFooter>
+          <Button onClick={() => onOpenChange(false)} className="w-full">
+            <FileText className="h-4 w-4 mr-2" />
+            Print Receipt
+          </Button>
+        </DialogFooter>
+      </DialogContent>
+    </Dialog>
+  )
+}
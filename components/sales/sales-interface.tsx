@@ -1,6 +1,7 @@
 "use client"
 
 import { useState, useEffect } from "react"
+import dynamic from "next/dynamic"
 import { Button } from "@/components/ui/button"
 import { Input } from "@/components/ui/input"
 import { Label } from "@/components/ui/label"
@@ -8,19 +9,20 @@ import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from "@
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card"
 import { Badge } from "@/components/ui/badge"
 import { Alert, AlertDescription } from "@/components/ui/alert"
-import {
-  Dialog,
-  DialogContent,
-  DialogDescription,
-  DialogFooter,
-  DialogHeader,
-  DialogTitle,
-} from "@/components/ui/dialog"
 import { Separator } from "@/components/ui/separator"
 import { apiService } from "@/lib/api-service"
 import { createSale } from "@/app/actions/sales-actions"
+import { ClientPicker, type PickerClient } from "./client-picker"
+import type { Batch } from "./batch-select-dialog"
 import { Search, Plus, Minus, Trash2, Receipt, AlertTriangle, FileText, ShoppingCart, Package } from "lucide-react"
 
+// Kept out of the POS bundle; each chunk is requested when the action that
+// opens the dialog starts, so it is usually loaded by the time it is shown
+const loadReceiptDialog = () => import("./sale-receipt-dialog")
+const loadBatchDialog = () => import("./batch-select-dialog")
+const SaleReceiptDialog = dynamic(() => import("./sale-receipt-dialog").then((m) => m.SaleReceiptDialog), { ssr: false })
+const BatchSelectDialog = dynamic(() => import("./batch-select-dialog").then((m) => m.BatchSelectDialog), { ssr: false })
+
 interface Product {
   id: string
   name: string
@@ -38,12 +40,7 @@ interface Product {
   }
 }
 
-interface Client {
-  id: string
-  name: string
-  cpf: string
-  client_type: string
-}
+type Client = PickerClient
 
 interface PaymentMethod {
   id: string
@@ -60,23 +57,15 @@ interface SaleItem {
   batch_number?: string
 }
 
-interface Batch {
-  id: string
-  batch_number: string
-  quantity: number
-  expiration_date: string
-}
-
 interface SalesInterfaceProps {
   products: Product[]
-  clients: Client[]
   paymentMethods: PaymentMethod[]
   sellerId: string
   sellerName?: string
   onSaleComplete?: () => void
 }
 
-export function SalesInterface({ products, clients, paymentMethods, sellerId, sellerName, onSaleComplete }: SalesInterfaceProps) {
+export function SalesInterface({ products, paymentMethods, sellerId, sellerName, onSaleComplete }: SalesInterfaceProps) {
   const [searchTerm, setSearchTerm] = useState("")
   const [selectedClient, setSelectedClient] = useState<Client | null>(null)
   const [saleItems, setSaleItems] = useState<SaleItem[]>([])
@@ -190,6 +179,7 @@ export function SalesInterface({ products, clients, paymentMethods, sellerId, se
   }
 
   const handleSelectBatch = async (product: Product) => {
+    loadBatchDialog()
     try {
       const batches = await apiService.getProductBatches(product.id)
       setAvailableBatches(batches)
@@ -237,6 +227,7 @@ export function SalesInterface({ products, clients, paymentMethods, sellerId, se
 
     setLoading(true)
     setMessage(null)
+    loadReceiptDialog()
 
     try {
       const result = await createSale({
@@ -280,10 +271,6 @@ export function SalesInterface({ products, clients, paymentMethods, sellerId, se
     }
   }
 
-  const formatCPF = (cpf: string) => {
-    return cpf.replace(/(\d{3})(\d{3})(\d{3})(\d{2})/, "$1.$2.$3-$4")
-  }
-
   const getAnvisaLabelColor = (label: string) => {
     switch (label) {
       case "over-the-counter":
@@ -390,34 +377,7 @@ export function SalesInterface({ products, clients, paymentMethods, sellerId, se
             <CardDescription>Select client for automatic discounts</CardDescription>
           </CardHeader>
           <CardContent>
-            <Select
-              value={selectedClient?.id || "no_selection"}
-              onValueChange={(value) => {
-                if (value === "no_selection") {
-                  setSelectedClient(null)
-                } else {
-                  const client = clients.find((c) => c.id === value)
-                  setSelectedClient(client || null)
-                }
-              }}
-            >
-              <SelectTrigger>
-                <SelectValue placeholder="Select client or leave empty" />
-              </SelectTrigger>
-              <SelectContent>
-                <SelectItem value="no_selection">No client selected</SelectItem>
-                {clients.map((client) => (
-                  <SelectItem key={client.id} value={client.id}>
-                    <div>
-                      <div className="font-medium">{client.name}</div>
-                      <div className="text-sm text-gray-600">
-                        {formatCPF(client.cpf)} • {client.client_type}
-                      </div>
-                    </div>
-                  </SelectItem>
-                ))}
-              </SelectContent>
-            </Select>
+            <ClientPicker value={selectedClient} onChange={setSelectedClient} />
           </CardContent>
         </Card>
 
@@ -582,108 +542,21 @@ export function SalesInterface({ products, clients, paymentMethods, sellerId, se
         )}
       </div>
 
-      {/* Receipt Dialog */}
-      <Dialog open={showReceipt} onOpenChange={setShowReceipt}>
-        <DialogContent className="max-w-md">
-          <DialogHeader>
-            <DialogTitle className="flex items-center gap-2">
-              <Receipt className="h-5 w-5" />
-              Sale Receipt
-            </DialogTitle>
-            <DialogDescription>Sale completed successfully</DialogDescription>
-          </DialogHeader>
-
-          {receiptData && (
-            <div className="space-y-4">
-              <div className="text-center">
-                <h3 className="font-bold text-lg">PharmaCare</h3>
-                <p className="text-sm text-gray-600">Sale Receipt</p>
-                <p className="text-sm text-gray-600">#{receiptData.invoice_number}</p>
-              </div>
-
-              <Separator />
-
-              <div className="space-y-2">
-                {receiptData.items?.map((item: any, index: number) => (
-                  <div key={index} className="flex justify-between text-sm">
-                    <span>
-                      {item.product_name} x{item.quantity}
-                    </span>
-                    <span>R$ {item.total_price.toFixed(2)}</span>
-                  </div>
-                ))}
-              </div>
-
-              <Separator />
-
-              <div className="space-y-1">
-                <div className="flex justify-between">
-                  <span>Subtotal:</span>
-                  <span>R$ {receiptData.total_amount.toFixed(2)}</span>
-                </div>
-                {receiptData.discount_amount > 0 && (
-                  <div className="flex justify-between text-green-600">
-                    <span>Discount:</span>
-                    <span>-R$ {receiptData.discount_amount.toFixed(2)}</span>
-                  </div>
-                )}
-                <div className="flex justify-between font-bold">
-                  <span>Total:</span>
-                  <span>R$ {receiptData.final_amount.toFixed(2)}</span>
-                </div>
-              </div>
-
-              <div className="text-center text-xs text-gray-500">
-                <p>Thank you for your purchase!</p>
-                <p>{new Date().toLocaleString()}</p>
-              </div>
-            </div>
-          )}
-
-          <DialogFooter>
-            <Button onClick={() => setShowReceipt(false)} className="w-full">
-              <FileText className="h-4 w-4 mr-2" />
-              Print Receipt
-            </Button>
-          </DialogFooter>
-        </DialogContent>
-      </Dialog>
-
-      {/* Batch Selection Dialog */}
-      <Dialog open={showBatchDialog} onOpenChange={setShowBatchDialog}>
-        <DialogContent className="max-w-md">
-          <DialogHeader>
-            <DialogTitle>Select Batch</DialogTitle>
-            <DialogDescription>
-              Select a specific batch for {selectedProductForBatch?.name}
-            </DialogDescription>
-          </DialogHeader>
-          <div className="space-y-4">
-            {availableBatches.length === 0 ? (
-              <div className="text-center py-4 text-gray-500">No batches available</div>
-            ) : (
-              availableBatches.map((batch) => (
-                <div
-                  key={batch.id}
-                  className="flex items-center justify-between p-3 border rounded-lg hover:bg-gray-50 cursor-pointer"
-                  onClick={() => {
-                    if (selectedProductForBatch) {
-                      addToSale(selectedProductForBatch, batch)
-                      setShowBatchDialog(false)
-                    }
-                  }}
-                >
-                  <div>
-                    <div className="font-medium">Batch: {batch.batch_number}</div>
-                    <div className="text-sm text-gray-600">Expires: {new Date(batch.expiration_date).toLocaleDateString()}</div>
-                  </div>
-                  <Badge variant="outline">{batch.quantity} units</Badge>
-                </div>
-              ))
-            )}
-          </div>
-        </DialogContent>
-      </Dialog>
+      {/* Dialogs are loaded on first use, see the dynamic imports above */}
+      {receiptData && <SaleReceiptDialog open={showReceipt} onOpenChange={setShowReceipt} receipt={receiptData} />}
+
+      {selectedProductForBatch && (
+        <BatchSelectDialog
+          open={showBatchDialog}
+          onOpenChange={setShowBatchDialog}
+          product={selectedProductForBatch}
+          batches={availableBatches}
+          onSelect={(batch) => {
+            addToSale(selectedProductForBatch, batch)
+            setShowBatchDialog(false)
+          }}
+        />
+      )}
     </div>
   )
 }
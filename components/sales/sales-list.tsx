@@ -1,51 +1,18 @@
 "use client"
 
 import { useState } from "react"
+import dynamic from "next/dynamic"
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card"
 import { Badge } from "@/components/ui/badge"
 import { Button } from "@/components/ui/button"
 import { Input } from "@/components/ui/input"
-import {
-  Dialog,
-  DialogContent,
-  DialogDescription,
-  DialogHeader,
-  DialogTitle,
-  DialogTrigger,
-} from "@/components/ui/dialog"
-import { Separator } from "@/components/ui/separator"
 import { Receipt, Search, FileText, User, Calendar, CreditCard } from "lucide-react"
+import type { Sale } from "./sale-details-dialog"
 
-interface Sale {
-  id: string
-  invoice_number: string
-  total_amount: number
-  discount_amount: number
-  final_amount: number
-  sale_date: string
-  prescription_required: boolean
-  clients?: {
-    name: string
-    cpf: string
-  }
-  profiles?: {
-    full_name: string
-  }
-  payment_methods?: {
-    name: string
-  }
-  sale_items: Array<{
-    quantity: number
-    unit_price: number
-    total_price: number
-    discount_applied: number
-    batch_number?: string
-    products: {
-      name: string
-      anvisa_label: string
-    }
-  }>
-}
+// Only fetched the first time a sale is opened
+const SaleDetailsDialog = dynamic(() => import("./sale-details-dialog").then((m) => m.SaleDetailsDialog), {
+  ssr: false,
+})
 
 interface SalesListProps {
   sales: Sale[]
@@ -54,6 +21,7 @@ interface SalesListProps {
 export function SalesList({ sales }: SalesListProps) {
   const [searchTerm, setSearchTerm] = useState("")
   const [selectedSale, setSelectedSale] = useState<Sale | null>(null)
+  const [detailsOpen, setDetailsOpen] = useState(false)
 
   const filteredSales = sales.filter(
     (sale) =>
@@ -66,19 +34,6 @@ export function SalesList({ sales }: SalesListProps) {
     return cpf.replace(/(\d{3})(\d{3})(\d{3})(\d{2})/, "$1.$2.$3-$4")
   }
 
-  const getAnvisaLabelColor = (label: string) => {
-    switch (label) {
-      case "over-the-counter":
-        return "bg-green-100 text-green-800"
-      case "red-label":
-        return "bg-red-100 text-red-800"
-      case "black-label":
-        return "bg-gray-900 text-white"
-      default:
-        return "bg-gray-100 text-gray-800"
-    }
-  }
-
   return (
     <div className="space-y-6">
       <Card>
@@ -155,108 +110,16 @@ export function SalesList({ sales }: SalesListProps) {
                     </div>
 
                     <div className="flex items-center gap-2">
-                      <Dialog>
-                        <DialogTrigger asChild>
-                          <Button variant="outline" size="sm" onClick={() => setSelectedSale(sale)}>
-                            <FileText className="h-4 w-4" />
-                          </Button>
-                        </DialogTrigger>
-                        <DialogContent className="max-w-md">
-                          <DialogHeader>
-                            <DialogTitle className="flex items-center gap-2">
-                              <Receipt className="h-5 w-5" />
-                              Sale Details
-                            </DialogTitle>
-                            <DialogDescription>#{sale.invoice_number}</DialogDescription>
-                          </DialogHeader>
-
-                          <div className="space-y-4">
-                            <div className="text-center">
-                              <h3 className="font-bold text-lg">PharmaCare</h3>
-                              <p className="text-sm text-gray-600">Sale Receipt</p>
-                              <p className="text-sm text-gray-600">#{sale.invoice_number}</p>
-                            </div>
-
-                            <Separator />
-
-                            <div className="space-y-2">
-                              <div className="text-sm">
-                                <strong>Date:</strong> {new Date(sale.sale_date).toLocaleString()}
-                              </div>
-                              <div className="text-sm">
-                                <strong>Client:</strong>{" "}
-                                {sale.clients
-                                  ? `${sale.clients.name} (${formatCPF(sale.clients.cpf)})`
-                                  : "Unspecified User"}
-                              </div>
-                              <div className="text-sm">
-                                <strong>Seller:</strong> {sale.profiles?.full_name || "Unknown"}
-                              </div>
-                              <div className="text-sm">
-                                <strong>Payment:</strong> {sale.payment_methods?.name || "Unknown"}
-                              </div>
-                            </div>
-
-                            <Separator />
-
-                            <div className="space-y-2">
-                              {sale.sale_items.map((item, index) => (
-                                <div key={index} className="flex justify-between text-sm">
-                                  <div className="flex-1">
-                                    <div className="flex items-center gap-2">
-                                      <span>{item.products.name}</span>
-                                      <Badge className={getAnvisaLabelColor(item.products.anvisa_label)}>
-                                        {item.products.anvisa_label === "over-the-counter"
-                                          ? "OTC"
-                                          : item.products.anvisa_label === "red-label"
-                                            ? "Red"
-                                            : "Black"}
-                                      </Badge>
-                                    </div>
-                                    <div className="text-xs text-gray-500">
-                                      {item.quantity} x R$ {item.unit_price.toFixed(2)}
-                                      {item.batch_number && (
-                                        <span className="ml-2 text-gray-400">
-                                          (Batch: {item.batch_number})
-                                        </span>
-                                      )}
-                                      {item.discount_applied > 0 && (
-                                        <span className="text-green-600 ml-1">
-                                          (-R$ {item.discount_applied.toFixed(2)})
-                                        </span>
-                                      )}
-                                    </div>
-                                  </div>
-                                  <span>R$ {item.total_price.toFixed(2)}</span>
-                                </div>
-                              ))}
-                            </div>
-
-                            <Separator />
-
-                            <div className="space-y-1">
-                              <div className="flex justify-between">
-                                <span>Subtotal:</span>
-                                <span>R$ {sale.total_amount.toFixed(2)}</span>
-                              </div>
-                              {sale.discount_amount > 0 && (
-                                <div className="flex justify-between text-green-600">
-                                  <span>Discount:</span>
-                                  <span>-R$ {sale.discount_amount.toFixed(2)}</span>
-                                </div>
-                              )}
-                              <div className="flex justify-between font-bold">
-                                <span>Total:</span>
-                                <span>R$ {sale.final_amount.toFixed(2)}</span>
-                              </div>
-                            </div>
-
-                            <div className="text-center text-xs text-gray-500">
-                              <p>Thank you for your purchase!</p>
-                            </div>
-                          </div>
-                        </DialogContent>
-                      </Dialog>
+                      <Button
+                        variant="outline"
+                        size="sm"
+                        onClick={() => {
+                          setSelectedSale(sale)
+                          setDetailsOpen(true)
+                        }}
+                      >
+                        <FileText className="h-4 w-4" />
+                      </Button>
                     </div>
                   </div>
                 </Card>
@@ -265,6 +128,8 @@ export function SalesList({ sales }: SalesListProps) {
           </div>
         </CardContent>
       </Card>
+
+      {selectedSale && <SaleDetailsDialog sale={selectedSale} open={detailsOpen} onOpenChange={setDetailsOpen} />}
     </div>
   )
 }
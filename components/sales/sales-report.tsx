@@ -1,6 +1,16 @@
-import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card"
+"use client"
+
+import { useRef, useState } from "react"
+import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card"
 import { Badge } from "@/components/ui/badge"
+import { Button } from "@/components/ui/button"
+import { Input } from "@/components/ui/input"
+import { Label } from "@/components/ui/label"
+import { Progress } from "@/components/ui/progress"
+import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from "@/components/ui/select"
+import { Download, X } from "lucide-react"
 import { formatDistanceToNow } from "date-fns"
+import { reportRange, type ReportFormat, type ReportLevel } from "@/lib/sales-report"
 
 interface Sale {
   id: string
@@ -62,3 +72,213 @@ export function SalesReport({ sales }: SalesReportProps) {
     </Card>
   )
 }
+
+interface ReportSink {
+  write: (chunk: Uint8Array) => Promise<void> | void
+  close: () => Promise<void> | void
+  abort: () => Promise<void> | void
+}
+
+// Writes straight to disk where the File System Access API exists (Chromium),
+// so annual exports never sit in browser memory; elsewhere falls back to a Blob
+async function openSink(filename: string, type: string): Promise<ReportSink> {
+  if ("showSaveFilePicker" in window) {
+    const handle = await (window as any).showSaveFilePicker({ suggestedName: filename })
+    const writable = await handle.createWritable()
+    return {
+      write: (chunk) => writable.write(chunk),
+      close: () => writable.close(),
+      abort: () => writable.abort(),
+    }
+  }
+
+  const parts: Uint8Array[] = []
+  return {
+    write: (chunk) => {
+      parts.push(chunk)
+    },
+    close: () => {
+      const url = URL.createObjectURL(new Blob(parts, { type }))
+      const link = document.createElement("a")
+      link.href = url
+      link.download = filename
+      link.click()
+      URL.revokeObjectURL(url)
+    },
+    abort: () => {
+      parts.length = 0
+    },
+  }
+}
+
+function formatBytes(bytes: number) {
+  if (bytes < 1024 * 1024) return `${(bytes / 1024).toFixed(0)} KB`
+  return `${(bytes / (1024 * 1024)).toFixed(1)} MB`
+}
+
+function today() {
+  const date = new Date()
+  return `${date.getFullYear()}-${String(date.getMonth() + 1).padStart(2, "0")}-${String(date.getDate()).padStart(2, "0")}`
+}
+
+export function SalesReportExport() {
+  const [fromDate, setFromDate] = useState(() => today().slice(0, 8) + "01")
+  const [toDate, setToDate] = useState(today)
+  const [level, setLevel] = useState<ReportLevel>("lines")
+  const [format, setFormat] = useState<ReportFormat>("csv")
+  const [running, setRunning] = useState(false)
+  const [progress, setProgress] = useState({ rows: 0, bytes: 0, total: null as number | null })
+  const [message, setMessage] = useState<{ type: "success" | "error"; text: string } | null>(null)
+  const abortRef = useRef<AbortController | null>(null)
+
+  const handleExport = async () => {
+    if (!fromDate || !toDate || fromDate > toDate) {
+      setMessage({ type: "error", text: "Select a valid date range" })
+      return
+    }
+
+    const filename = `sales-${level}-${fromDate}-to-${toDate}.${format}`
+    let sink: ReportSink
+    try {
+      // Must run first: the save dialog needs the click's user activation
+      sink = await openSink(filename, format === "csv" ? "text/csv" : "application/x-ndjson")
+    } catch {
+      return // Save dialog cancelled
+    }
+
+    const controller = new AbortController()
+    abortRef.current = controller
+    setRunning(true)
+    setMessage(null)
+    setProgress({ rows: 0, bytes: 0, total: null })
+
+    const { from, to, tz } = reportRange(fromDate, toDate)
+    const query = new URLSearchParams({ from, to, tz, level, format }).toString()
+
+    // Total is only for the progress bar; the export does not wait for it
+    fetch(`/api/reports/sales?${query}&count=1`, { signal: controller.signal })
+      .then((res) => (res.ok ? res.json() : null))
+      .then((data) => data && setProgress((p) => ({ ...p, total: data.rows })))
+      .catch(() => {})
+
+    try {
+      const response = await fetch(`/api/reports/sales?${query}`, { signal: controller.signal })
+      if (!response.ok || !response.body) {
+        const error = await response.json().catch(() => ({}))
+        throw new Error(error.detail || "Failed to export report")
+      }
+
+      const reader = response.body.getReader()
+      let rows = format === "csv" ? -1 : 0 // CSV header line
+      let bytes = 0
+      let lastUpdate = 0
+      while (true) {
+        const { done, value } = await reader.read()
+        if (done) break
+        await sink.write(value)
+        bytes += value.length
+        for (let i = 0; i < value.length; i++) {
+          if (value[i] === 10) rows++
+        }
+        if (Date.now() - lastUpdate > 200) {
+          lastUpdate = Date.now()
+          setProgress((p) => ({ ...p, rows: Math.max(rows, 0), bytes }))
+        }
+      }
+
+      await sink.close()
+      setProgress((p) => ({ ...p, rows: Math.max(rows, 0), bytes }))
+      setMessage({ type: "success", text: `Exported ${Math.max(rows, 0).toLocaleString()} rows` })
+    } catch (error: any) {
+      await sink.abort()
+      setMessage(
+        controller.signal.aborted
+          ? { type: "error", text: "Export cancelled" }
+          : { type: "error", text: error.message || "Failed to export report" },
+      )
+    } finally {
+      abortRef.current = null
+      setRunning(false)
+    }
+  }
+
+  const percent = progress.total ? Math.min(100, (progress.rows / progress.total) * 100) : 0
+
+  return (
+    <Card>
+      <CardHeader>
+        <CardTitle className="flex items-center gap-2">
+          <Download className="h-5 w-5" />
+          Export Sales Report
+        </CardTitle>
+        <CardDescription>Line-level or daily totals for any period, streamed from the server</CardDescription>
+      </CardHeader>
+      <CardContent className="space-y-4">
+        <div className="grid grid-cols-1 md:grid-cols-4 gap-4">
+          <div className="space-y-2">
+            <Label htmlFor="report_from">From</Label>
+            <Input id="report_from" type="date" value={fromDate} onChange={(e) => setFromDate(e.target.value)} disabled={running} />
+          </div>
+          <div className="space-y-2">
+            <Label htmlFor="report_to">To</Label>
+            <Input id="report_to" type="date" value={toDate} onChange={(e) => setToDate(e.target.value)} disabled={running} />
+          </div>
+          <div className="space-y-2">
+            <Label>Detail</Label>
+            <Select value={level} onValueChange={(value) => setLevel(value as ReportLevel)} disabled={running}>
+              <SelectTrigger>
+                <SelectValue />
+              </SelectTrigger>
+              <SelectContent>
+                <SelectItem value="lines">Sale items</SelectItem>
+                <SelectItem value="daily">Daily totals</SelectItem>
+              </SelectContent>
+            </Select>
+          </div>
+          <div className="space-y-2">
+            <Label>Format</Label>
+            <Select value={format} onValueChange={(value) => setFormat(value as ReportFormat)} disabled={running}>
+              <SelectTrigger>
+                <SelectValue />
+              </SelectTrigger>
+              <SelectContent>
+                <SelectItem value="csv">CSV</SelectItem>
+                <SelectItem value="ndjson">NDJSON</SelectItem>
+              </SelectContent>
+            </Select>
+          </div>
+        </div>
+
+        {running && (
+          <div className="space-y-2">
+            <Progress value={percent} />
+            <div className="flex justify-between text-sm text-gray-600">
+              <span>
+                {progress.rows.toLocaleString()}
+                {progress.total !== null && ` of ${progress.total.toLocaleString()}`} rows
+              </span>
+              <span>{formatBytes(progress.bytes)}</span>
+            </div>
+          </div>
+        )}
+
+        {message && (
+          <p className={message.type === "error" ? "text-sm text-red-600" : "text-sm text-green-600"}>{message.text}</p>
+        )}
+
+        <div className="flex gap-2">
+          <Button onClick={handleExport} disabled={running}>
+            <Download className="h-4 w-4 mr-2" />
+            {running ? "Exporting..." : "Export"}
+          </Button>
+          {running && (
+            <Button variant="outline" onClick={() => abortRef.current?.abort()}>
+              <X className="h-4 w-4 mr-2" />
+              Cancel
+            </Button>
+          )}
+        </div>
+      </CardContent>
+    </Card>
+  )
+}
@@ -0,0 +1,148 @@
+"use client"
+
+import { useState } from "react"
+import { Button } from "@/components/ui/button"
+import { Badge } from "@/components/ui/badge"
+import { Input } from "@/components/ui/input"
+import { Label } from "@/components/ui/label"
+import { Alert, AlertDescription } from "@/components/ui/alert"
+import {
+  Dialog,
+  DialogContent,
+  DialogDescription,
+  DialogFooter,
+  DialogHeader,
+  DialogTitle,
+  DialogTrigger,
+} from "@/components/ui/dialog"
+import { createBulkReorder, previewBulkReorder } from "@/app/actions/reorder-actions"
+import { withoutOrderedLines, type SupplierReorder } from "@/lib/reorder-engine"
+import { Layers } from "lucide-react"
+
+interface BulkReorderDialogProps {
+  onSuccess?: () => void
+}
+
+export function BulkReorderDialog({ onSuccess }: BulkReorderDialogProps) {
+  const [open, setOpen] = useState(false)
+  const [plan, setPlan] = useState<SupplierReorder[]>([])
+  const [expectedDate, setExpectedDate] = useState("")
+  const [loading, setLoading] = useState(false)
+  const [error, setError] = useState<string | null>(null)
+
+  const loadPlan = async () => {
+    setLoading(true)
+    setError(null)
+    const result = await previewBulkReorder()
+    if (result.success) {
+      setPlan(result.data || [])
+    } else {
+      setError(result.error || "Failed to compute reorder plan")
+    }
+    setLoading(false)
+  }
+
+  const handleOpenChange = (value: boolean) => {
+    setOpen(value)
+    if (value) loadPlan()
+  }
+
+  const handleConfirm = async () => {
+    setLoading(true)
+    setError(null)
+    const result = await createBulkReorder(plan, expectedDate || undefined)
+    setLoading(false)
+    if (!result.success) {
+      setError(result.error || "Failed to create supplier orders")
+      const ordered = "orderedProductIds" in result ? result.orderedProductIds : undefined
+      if (ordered) {
+        // Keep only the lines that failed, so Confirm retries just those
+        setPlan((prev) => withoutOrderedLines(prev, ordered))
+        if (onSuccess) onSuccess()
+      }
+      return
+    }
+    setOpen(false)
+    if (onSuccess) onSuccess()
+  }
+
+  const lineCount = plan.reduce((sum, group) => sum + group.lines.length, 0)
+
+  return (
+    <Dialog open={open} onOpenChange={handleOpenChange}>
+      <DialogTrigger asChild>
+        <Button>
+          <Layers className="h-4 w-4 mr-2" />
+          Bulk Reorder
+        </Button>
+      </DialogTrigger>
+      <DialogContent className="max-w-2xl">
+        <DialogHeader>
+          <DialogTitle>Bulk Reorder</DialogTitle>
+          <DialogDescription>
+            Quantities are based on the last 30 days of sales. Products are grouped by the supplier of their
+            last supplier order; products with no supplier on record are ordered without one.
+          </DialogDescription>
+        </DialogHeader>
+
+        <div className="max-h-96 overflow-y-auto space-y-4">
+          {loading && plan.length === 0 ? (
+            <div className="text-center py-8 text-gray-500">Computing reorder plan...</div>
+          ) : plan.length === 0 ? (
+            <div className="text-center py-8 text-gray-500">No products need reordering.</div>
+          ) : (
+            plan.map((group) => (
+              <div key={group.supplier_id ?? "none"} className="border rounded-lg p-3">
+                <div className="flex items-center justify-between mb-2">
+                  <h3 className="font-semibold">
+                    {group.supplier_id ? `Supplier #${group.supplier_id}` : "No supplier assigned"}
+                  </h3>
+                  <Badge variant="outline">{group.total_quantity} units</Badge>
+                </div>
+                <div className="space-y-1">
+                  {group.lines.map((line) => (
+                    <div key={line.product_id} className="flex justify-between text-sm">
+                      <span>
+                        {line.product_name}
+                        <span className="text-gray-500 ml-2">
+                          (stock {line.current_stock}, {line.daily_velocity.toFixed(1)}/day)
+                        </span>
+                      </span>
+                      <span className="font-medium">{line.quantity}</span>
+                    </div>
+                  ))}
+                </div>
+              </div>
+            ))
+          )}
+        </div>
+
+        <div className="grid grid-cols-4 items-center gap-4">
+          <Label htmlFor="bulk_date" className="text-right">
+            Expected Delivery
+          </Label>
+          <Input
+            id="bulk_date"
+            type="date"
+            value={expectedDate}
+            onChange={(e) => setExpectedDate(e.target.value)}
+            className="col-span-3"
+          />
+        </div>
+
+        {error && (
+          <Alert className="border-red-200 bg-red-50">
+            <AlertDescription className="text-red-800">{error}</AlertDescription>
+          </Alert>
+        )}
+
+        <DialogFooter>
+          <Button variant="outline" onClick={() => setOpen(false)}>Cancel</Button>
+          <Button onClick={handleConfirm} disabled={loading || lineCount === 0}>
+            {loading ? "Processing..." : `Create ${plan.length} Orders (${lineCount} items)`}
+          </Button>
+        </DialogFooter>
+      </DialogContent>
+    </Dialog>
+  )
+}
@@ -17,6 +17,7 @@ import {
 import { Input } from "@/components/ui/input"
 import { Label } from "@/components/ui/label"
 import { updateProductStock, createSupplierOrder } from "@/app/actions/product-actions"
+import type { AlertSummary } from "@/lib/inventory-alerts"
 
 interface LowStockProduct {
   product_id: string
@@ -28,9 +29,13 @@ interface LowStockProduct {
 interface StockAlertsProps {
   products: LowStockProduct[]
   canManage?: boolean
+  // Totals for the headers when `products` is only the loaded feed pages
+  summary?: AlertSummary
+  hasMore?: boolean
+  onLoadMore?: () => void
 }
 
-export function StockAlerts({ products, canManage = true }: StockAlertsProps) {
+export function StockAlerts({ products, canManage = true, summary, hasMore, onLoadMore }: StockAlertsProps) {
   const [selectedProduct, setSelectedProduct] = useState<LowStockProduct | null>(null)
   const [reorderQuantity, setReorderQuantity] = useState("")
   const [expirationDate, setExpirationDate] = useState("")
@@ -38,6 +43,8 @@ export function StockAlerts({ products, canManage = true }: StockAlertsProps) {
 
   const criticalProducts = products.filter((p) => p.current_stock === 0)
   const lowStockProducts = products.filter((p) => p.current_stock > 0 && p.current_stock <= p.min_stock_level)
+  const criticalCount = summary?.out_of_stock ?? criticalProducts.length
+  const lowStockCount = summary?.low_stock ?? lowStockProducts.length
 
   const handleReorderClick = (product: LowStockProduct) => {
     setSelectedProduct(product)
@@ -76,7 +83,7 @@ export function StockAlerts({ products, canManage = true }: StockAlertsProps) {
           <CardDescription>Products requiring immediate attention for stock replenishment</CardDescription>
         </CardHeader>
         <CardContent>
-          {products.length === 0 ? (
+          {products.length === 0 && !hasMore ? (
             <div className="text-center py-8">
               <Package className="h-12 w-12 text-green-500 mx-auto mb-4" />
               <h3 className="text-lg font-semibold text-green-700 mb-2">All Stock Levels Good!</h3>
@@ -89,7 +96,7 @@ export function StockAlerts({ products, canManage = true }: StockAlertsProps) {
                 <div className="space-y-4">
                   <h3 className="text-lg font-semibold text-red-700 flex items-center gap-2">
                     <AlertTriangle className="h-5 w-5" />
-                    Critical - Out of Stock ({criticalProducts.length})
+                    Critical - Out of Stock ({criticalCount})
                   </h3>
                   <div className="space-y-3">
                     {criticalProducts.map((product) => (
@@ -127,7 +134,7 @@ export function StockAlerts({ products, canManage = true }: StockAlertsProps) {
                 <div className="space-y-4">
                   <h3 className="text-lg font-semibold text-yellow-700 flex items-center gap-2">
                     <AlertTriangle className="h-5 w-5" />
-                    Low Stock Warning ({lowStockProducts.length})
+                    Low Stock Warning ({lowStockCount})
                   </h3>
                   <div className="space-y-3">
                     {lowStockProducts.map((product) => (
@@ -161,6 +168,14 @@ export function StockAlerts({ products, canManage = true }: StockAlertsProps) {
                   </div>
                 </div>
               )}
+
+              {hasMore && onLoadMore && (
+                <div className="flex justify-center">
+                  <Button variant="outline" onClick={onLoadMore}>
+                    Load more
+                  </Button>
+                </div>
+              )}
             </div>
           )}
         </CardContent>
@@ -6,6 +6,7 @@ import { Button } from "@/components/ui/button"
 import { Alert, AlertDescription } from "@/components/ui/alert"
 import { AlertTriangle, Package, TrendingDown, Eye } from "lucide-react"
 import Link from "next/link"
+import type { AlertSummary } from "@/lib/inventory-alerts"
 
 interface LowStockProduct {
   product_id: string
@@ -15,12 +16,14 @@ interface LowStockProduct {
 }
 
 interface StockOverviewProps {
+  // Most critical first; may be only the first feed page
   lowStockProducts: LowStockProduct[]
+  summary?: AlertSummary
 }
 
-export function StockOverview({ lowStockProducts }: StockOverviewProps) {
-  const criticalProducts = lowStockProducts.filter((p) => p.current_stock === 0)
-  const lowStockCount = lowStockProducts.filter((p) => p.current_stock > 0).length
+export function StockOverview({ lowStockProducts, summary }: StockOverviewProps) {
+  const criticalCount = summary?.out_of_stock ?? lowStockProducts.filter((p) => p.current_stock === 0).length
+  const lowStockCount = summary?.low_stock ?? lowStockProducts.filter((p) => p.current_stock > 0).length
 
   return (
     <Card>
@@ -32,20 +35,20 @@ export function StockOverview({ lowStockProducts }: StockOverviewProps) {
         <CardDescription>Current inventory alerts</CardDescription>
       </CardHeader>
       <CardContent>
-        {lowStockProducts.length === 0 ? (
+        {criticalCount + lowStockCount === 0 ? (
           <div className="text-center py-4">
             <Package className="h-8 w-8 text-green-500 mx-auto mb-2" />
             <p className="text-sm text-green-700 font-medium">All stock levels good!</p>
           </div>
         ) : (
           <div className="space-y-4">
-            {criticalProducts.length > 0 && (
+            {criticalCount > 0 && (
               <Alert className="border-red-200 bg-red-50">
                 <AlertTriangle className="h-4 w-4 text-red-600" />
                 <AlertDescription className="text-red-800">
                   <div className="flex items-center justify-between">
                     <div>
-                      <strong>{criticalProducts.length} products out of stock</strong>
+                      <strong>{criticalCount} products out of stock</strong>
                       <div className="text-sm mt-1">Immediate attention required</div>
                     </div>
                     <Badge className="bg-red-100 text-red-800">Critical</Badge>
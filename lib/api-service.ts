@@ -1,5 +1,57 @@
+import { EXPIRATION_WINDOW_DAYS } from '@/lib/inventory-alerts';
+
 const API_URL = process.env.NEXT_PUBLIC_API_URL || process.env.NEXT_PUBLIC_BACKEND_API_URL || 'http://127.0.0.1:8000';
 
+export const DEFAULT_PAGE_SIZE = 50;
+
+export interface UserQuery {
+  role?: string
+  exclude_role?: string
+  search?: string
+  ids?: string[]
+  skip?: number
+  limit?: number
+}
+
+export function buildUserQuery(params: UserQuery) {
+  const query = new URLSearchParams();
+  if (params.role) query.set('role', params.role);
+  if (params.exclude_role) query.set('exclude_role', params.exclude_role);
+  if (params.search) {
+    // CPF lookups use the digits-only prefix index; anything else goes to name search
+    const term = params.search.trim();
+    const digits = term.replace(/\D/g, '');
+    query.set('search', /^[\d.\-\s]+$/.test(term) && digits ? digits : term);
+  }
+  if (params.ids && params.ids.length > 0) query.set('ids', params.ids.join(','));
+  if (params.skip) query.set('skip', params.skip.toString());
+  if (params.limit) query.set('limit', params.limit.toString());
+  const qs = query.toString();
+  return qs ? `?${qs}` : '';
+}
+
+// Client-side check of the /users/ filters (contract in
+// scripts/backend/001_user_lookup_indexes.sql). A backend that ignores a
+// parameter would otherwise hand back an unfiltered first page that looks
+// like a search result.
+export function matchesUserQuery(user: any, params: UserQuery, roleNames: Map<string, string>) {
+  const role = (user.role_name || roleNames.get(String(user.role_id)) || '').toLowerCase();
+  if (params.role && role && role !== params.role.toLowerCase()) return false;
+  if (params.exclude_role && role === params.exclude_role.toLowerCase()) return false;
+  if (params.ids && params.ids.length > 0 && !params.ids.includes(user.id.toString())) return false;
+  if (params.search) {
+    const term = params.search.trim();
+    const digits = term.replace(/\D/g, '');
+    if (/^[\d.\-\s]+$/.test(term) && digits) {
+      return (user.cpf || '').replace(/\D/g, '').startsWith(digits);
+    }
+    return (user.name || '').toLowerCase().includes(term.toLowerCase());
+  }
+  return true;
+}
+
+let roleNamesPromise: Promise<Map<string, string>> | null = null;
+
 export const apiService = {
   async getProducts() {
     const timestamp = new Date().getTime();
@@ -14,12 +66,45 @@ export const apiService = {
     return response.json();
   },
 
-  async getClients() {
-    const response = await fetch(`${API_URL}/users/`);
-    if (!response.ok) throw new Error('Failed to fetch clients');
-    // Filter users to find clients if necessary, or just return all users for now
-    // Ideally the backend should have a specific endpoint or filter
-    return response.json();
+  async getUsers(params: UserQuery = {}) {
+    const response = await fetch(`${API_URL}/users/${buildUserQuery(params)}`, { cache: 'no-store' });
+    if (!response.ok) throw new Error('Failed to fetch users');
+    const users = await response.json();
+
+    // Backstop for backends that ignore role/search/ids/limit
+    const needsRoles = (params.role || params.exclude_role) && users.some((u: any) => !u.role_name && u.role_id != null);
+    const roleNames = needsRoles ? await this.getRoleNames() : new Map<string, string>();
+    const matched = users.filter((u: any) => matchesUserQuery(u, params, roleNames));
+    if (matched.length < users.length) {
+      console.warn(`/users/ returned ${users.length - matched.length} rows outside the query; filtering locally`);
+    }
+    return params.limit && matched.length > params.limit ? matched.slice(0, params.limit) : matched;
+  },
+
+  // role_id -> role name, fetched once per page load
+  async getRoleNames() {
+    if (!roleNamesPromise) {
+      roleNamesPromise = this.getRoles()
+        .then((roles: any[]) => new Map(roles.map((r) => [r.id.toString(), r.name])))
+        .catch((error: unknown) => {
+          roleNamesPromise = null;
+          throw error;
+        });
+    }
+    return roleNamesPromise;
+  },
+
+  async getClients(params: Omit<UserQuery, 'role' | 'exclude_role'> = {}) {
+    // Role filtering, search and paging happen on the backend (indexed CPF/name lookup)
+    return this.getUsers({ limit: DEFAULT_PAGE_SIZE, ...params, role: 'client' });
+  },
+
+  async getStaff(params: Omit<UserQuery, 'role' | 'exclude_role'> = {}) {
+    return this.getUsers({ ...params, exclude_role: 'client' });
+  },
+
+  async searchClients(term: string, limit: number = 20) {
+    return this.getClients({ search: term, limit });
   },
 
   async getRoles() {
@@ -196,6 +281,37 @@ export const apiService = {
     return response.json();
   },
 
+  async getStockAlerts(params: { skip?: number, limit?: number } = {}) {
+    const query = new URLSearchParams({
+      skip: (params.skip || 0).toString(),
+      limit: (params.limit || DEFAULT_PAGE_SIZE).toString(),
+    });
+    const response = await fetch(`${API_URL}/alerts/stock?${query}`, { cache: 'no-store' });
+    if (!response.ok) throw new Error('Failed to fetch stock alerts');
+    return response.json();
+  },
+
+  async getExpirationAlerts(params: { within_days?: number, skip?: number, limit?: number } = {}) {
+    const query = new URLSearchParams({
+      within_days: (params.within_days || EXPIRATION_WINDOW_DAYS).toString(),
+      skip: (params.skip || 0).toString(),
+      limit: (params.limit || DEFAULT_PAGE_SIZE).toString(),
+    });
+    const response = await fetch(`${API_URL}/alerts/expiration?${query}`, { cache: 'no-store' });
+    if (!response.ok) throw new Error('Failed to fetch expiration alerts');
+    return response.json();
+  },
+
+  // Alert totals; the feed endpoints are paged, so counts must not come from their length
+  async getAlertSummary(params: { within_days?: number } = {}) {
+    const query = new URLSearchParams({
+      within_days: (params.within_days || EXPIRATION_WINDOW_DAYS).toString(),
+    });
+    const response = await fetch(`${API_URL}/alerts/summary?${query}`, { cache: 'no-store' });
+    if (!response.ok) throw new Error('Failed to fetch alert summary');
+    return response.json();
+  },
+
   async getProductBatches(productId: string) {
     const response = await fetch(`${API_URL}/products/${productId}/batches`, { cache: 'no-store' });
     if (!response.ok) throw new Error('Failed to fetch product batches');
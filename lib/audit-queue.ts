@@ -0,0 +1,181 @@
+import { promises as fs } from "fs"
+import path from "path"
+import { randomUUID } from "crypto"
+import { createAdminClient } from "@/lib/supabase/admin"
+
+// Write-behind queue for audit_log and stock_movements rows.
+//
+// Server actions append events to a local NDJSON segment (one small write)
+// and return; a background flusher bulk-inserts them. Every event carries an
+// event_id so a segment replayed after a crash between insert and delete is
+// deduplicated by the unique index from scripts/008_audit_write_behind.sql.
+
+export type AuditTable = "audit_log" | "stock_movements"
+
+export interface AuditWrite {
+  table: AuditTable
+  row: Record<string, any>
+}
+
+interface QueuedWrite extends AuditWrite {
+  event_id: string
+}
+
+const QUEUE_DIR = process.env.AUDIT_QUEUE_DIR || path.join(process.cwd(), ".audit-queue")
+const ACTIVE_SEGMENT = path.join(QUEUE_DIR, "active.ndjson")
+// Lines that can't be parsed (a write torn by a crash) are moved here
+const QUARANTINE_FILE = path.join(QUEUE_DIR, "quarantine.ndjson")
+const FLUSH_INTERVAL_MS = 1000
+const FLUSH_BATCH_SIZE = 500
+// Producers wait for a flush once this many events are unflushed, but never
+// longer than MAX_BACKPRESSURE_WAIT_MS: the mutation they record is already
+// committed, so a slow or failing flush must not turn it into an error
+const MAX_PENDING = 10000
+const MAX_BACKPRESSURE_WAIT_MS = 2000
+
+class AuditQueue {
+  private lock: Promise<unknown> = Promise.resolve()
+  private flushing: Promise<void> | null = null
+  private pending = 0
+  private ready: Promise<void>
+
+  constructor() {
+    this.ready = this.recover()
+    const timer = setInterval(() => {
+      this.flush().catch((error) => console.error("Audit flush failed:", error))
+    }, FLUSH_INTERVAL_MS)
+    timer.unref?.()
+  }
+
+  // Appends and rotations are serialized so a rotation never races an append
+  private exclusive<T>(fn: () => Promise<T>): Promise<T> {
+    const run = this.lock.then(fn, fn)
+    this.lock = run.catch(() => {})
+    return run
+  }
+
+  // Counts events left over from a previous process; they are flushed first.
+  // The active segment is sealed so new appends never land on a torn last line.
+  private async recover() {
+    await fs.mkdir(QUEUE_DIR, { recursive: true })
+    await this.sealActive()
+    for (const file of await this.segments(false)) {
+      const content = await fs.readFile(file, "utf8")
+      this.pending += content.split("\n").filter(Boolean).length
+    }
+  }
+
+  private async sealActive() {
+    try {
+      await fs.rename(ACTIVE_SEGMENT, path.join(QUEUE_DIR, `segment-${Date.now()}-${randomUUID()}.ndjson`))
+    } catch (error: any) {
+      if (error.code !== "ENOENT") throw error
+    }
+  }
+
+  // Parses a segment. Unparseable lines are quarantined and dropped from the
+  // segment, so one torn write can't block every segment after it.
+  private async readSegment(file: string): Promise<QueuedWrite[]> {
+    const events: QueuedWrite[] = []
+    const bad: string[] = []
+    for (const line of (await fs.readFile(file, "utf8")).split("\n")) {
+      if (!line) continue
+      try {
+        events.push(JSON.parse(line))
+      } catch {
+        bad.push(line)
+      }
+    }
+    if (bad.length > 0) {
+      console.error(`Audit queue: quarantined ${bad.length} unreadable line(s) from ${path.basename(file)}`)
+      await fs.appendFile(QUARANTINE_FILE, bad.join("\n") + "\n")
+      const tmp = `${file}.tmp`
+      await fs.writeFile(tmp, events.map((e) => JSON.stringify(e) + "\n").join(""))
+      await fs.rename(tmp, file)
+      this.pending = Math.max(0, this.pending - bad.length)
+    }
+    return events
+  }
+
+  private async segments(includeActive: boolean) {
+    const files = (await fs.readdir(QUEUE_DIR))
+      .filter((f) => f.startsWith("segment-") && f.endsWith(".ndjson"))
+      .sort()
+      .map((f) => path.join(QUEUE_DIR, f))
+    if (includeActive) {
+      try {
+        await fs.access(ACTIVE_SEGMENT)
+        files.push(ACTIVE_SEGMENT)
+      } catch {}
+    }
+    return files
+  }
+
+  async enqueue(writes: AuditWrite[]) {
+    await this.ready
+    if (this.pending >= MAX_PENDING) {
+      const timeout = new Promise<void>((resolve) => setTimeout(resolve, MAX_BACKPRESSURE_WAIT_MS).unref?.())
+      await Promise.race([this.flush(), timeout]).catch((error) => {
+        console.error("Audit flush failed under backpressure, appending anyway:", error)
+      })
+    }
+
+    const lines = writes
+      .map((w) => JSON.stringify({ event_id: randomUUID(), table: w.table, row: w.row } satisfies QueuedWrite))
+      .join("\n")
+    await this.exclusive(() => fs.appendFile(ACTIVE_SEGMENT, lines + "\n"))
+    this.pending += writes.length
+  }
+
+  flush(): Promise<void> {
+    if (!this.flushing) {
+      this.flushing = this.flushSegments().finally(() => {
+        this.flushing = null
+      })
+    }
+    return this.flushing
+  }
+
+  private async flushSegments() {
+    await this.ready
+
+    // Seal the active segment so new events go to a fresh file
+    await this.exclusive(() => this.sealActive())
+
+    const segments = await this.segments(false)
+    if (segments.length === 0) return
+
+    const supabase = createAdminClient()
+    for (const file of segments) {
+      const events = await this.readSegment(file)
+
+      for (const table of ["audit_log", "stock_movements"] as AuditTable[]) {
+        const rows = events.filter((e) => e.table === table).map((e) => ({ ...e.row, event_id: e.event_id }))
+        for (let i = 0; i < rows.length; i += FLUSH_BATCH_SIZE) {
+          const { error } = await supabase
+            .from(table)
+            .upsert(rows.slice(i, i + FLUSH_BATCH_SIZE), { onConflict: "event_id", ignoreDuplicates: true })
+          // Leave the segment in place; the next tick retries it
+          if (error) throw new Error(`Failed to flush ${table}: ${error.message}`)
+        }
+      }
+
+      await fs.unlink(file)
+      this.pending = Math.max(0, this.pending - events.length)
+    }
+  }
+}
+
+const globalForAudit = globalThis as unknown as { auditQueue?: AuditQueue }
+
+function getQueue() {
+  return globalForAudit.auditQueue ?? (globalForAudit.auditQueue = new AuditQueue())
+}
+
+export function enqueueAuditWrites(...writes: AuditWrite[]) {
+  return getQueue().enqueue(writes)
+}
+
+export function flushAuditQueue() {
+  return getQueue().flush()
+}
@@ -0,0 +1,190 @@
+// Shared alert thresholds. These must match the ones used by
+// scripts/backend/002_inventory_alert_scanner.sql so that the precomputed feed and the
+// client-side fallback agree.
+export const DEFAULT_MIN_STOCK_LEVEL = 10;
+export const EXPIRING_SOON_DAYS = 30;
+export const EXPIRATION_WINDOW_DAYS = 90;
+
+export interface StockAlert {
+  product_id: string
+  product_name: string
+  current_stock: number
+  min_stock_level: number
+}
+
+// One per batch; the fallback scan only knows each product's next batch
+export interface ExpirationAlert {
+  product_id: string
+  product_name: string
+  batch_id?: string
+  batch_number?: string
+  expiration_date: string
+  days_until_expiration: number
+}
+
+export function daysUntil(dateString: string, today: Date = new Date()) {
+  return Math.ceil((new Date(dateString).getTime() - today.getTime()) / (1000 * 60 * 60 * 24))
+}
+
+export function toStockAlert(row: any): StockAlert {
+  return {
+    product_id: row.product_id.toString(),
+    product_name: row.product_name,
+    current_stock: row.current_stock,
+    min_stock_level: row.min_stock_level ?? DEFAULT_MIN_STOCK_LEVEL,
+  }
+}
+
+export function toExpirationAlert(row: any): ExpirationAlert {
+  return {
+    product_id: row.product_id.toString(),
+    product_name: row.product_name,
+    batch_id: row.batch_id != null ? row.batch_id.toString() : undefined,
+    batch_number: row.batch_number || undefined,
+    expiration_date: row.expiration_date,
+    days_until_expiration: row.days_until_expiration ?? daysUntil(row.expiration_date),
+  }
+}
+
+// Client-side fallback used only when the alert feed is unavailable
+
+export function computeStockAlerts(products: any[]): StockAlert[] {
+  return products
+    .filter((p) => p.stock_quantity <= (p.min_stock_level || DEFAULT_MIN_STOCK_LEVEL))
+    .map((p) => ({
+      product_id: p.id.toString(),
+      product_name: p.name,
+      current_stock: p.stock_quantity,
+      min_stock_level: p.min_stock_level || DEFAULT_MIN_STOCK_LEVEL,
+    }))
+}
+
+export function computeExpirationAlerts(products: any[], withinDays: number = EXPIRATION_WINDOW_DAYS): ExpirationAlert[] {
+  const today = new Date()
+  return products
+    .map((p) => ({ p, expiration_date: p.next_expiration_date || p.validity || p.expiration_date }))
+    .filter(({ expiration_date }) => expiration_date)
+    .map(({ p, expiration_date }) => ({
+      product_id: p.id.toString(),
+      product_name: p.name,
+      batch_number: p.next_batch_number || undefined,
+      expiration_date,
+      days_until_expiration: daysUntil(expiration_date, today),
+    }))
+    .filter((a) => a.days_until_expiration <= withinDays)
+    .sort((a, b) => a.days_until_expiration - b.days_until_expiration)
+}
+
+export interface AlertSummary {
+  out_of_stock: number
+  low_stock: number
+  expired: number
+  expiring_this_week: number
+  expiring: number
+}
+
+export function toAlertSummary(row: any): AlertSummary {
+  return {
+    out_of_stock: Number(row.out_of_stock) || 0,
+    low_stock: Number(row.low_stock) || 0,
+    expired: Number(row.expired) || 0,
+    expiring_this_week: Number(row.expiring_this_week) || 0,
+    expiring: Number(row.expiring) || 0,
+  }
+}
+
+// Counts for a complete alert set; only valid for the client-side fallback,
+// never for a single feed page
+export function summarizeAlerts(stock: StockAlert[], expiration: ExpirationAlert[]): AlertSummary {
+  return {
+    out_of_stock: stock.filter((a) => a.current_stock <= 0).length,
+    low_stock: stock.filter((a) => a.current_stock > 0).length,
+    expired: expiration.filter((a) => a.days_until_expiration <= 0).length,
+    expiring_this_week: expiration.filter((a) => a.days_until_expiration > 0 && a.days_until_expiration <= 7).length,
+    expiring: expiration.filter((a) => a.days_until_expiration > 0).length,
+  }
+}
+
+// Stock alerts are per product, expiration alerts per batch
+export function alertKey(alert: { product_id: string; batch_id?: string }) {
+  return alert.batch_id ? `${alert.product_id}:${alert.batch_id}` : alert.product_id
+}
+
+// Appends a feed page, skipping rows a live event already inserted
+export function appendAlertPage<T extends { product_id: string; batch_id?: string }>(alerts: T[], page: T[]): T[] {
+  const seen = new Set(alerts.map(alertKey))
+  return [...alerts, ...page.filter((a) => !seen.has(alertKey(a)))]
+}
+
+type StockEvent = { product_id: string; delta: number; stock_quantity?: number }
+
+// Product as it was before the event; lets new alerts be added
+export interface AlertProduct {
+  name: string
+  stock_quantity: number
+  min_stock_level?: number
+}
+
+function stockTransition(alerts: StockAlert[], event: StockEvent, product?: AlertProduct) {
+  const existing = alerts.find((a) => a.product_id === event.product_id.toString())
+  const previous = existing?.current_stock ?? product?.stock_quantity
+  if (previous === undefined) return null
+  return {
+    existing,
+    previous,
+    current: event.stock_quantity ?? previous + event.delta,
+    min: existing?.min_stock_level ?? product?.min_stock_level ?? DEFAULT_MIN_STOCK_LEVEL,
+  }
+}
+
+function stockBucket(stock: number, min: number): "out_of_stock" | "low_stock" | null {
+  if (stock <= 0) return "out_of_stock"
+  return stock <= min ? "low_stock" : null
+}
+
+function sortStockAlerts(alerts: StockAlert[]) {
+  return alerts.sort((a, b) => a.current_stock - b.current_stock || a.product_id.localeCompare(b.product_id))
+}
+
+// Keeps an already-loaded stock alert page in sync with live stock deltas.
+// Products that cross below their minimum are added when `product` is known;
+// with more pages to load, one that sorts past the last loaded row is left for
+// its own page.
+export function applyStockEventToAlerts(
+  alerts: StockAlert[],
+  event: StockEvent,
+  product?: AlertProduct,
+  hasMore: boolean = false,
+): StockAlert[] {
+  const transition = stockTransition(alerts, event, product)
+  if (!transition) return alerts
+  const { existing, current, min } = transition
+  const rest = alerts.filter((a) => a !== existing)
+  if (current > min) return rest
+
+  if (existing) return sortStockAlerts([...rest, { ...existing, current_stock: current }])
+  const last = rest[rest.length - 1]
+  if (hasMore && last && current > last.current_stock) return alerts
+  return sortStockAlerts([
+    ...rest,
+    { product_id: event.product_id.toString(), product_name: product!.name, current_stock: current, min_stock_level: min },
+  ])
+}
+
+// Moves a product between the out-of-stock / low-stock counts
+export function applyStockEventToSummary(
+  summary: AlertSummary,
+  alerts: StockAlert[],
+  event: StockEvent,
+  product?: AlertProduct,
+): AlertSummary {
+  const transition = stockTransition(alerts, event, product)
+  if (!transition) return summary
+  const before = stockBucket(transition.previous, transition.min)
+  const after = stockBucket(transition.current, transition.min)
+  if (before === after) return summary
+  const next = { ...summary }
+  if (before) next[before] = Math.max(0, next[before] - 1)
+  if (after) next[after] += 1
+  return next
+}
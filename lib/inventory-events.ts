@@ -0,0 +1,95 @@
+import { useEffect, useRef, useState } from "react"
+import {
+  applyStockEventToAlerts,
+  applyStockEventToSummary,
+  type AlertSummary,
+  type StockAlert,
+} from "@/lib/inventory-alerts"
+
+// Defaults to the local stand-in publisher served by app/api/events/inventory
+const INVENTORY_EVENTS_URL = process.env.NEXT_PUBLIC_INVENTORY_EVENTS_URL || '/api/events/inventory';
+
+export interface BatchDelta {
+  id?: string
+  batch_number: string
+  expiration_date: string
+  quantity: number
+}
+
+export type InventoryEvent =
+  | { type: "stock"; product_id: string; delta: number; stock_quantity?: number }
+  | { type: "batch"; product_id: string; batch: BatchDelta }
+  | { type: "order"; order: any }
+
+// Applies a stock delta to a product list without touching unrelated rows
+export function applyStockEvent<T extends { id: any; stock_quantity: number }>(
+  products: T[],
+  event: Extract<InventoryEvent, { type: "stock" }>,
+): T[] {
+  return products.map((p) => {
+    if (p.id.toString() !== event.product_id.toString()) return p
+    const stock_quantity = event.stock_quantity ?? p.stock_quantity + event.delta
+    return { ...p, stock_quantity }
+  })
+}
+
+// Products and the stock alerts derived from them, kept in one state value so
+// a burst of events is applied in order against the previous state rather
+// than against whatever the last render saw
+export interface StockAlertState<T> {
+  products: T[]
+  alerts: StockAlert[]
+  summary?: AlertSummary
+  hasMore: boolean
+}
+
+export function applyStockEventToState<T extends { id: any; name: string; stock_quantity: number; min_stock_level?: number }>(
+  state: StockAlertState<T>,
+  event: Extract<InventoryEvent, { type: "stock" }>,
+): StockAlertState<T> {
+  const product = state.products.find((p) => p.id.toString() === event.product_id.toString())
+  return {
+    ...state,
+    products: applyStockEvent(state.products, event),
+    alerts: applyStockEventToAlerts(state.alerts, event, product, state.hasMore),
+    summary: state.summary && applyStockEventToSummary(state.summary, state.alerts, event, product),
+  }
+}
+
+// Inserts or replaces a supplier order by id; orders without one are ignored
+export function upsertOrder(orders: any[], order: any): any[] {
+  if (order?.id === undefined || order?.id === null) return orders
+  const index = orders.findIndex((o) => o.id?.toString() === order.id.toString())
+  if (index === -1) return [...orders, order]
+  const next = [...orders]
+  next[index] = { ...orders[index], ...order }
+  return next
+}
+
+// Subscribes to the inventory event stream. Returns whether the stream is
+// currently connected so callers can fall back to refetching when it isn't.
+export function useInventoryEvents(onEvent: (event: InventoryEvent) => void) {
+  const handlerRef = useRef(onEvent)
+  handlerRef.current = onEvent
+  const [connected, setConnected] = useState(false)
+
+  useEffect(() => {
+    if (typeof window === "undefined" || typeof EventSource === "undefined") return
+
+    // EventSource reconnects on its own after errors
+    const source = new EventSource(INVENTORY_EVENTS_URL)
+    source.onopen = () => setConnected(true)
+    source.onerror = () => setConnected(false)
+    source.onmessage = (e) => {
+      try {
+        handlerRef.current(JSON.parse(e.data))
+      } catch (error) {
+        console.error("Invalid inventory event", error)
+      }
+    }
+
+    return () => source.close()
+  }, [])
+
+  return connected
+}
@@ -0,0 +1,28 @@
+import type { InventoryEvent } from "./inventory-events"
+
+// In-process stand-in for the backend event publisher. Server actions and the
+// SSE route handler can end up in separate bundles, so the listener set lives
+// on globalThis to be shared between them.
+type Listener = (event: InventoryEvent) => void
+
+const globalForInventory = globalThis as unknown as { inventoryListeners?: Set<Listener> }
+const listeners = globalForInventory.inventoryListeners ?? (globalForInventory.inventoryListeners = new Set())
+
+export function subscribeInventoryEvents(listener: Listener) {
+  listeners.add(listener)
+  return () => {
+    listeners.delete(listener)
+  }
+}
+
+export function publishInventoryEvents(...events: InventoryEvent[]) {
+  for (const event of events) {
+    listeners.forEach((listener) => {
+      try {
+        listener(event)
+      } catch (error) {
+        console.error("Inventory listener failed:", error)
+      }
+    })
+  }
+}
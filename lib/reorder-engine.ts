@@ -0,0 +1,137 @@
+import { DEFAULT_MIN_STOCK_LEVEL } from "@/lib/inventory-alerts"
+
+export interface ReorderProduct {
+  id: string | number
+  name: string
+  stock_quantity: number
+  min_stock_level?: number | null
+  supplier_id?: string | number | null
+}
+
+export interface ReorderOptions {
+  velocityDays: number // Window the units-sold figures cover
+  leadTimeDays: number // Expected supplier delivery time
+  coverDays: number // Days of demand each order should cover after arrival
+  minOrderQuantity: number
+}
+
+export const DEFAULT_REORDER_OPTIONS: ReorderOptions = {
+  velocityDays: 30,
+  leadTimeDays: 7,
+  coverDays: 30,
+  minOrderQuantity: 10,
+}
+
+export interface ReorderLine {
+  product_id: string
+  product_name: string
+  current_stock: number
+  daily_velocity: number
+  quantity: number
+}
+
+export interface SupplierReorder {
+  supplier_id: string | null
+  lines: ReorderLine[]
+  total_quantity: number
+}
+
+// Sums units sold per product from order rows ({ created_at, items: [{ product_id, quantity }] })
+export function aggregateUnitsSold(orders: any[], since: Date): Map<string, number> {
+  const sold = new Map<string, number>()
+  const sinceTime = since.getTime()
+  for (const order of orders) {
+    if (Date.parse(order.created_at) < sinceTime) continue
+    for (const item of order.items || []) {
+      const key = item.product_id.toString()
+      sold.set(key, (sold.get(key) || 0) + item.quantity)
+    }
+  }
+  return sold
+}
+
+// Supplier of each product's most recent supplier order that names one.
+// Backend products carry no supplier_id, so this is the only real source.
+export function lastSupplierByProduct(supplierOrders: any[]): Map<string, string> {
+  const latest = new Map<string, { time: number; supplierId: string }>()
+  for (const order of supplierOrders) {
+    if (order.supplier_id == null || order.product_id == null) continue
+    const key = order.product_id.toString()
+    const time = Date.parse(order.created_at) || 0
+    const current = latest.get(key)
+    if (!current || time >= current.time) latest.set(key, { time, supplierId: order.supplier_id.toString() })
+  }
+  return new Map(Array.from(latest, ([productId, { supplierId }]) => [productId, supplierId]))
+}
+
+// Computes reorder quantities for the whole catalog in one pass over columnar
+// typed arrays, then groups the resulting lines by supplier.
+//
+// A product is reordered when its stock is at or below its reorder point,
+// max(min_stock_level, velocity * lead time). The quantity covers demand for
+// lead time + cover days on top of the min stock level as safety stock.
+//
+// Products without a supplier_id take one from `suppliers` (see
+// lastSupplierByProduct); whatever is still unknown lands in the
+// supplier_id: null group.
+export function computeReorderPlan(
+  products: ReorderProduct[],
+  unitsSold: Map<string, number>,
+  options: ReorderOptions = DEFAULT_REORDER_OPTIONS,
+  suppliers: Map<string, string> = new Map(),
+): SupplierReorder[] {
+  const n = products.length
+  const stock = new Float64Array(n)
+  const minLevel = new Float64Array(n)
+  const velocity = new Float64Array(n)
+  const quantity = new Int32Array(n)
+
+  for (let i = 0; i < n; i++) {
+    const p = products[i]
+    stock[i] = p.stock_quantity
+    minLevel[i] = p.min_stock_level || DEFAULT_MIN_STOCK_LEVEL
+    velocity[i] = (unitsSold.get(p.id.toString()) || 0) / options.velocityDays
+  }
+
+  const horizon = options.leadTimeDays + options.coverDays
+  for (let i = 0; i < n; i++) {
+    const reorderPoint = Math.max(minLevel[i], Math.ceil(velocity[i] * options.leadTimeDays))
+    if (stock[i] > reorderPoint) continue
+    const target = Math.ceil(velocity[i] * horizon) + minLevel[i]
+    quantity[i] = Math.max(target - stock[i], options.minOrderQuantity)
+  }
+
+  const bySupplier = new Map<string | null, SupplierReorder>()
+  for (let i = 0; i < n; i++) {
+    if (quantity[i] === 0) continue
+    const p = products[i]
+    const supplierId = p.supplier_id != null ? p.supplier_id.toString() : suppliers.get(p.id.toString()) ?? null
+    let group = bySupplier.get(supplierId)
+    if (!group) {
+      group = { supplier_id: supplierId, lines: [], total_quantity: 0 }
+      bySupplier.set(supplierId, group)
+    }
+    group.lines.push({
+      product_id: p.id.toString(),
+      product_name: p.name,
+      current_stock: stock[i],
+      daily_velocity: velocity[i],
+      quantity: quantity[i],
+    })
+    group.total_quantity += quantity[i]
+  }
+
+  return Array.from(bySupplier.values())
+}
+
+// Drops lines that were already ordered, so retrying a partly failed bulk
+// reorder only submits what is left
+export function withoutOrderedLines(plan: SupplierReorder[], orderedProductIds: Iterable<string>): SupplierReorder[] {
+  const ordered = new Set(orderedProductIds)
+  return plan
+    .map((group) => {
+      const lines = group.lines.filter((line) => !ordered.has(line.product_id))
+      return { ...group, lines, total_quantity: lines.reduce((sum, line) => sum + line.quantity, 0) }
+    })
+    .filter((group) => group.lines.length > 0)
+}
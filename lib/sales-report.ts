@@ -0,0 +1,205 @@
+// Streaming sales report export.
+//
+// Rows are pulled page by page through a keyset cursor and encoded as they go,
+// so memory stays at roughly one page no matter how long the date range is.
+// The stream only asks for the next page when the consumer has read the
+// previous one (pull-based ReadableStream with a high-water mark of 1 chunk).
+//
+// Sales are the backend's orders, the same data the Sales History page lists.
+// Pages come from GET /orders/report (scripts/backend/003_sales_report_export.sql);
+// ordersToReportRows builds the same rows from /orders/ for backends that
+// don't have that endpoint yet.
+
+export type ReportLevel = "lines" | "daily"
+export type ReportFormat = "csv" | "ndjson"
+
+// Rows per page request; also roughly what the stream holds in memory
+export const REPORT_PAGE_SIZE = 1000
+
+export const REPORT_COLUMNS: Record<ReportLevel, string[]> = {
+  lines: [
+    "sale_date",
+    "invoice_number",
+    "sale_id",
+    "item_id",
+    "product_name",
+    "barcode",
+    "quantity",
+    "unit_price",
+    "discount_applied",
+    "total_price",
+    "client_name",
+    "client_cpf",
+    "seller_name",
+    "payment_method",
+  ],
+  daily: ["day", "sales_count", "items_count", "units_sold", "gross_amount", "discount_amount", "net_amount"],
+}
+
+export type ReportRow = Record<string, any>
+
+// Page source: returns up to `limit` rows strictly after `cursor` (null = start)
+export type ReportPageFetcher = (cursor: ReportRow | null, limit: number) => Promise<ReportRow[]>
+
+function csvValue(value: unknown) {
+  if (value === null || value === undefined) return ""
+  const text = String(value)
+  return /[",\r\n]/.test(text) ? `"${text.replace(/"/g, '""')}"` : text
+}
+
+export function encodeRows(rows: ReportRow[], columns: string[], format: ReportFormat) {
+  let out = ""
+  if (format === "csv") {
+    for (const row of rows) {
+      out += columns.map((c) => csvValue(row[c])).join(",") + "\n"
+    }
+  } else {
+    for (const row of rows) {
+      const record: ReportRow = {}
+      for (const c of columns) record[c] = row[c] ?? null
+      out += JSON.stringify(record) + "\n"
+    }
+  }
+  return out
+}
+
+export function createReportStream(options: {
+  fetchPage: ReportPageFetcher
+  columns: string[]
+  format: ReportFormat
+  pageSize?: number
+  onError?: (error: unknown) => void
+}): ReadableStream<Uint8Array> {
+  const { fetchPage, columns, format, pageSize = REPORT_PAGE_SIZE } = options
+  const encoder = new TextEncoder()
+  let cursor: ReportRow | null = null
+  let started = false
+
+  return new ReadableStream<Uint8Array>(
+    {
+      async pull(controller) {
+        if (!started) {
+          started = true
+          if (format === "csv") {
+            controller.enqueue(encoder.encode(columns.join(",") + "\n"))
+            return
+          }
+        }
+
+        try {
+          const rows = await fetchPage(cursor, pageSize)
+          if (rows.length > 0) {
+            controller.enqueue(encoder.encode(encodeRows(rows, columns, format)))
+            cursor = rows[rows.length - 1]
+          }
+          if (rows.length < pageSize) controller.close()
+        } catch (error) {
+          options.onError?.(error)
+          controller.error(error)
+        }
+      },
+    },
+    { highWaterMark: 1 },
+  )
+}
+
+const dayFormats = new Map<string, Intl.DateTimeFormat>()
+
+// Local calendar day (YYYY-MM-DD) of a timestamp in an IANA time zone
+export function reportDay(timestamp: string, timeZone: string) {
+  let format = dayFormats.get(timeZone)
+  if (!format) {
+    format = new Intl.DateTimeFormat("en-CA", { timeZone, year: "numeric", month: "2-digit", day: "2-digit" })
+    dayFormats.set(timeZone, format)
+  }
+  return format.format(new Date(timestamp))
+}
+
+export function isValidTimeZone(timeZone: string) {
+  try {
+    new Intl.DateTimeFormat("en-US", { timeZone })
+    return true
+  } catch {
+    return false
+  }
+}
+
+function cents(value: number) {
+  return Math.round(value * 100) / 100
+}
+
+// Report rows from /orders/ payloads, in the order sales_report_lines and
+// sales_report_daily return them. Needs every order in the range in memory,
+// like the Sales History page itself, so it is only the fallback.
+export function ordersToReportRows(
+  orders: any[],
+  sellers: Map<string, string>,
+  level: ReportLevel,
+  range: { from: string; to: string; tz: string },
+): ReportRow[] {
+  const from = Date.parse(range.from)
+  const to = Date.parse(range.to)
+  const inRange = orders
+    .map((order) => ({ order, time: Date.parse(order.created_at) }))
+    .filter(({ time }) => time >= from && time < to)
+    .sort((a, b) => a.time - b.time || Number(a.order.id) - Number(b.order.id))
+
+  const rows: ReportRow[] = []
+  if (level === "lines") {
+    for (const { order } of inRange) {
+      const items = [...(order.items || [])].sort((a: any, b: any) => Number(a.id ?? 0) - Number(b.id ?? 0))
+      items.forEach((item: any, index: number) => {
+        rows.push({
+          sale_date: order.created_at,
+          invoice_number: order.id.toString().padStart(6, "0"),
+          sale_id: order.id,
+          item_id: item.id ?? `${order.id}-${index + 1}`,
+          product_name: item.product?.name ?? null,
+          barcode: item.product?.barcode ?? null,
+          quantity: item.quantity,
+          unit_price: item.unit_price,
+          discount_applied: 0,
+          total_price: cents(item.quantity * item.unit_price),
+          client_name: order.user?.name ?? null,
+          client_cpf: order.user?.cpf ?? null,
+          seller_name: order.seller_id != null ? sellers.get(order.seller_id.toString()) ?? null : null,
+          payment_method: order.payment_method || "Cash",
+        })
+      })
+    }
+  } else {
+    let current: ReportRow | null = null
+    for (const { order } of inRange) {
+      const items = order.items || []
+      if (items.length === 0) continue
+      const day = reportDay(order.created_at, range.tz)
+      if (!current || current.day !== day) {
+        current = { day, sales_count: 0, items_count: 0, units_sold: 0, gross_amount: 0, discount_amount: 0, net_amount: 0 }
+        rows.push(current)
+      }
+      current.sales_count += 1
+      for (const item of items) {
+        current.items_count += 1
+        current.units_sold += item.quantity
+        current.gross_amount = cents(current.gross_amount + item.quantity * item.unit_price)
+      }
+      current.net_amount = current.gross_amount
+    }
+  }
+
+  // Position for the in-memory cursor; not one of the report columns
+  rows.forEach((row, index) => {
+    row.__index = index
+  })
+  return rows
+}
+
+// Inclusive YYYY-MM-DD dates in the browser's time zone to a half-open
+// [from, to) timestamp range, plus that zone for bucketing days
+export function reportRange(fromDate: string, toDate: string) {
+  const from = new Date(`${fromDate}T00:00:00`)
+  const to = new Date(`${toDate}T00:00:00`)
+  to.setDate(to.getDate() + 1)
+  const tz = Intl.DateTimeFormat().resolvedOptions().timeZone || "UTC"
+  return { from: from.toISOString(), to: to.toISOString(), tz }
+}
@@ -0,0 +1,49 @@
+-- Support for the write-behind audit pipeline (lib/audit-queue.ts)
+-- and cheaper stock movement writes on the checkout path
+
+-- Idempotency key: queued events are flushed with ON CONFLICT (event_id) DO NOTHING,
+-- so replaying a segment after a crash never duplicates rows
+ALTER TABLE public.audit_log ADD COLUMN IF NOT EXISTS event_id UUID;
+ALTER TABLE public.stock_movements ADD COLUMN IF NOT EXISTS event_id UUID;
+CREATE UNIQUE INDEX IF NOT EXISTS idx_audit_log_event_id ON public.audit_log (event_id);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_stock_movements_event_id ON public.stock_movements (event_id);
+
+-- Both tables are append-only and queried by time range; BRIN stays tiny and
+-- costs almost nothing per insert compared to a B-tree
+CREATE INDEX IF NOT EXISTS idx_audit_log_created_at_brin ON public.audit_log USING brin (created_at);
+CREATE INDEX IF NOT EXISTS idx_stock_movements_created_at_brin ON public.stock_movements USING brin (created_at);
+
+-- Append-only: the flusher only inserts
+REVOKE UPDATE, DELETE ON public.audit_log FROM authenticated, anon;
+REVOKE UPDATE, DELETE ON public.stock_movements FROM authenticated, anon;
+
+-- Replace the per-row sale trigger with a statement-level one: a sale with N
+-- items now does one stock UPDATE and one bulk movement INSERT instead of N each
+DROP TRIGGER IF EXISTS trigger_update_stock_on_sale ON public.sale_items;
+
+CREATE OR REPLACE FUNCTION update_stock_on_sale_batch()
+RETURNS TRIGGER AS $$
+BEGIN
+  UPDATE public.products p
+  SET stock_quantity = p.stock_quantity - s.total_quantity,
+      updated_at = NOW()
+  FROM (
+    SELECT product_id, SUM(quantity) AS total_quantity
+    FROM new_items
+    GROUP BY product_id
+  ) s
+  WHERE p.id = s.product_id;
+
+  INSERT INTO public.stock_movements (product_id, movement_type, quantity, reference_id, user_id, event_id)
+  SELECT product_id, 'sale', -quantity, sale_id, auth.uid(), gen_random_uuid()
+  FROM new_items;
+
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trigger_update_stock_on_sale
+  AFTER INSERT ON public.sale_items
+  REFERENCING NEW TABLE AS new_items
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION update_stock_on_sale_batch();
@@ -0,0 +1,28 @@
+-- Indexes backing the role-filtered, paginated /users/ lookups
+-- (client picker at the counter, client list search, staff list)
+--
+-- Runs in the backend's database: /users/ reads public.users, with the role
+-- in users.role_id -> roles.name. The endpoint contract the frontend relies
+-- on (lib/api-service.ts buildUserQuery):
+--   role=<name>          only users with that role
+--   exclude_role=<name>  everyone but that role
+--   search=<digits>      CPF prefix on the digits-only CPF
+--   search=<text>        case-insensitive substring of the name
+--   ids=1,2,3            only those ids
+--   skip / limit         paging, ordered by name, id
+-- CPF is stored both formatted and digits-only depending on the form that
+-- created the user, so the CPF lookup matches on regexp_replace(cpf, '\D', '', 'g').
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Role filter and paging: GET /users/?role=client&limit=20 resolves the role
+-- id once, then walks this index in name order
+CREATE INDEX IF NOT EXISTS idx_users_role_name_id ON public.users (role_id, name, id);
+
+-- CPF prefix lookup (GET /users/?role=client&search=123456):
+--   WHERE regexp_replace(cpf, '\D', '', 'g') LIKE '123456%'
+CREATE INDEX IF NOT EXISTS idx_users_cpf_digits_prefix
+  ON public.users ((regexp_replace(cpf, '\D', '', 'g')) text_pattern_ops);
+
+-- Case-insensitive substring name search (name ILIKE '%term%')
+CREATE INDEX IF NOT EXISTS idx_users_name_trgm ON public.users USING gin (name gin_trgm_ops);
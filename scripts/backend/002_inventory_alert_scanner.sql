@@ -0,0 +1,207 @@
+-- Precomputed inventory alert feed (low stock + expiring batches)
+-- Pages read GET /alerts/stock, GET /alerts/expiration and GET /alerts/summary
+-- from the backend (API_URL), so this runs in the backend's database. Table
+-- and column names follow the backend's payloads: products.id / name /
+-- stock_quantity / min_stock_level, and batches as returned by
+-- /products/{id}/batches (id, product_id, batch_number, expiration_date,
+-- quantity).
+--
+-- Thresholds must match lib/inventory-alerts.ts:
+--   default min stock level = 10, expiration window = 90 days (pages narrow it to 30)
+--
+-- Stock alerts are per product; expiration alerts are per batch that still
+-- has units on hand, so two expiring batches of one product are two alerts.
+
+-- Alert table: one stock row per product, one expiration row per batch
+CREATE TABLE IF NOT EXISTS public.inventory_alerts (
+  id SERIAL PRIMARY KEY,
+  product_id INTEGER NOT NULL REFERENCES public.products(id) ON DELETE CASCADE,
+  batch_id INTEGER REFERENCES public.batches(id) ON DELETE CASCADE,
+  kind TEXT NOT NULL CHECK (kind IN ('stock', 'expiration')),
+  current_stock INTEGER,
+  min_stock_level INTEGER,
+  batch_number TEXT,
+  batch_quantity INTEGER,
+  expiration_date DATE,
+  computed_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_inventory_alerts_stock_product
+  ON public.inventory_alerts (product_id) WHERE kind = 'stock';
+CREATE UNIQUE INDEX IF NOT EXISTS idx_inventory_alerts_expiration_batch
+  ON public.inventory_alerts (batch_id) WHERE kind = 'expiration';
+CREATE INDEX IF NOT EXISTS idx_inventory_alerts_stock
+  ON public.inventory_alerts (current_stock, product_id) WHERE kind = 'stock';
+CREATE INDEX IF NOT EXISTS idx_inventory_alerts_expiration
+  ON public.inventory_alerts (expiration_date, product_id, batch_id) WHERE kind = 'expiration';
+
+-- Products changed since the last scan (product row or any of its batches)
+CREATE TABLE IF NOT EXISTS public.alert_scan_queue (
+  product_id INTEGER PRIMARY KEY,
+  queued_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+-- Last day the date-driven part of the scan ran
+CREATE TABLE IF NOT EXISTS public.alert_scan_state (
+  id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+  last_scanned_on DATE NOT NULL DEFAULT CURRENT_DATE
+);
+INSERT INTO public.alert_scan_state (id) VALUES (TRUE) ON CONFLICT (id) DO NOTHING;
+
+-- Lets the daily pass find batches entering the expiration window by index
+CREATE INDEX IF NOT EXISTS idx_batches_in_stock_expiration
+  ON public.batches (expiration_date) WHERE quantity > 0;
+
+-- Queue the product whose alert-relevant data changed
+CREATE OR REPLACE FUNCTION queue_alert_scan()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF TG_TABLE_NAME = 'products' THEN
+    INSERT INTO public.alert_scan_queue (product_id)
+    VALUES (COALESCE(NEW.id, OLD.id))
+    ON CONFLICT (product_id) DO NOTHING;
+  ELSE
+    INSERT INTO public.alert_scan_queue (product_id)
+    VALUES (COALESCE(NEW.product_id, OLD.product_id))
+    ON CONFLICT (product_id) DO NOTHING;
+  END IF;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_queue_alert_scan ON public.products;
+CREATE TRIGGER trigger_queue_alert_scan
+  AFTER INSERT OR DELETE OR UPDATE OF stock_quantity, min_stock_level
+  ON public.products
+  FOR EACH ROW
+  EXECUTE FUNCTION queue_alert_scan();
+
+DROP TRIGGER IF EXISTS trigger_queue_alert_scan ON public.batches;
+CREATE TRIGGER trigger_queue_alert_scan
+  AFTER INSERT OR DELETE OR UPDATE OF quantity, expiration_date, batch_number, product_id
+  ON public.batches
+  FOR EACH ROW
+  EXECUTE FUNCTION queue_alert_scan();
+
+-- Incremental refresh: recomputes alerts only for queued products plus those
+-- with a batch that entered the window since the last run. With an empty
+-- queue on an already-scanned day this is a no-op, so the feed endpoints can
+-- call it before reading.
+CREATE OR REPLACE FUNCTION refresh_inventory_alerts(window_days INTEGER DEFAULT 90)
+RETURNS INTEGER AS $$
+DECLARE
+  last_scan DATE;
+  refreshed INTEGER;
+BEGIN
+  SELECT last_scanned_on INTO last_scan FROM public.alert_scan_state FOR UPDATE;
+
+  CREATE TEMP TABLE IF NOT EXISTS alert_scan_batch (product_id INTEGER PRIMARY KEY) ON COMMIT DROP;
+  TRUNCATE alert_scan_batch;
+
+  WITH drained AS (
+    DELETE FROM public.alert_scan_queue RETURNING product_id
+  )
+  INSERT INTO alert_scan_batch SELECT product_id FROM drained ON CONFLICT DO NOTHING;
+
+  IF last_scan < CURRENT_DATE THEN
+    INSERT INTO alert_scan_batch
+    SELECT DISTINCT b.product_id FROM public.batches b
+    WHERE b.quantity > 0
+      AND b.expiration_date > last_scan + window_days
+      AND b.expiration_date <= CURRENT_DATE + window_days
+    ON CONFLICT DO NOTHING;
+
+    UPDATE public.alert_scan_state SET last_scanned_on = CURRENT_DATE;
+  END IF;
+
+  DELETE FROM public.inventory_alerts a
+  USING alert_scan_batch s
+  WHERE a.product_id = s.product_id;
+
+  INSERT INTO public.inventory_alerts (product_id, kind, current_stock, min_stock_level)
+  SELECT p.id, 'stock', p.stock_quantity, COALESCE(p.min_stock_level, 10)
+  FROM public.products p
+  JOIN alert_scan_batch s ON s.product_id = p.id
+  WHERE p.stock_quantity <= COALESCE(p.min_stock_level, 10);
+
+  INSERT INTO public.inventory_alerts (product_id, batch_id, kind, batch_number, batch_quantity, expiration_date)
+  SELECT b.product_id, b.id, 'expiration', b.batch_number, b.quantity, b.expiration_date
+  FROM public.batches b
+  JOIN alert_scan_batch s ON s.product_id = b.product_id
+  WHERE b.quantity > 0
+    AND b.expiration_date <= CURRENT_DATE + window_days;
+
+  SELECT COUNT(*) INTO refreshed FROM alert_scan_batch;
+  RETURN refreshed;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Read model for the alert endpoints; days are derived at read time so
+-- existing rows never need rewriting as the calendar moves on
+CREATE OR REPLACE VIEW public.inventory_alert_feed AS
+SELECT
+  a.id,
+  a.kind,
+  a.product_id,
+  p.name AS product_name,
+  a.batch_id,
+  a.batch_number,
+  a.batch_quantity,
+  a.current_stock,
+  a.min_stock_level,
+  a.expiration_date,
+  (a.expiration_date - CURRENT_DATE) AS days_until_expiration,
+  CASE
+    WHEN a.kind = 'stock' AND a.current_stock <= 0 THEN 'critical'
+    WHEN a.kind = 'stock' THEN 'low'
+    WHEN a.expiration_date <= CURRENT_DATE THEN 'expired'
+    WHEN a.expiration_date <= CURRENT_DATE + 30 THEN 'expiring'
+    ELSE 'upcoming'
+  END AS severity,
+  a.computed_at
+FROM public.inventory_alerts a
+JOIN public.products p ON p.id = a.product_id;
+
+-- Totals for the overview cards and alert tab headers; the feed is paged, so
+-- pages must not derive counts from the rows they loaded. Expiration counts
+-- are batches.
+CREATE OR REPLACE FUNCTION inventory_alert_summary(within_days INTEGER DEFAULT 90)
+RETURNS TABLE (
+  out_of_stock BIGINT,
+  low_stock BIGINT,
+  expired BIGINT,
+  expiring_this_week BIGINT,
+  expiring BIGINT
+) AS $$
+  SELECT
+    COUNT(*) FILTER (WHERE kind = 'stock' AND current_stock <= 0),
+    COUNT(*) FILTER (WHERE kind = 'stock' AND current_stock > 0),
+    COUNT(*) FILTER (WHERE kind = 'expiration' AND expiration_date <= CURRENT_DATE),
+    COUNT(*) FILTER (WHERE kind = 'expiration' AND expiration_date > CURRENT_DATE
+                       AND expiration_date <= CURRENT_DATE + 7),
+    COUNT(*) FILTER (WHERE kind = 'expiration' AND expiration_date > CURRENT_DATE
+                       AND expiration_date <= CURRENT_DATE + within_days)
+  FROM public.inventory_alerts;
+$$ LANGUAGE sql STABLE;
+
+-- Backfill: queue every product once and build the initial feed
+INSERT INTO public.alert_scan_queue (product_id)
+SELECT id FROM public.products
+ON CONFLICT (product_id) DO NOTHING;
+SELECT refresh_inventory_alerts();
+
+-- The endpoints call refresh_inventory_alerts() before reading, so no
+-- scheduler is required. With pg_cron installed, a periodic run keeps the
+-- first read after a quiet period cheap:
+--   SELECT cron.schedule('refresh-inventory-alerts', '*/5 * * * *', $$SELECT refresh_inventory_alerts()$$);
+
+-- Example feed queries used by the backend endpoints:
+-- GET /alerts/stock?skip=0&limit=50
+--   SELECT * FROM public.inventory_alert_feed WHERE kind = 'stock'
+--   ORDER BY current_stock ASC, product_id LIMIT 50 OFFSET 0;
+-- GET /alerts/expiration?within_days=30&skip=0&limit=50
+--   SELECT * FROM public.inventory_alert_feed WHERE kind = 'expiration'
+--     AND expiration_date <= CURRENT_DATE + 30
+--   ORDER BY expiration_date ASC, product_id, batch_id LIMIT 50 OFFSET 0;
+-- GET /alerts/summary?within_days=30
+--   SELECT * FROM inventory_alert_summary(30);
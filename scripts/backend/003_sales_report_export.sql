@@ -0,0 +1,141 @@
+-- Keyset-paged sales report queries for the streaming export
+-- (app/api/reports/sales/route.ts, lib/sales-report.ts)
+--
+-- Sales are the backend's orders (POST/GET /orders/), the same rows the
+-- Sales History page lists, so these run in the backend's database behind
+-- GET /orders/report and GET /orders/report/count. Table and column names
+-- follow the backend's order payload (orders.user_id / seller_id /
+-- payment_method / created_at, order_items.product_id / quantity /
+-- unit_price).
+--
+-- Each call returns one page strictly after the given cursor. The cursor is
+-- also a range bound on (created_at, id), so a page is an index range scan
+-- starting at the cursor and costs the same for the first and the
+-- thousandth page of an annual report.
+--
+-- Days are local calendar days in the caller's time zone (p_tz, IANA name
+-- such as 'America/Sao_Paulo'), not the database session's.
+
+-- Range scan over orders by date, then the items of each order in id order
+CREATE INDEX IF NOT EXISTS idx_orders_created_at_id ON public.orders (created_at, id);
+CREATE INDEX IF NOT EXISTS idx_order_items_order_id_id ON public.order_items (order_id, id);
+
+-- Line-level rows ordered by (created_at, order_id, item_id)
+CREATE OR REPLACE FUNCTION sales_report_lines(
+  p_from TIMESTAMPTZ,
+  p_to TIMESTAMPTZ,
+  p_after_date TIMESTAMPTZ DEFAULT NULL,
+  p_after_sale INTEGER DEFAULT NULL,
+  p_after_item INTEGER DEFAULT NULL,
+  p_limit INTEGER DEFAULT 1000
+)
+RETURNS TABLE (
+  sale_date TIMESTAMPTZ,
+  invoice_number TEXT,
+  sale_id INTEGER,
+  item_id INTEGER,
+  product_name TEXT,
+  barcode TEXT,
+  quantity INTEGER,
+  unit_price NUMERIC(10,2),
+  discount_applied NUMERIC(10,2),
+  total_price NUMERIC(12,2),
+  client_name TEXT,
+  client_cpf TEXT,
+  seller_name TEXT,
+  payment_method TEXT
+) AS $$
+  SELECT
+    o.created_at,
+    LPAD(o.id::text, GREATEST(6, LENGTH(o.id::text)), '0'),
+    o.id,
+    i.id,
+    p.name,
+    p.barcode,
+    i.quantity,
+    i.unit_price,
+    0::numeric(10,2),
+    (i.quantity * i.unit_price)::numeric(12,2),
+    c.name,
+    c.cpf,
+    s.name,
+    COALESCE(o.payment_method, 'Cash')
+  FROM public.orders o
+  JOIN public.order_items i ON i.order_id = o.id
+  LEFT JOIN public.products p ON p.id = i.product_id
+  LEFT JOIN public.users c ON c.id = o.user_id
+  LEFT JOIN public.users s ON s.id = o.seller_id
+  WHERE o.created_at >= p_from
+    AND o.created_at < p_to
+    -- Sargable lower bound: the index scan starts at the cursor's order
+    AND (p_after_date IS NULL OR (o.created_at, o.id) >= (p_after_date, p_after_sale))
+    -- Tie-break inside the cursor's order, applied as a filter
+    AND (
+      p_after_date IS NULL
+      OR (o.created_at, o.id) > (p_after_date, p_after_sale)
+      OR i.id > p_after_item
+    )
+  ORDER BY o.created_at, o.id, i.id
+  LIMIT p_limit;
+$$ LANGUAGE sql STABLE;
+
+-- Daily totals ordered by local day; the cursor is the last day returned
+CREATE OR REPLACE FUNCTION sales_report_daily(
+  p_from TIMESTAMPTZ,
+  p_to TIMESTAMPTZ,
+  p_tz TEXT DEFAULT 'UTC',
+  p_after_day DATE DEFAULT NULL,
+  p_limit INTEGER DEFAULT 1000
+)
+RETURNS TABLE (
+  day DATE,
+  sales_count BIGINT,
+  items_count BIGINT,
+  units_sold BIGINT,
+  gross_amount NUMERIC,
+  discount_amount NUMERIC,
+  net_amount NUMERIC
+) AS $$
+  SELECT
+    (o.created_at AT TIME ZONE p_tz)::date AS day,
+    COUNT(DISTINCT o.id),
+    COUNT(i.id),
+    COALESCE(SUM(i.quantity), 0),
+    COALESCE(SUM(i.quantity * i.unit_price), 0),
+    0::numeric,
+    COALESCE(SUM(i.quantity * i.unit_price), 0)
+  FROM public.orders o
+  JOIN public.order_items i ON i.order_id = o.id
+  -- Local midnight after the cursor day, as a timestamptz range bound
+  WHERE o.created_at >= GREATEST(p_from, COALESCE((p_after_day + 1)::timestamp AT TIME ZONE p_tz, p_from))
+    AND o.created_at < p_to
+  GROUP BY 1
+  ORDER BY 1
+  LIMIT p_limit;
+$$ LANGUAGE sql STABLE;
+
+-- Row counts for progress reporting: item lines, or days that have sales
+CREATE OR REPLACE FUNCTION sales_report_count(p_from TIMESTAMPTZ, p_to TIMESTAMPTZ)
+RETURNS BIGINT AS $$
+  SELECT COUNT(*)
+  FROM public.orders o
+  JOIN public.order_items i ON i.order_id = o.id
+  WHERE o.created_at >= p_from AND o.created_at < p_to;
+$$ LANGUAGE sql STABLE;
+
+CREATE OR REPLACE FUNCTION sales_report_daily_count(p_from TIMESTAMPTZ, p_to TIMESTAMPTZ, p_tz TEXT DEFAULT 'UTC')
+RETURNS BIGINT AS $$
+  SELECT COUNT(DISTINCT (o.created_at AT TIME ZONE p_tz)::date)
+  FROM public.orders o
+  WHERE o.created_at >= p_from AND o.created_at < p_to
+    AND EXISTS (SELECT 1 FROM public.order_items i WHERE i.order_id = o.id);
+$$ LANGUAGE sql STABLE;
+
+-- Example queries used by the backend endpoints:
+-- GET /orders/report?level=lines&from=...&to=...&after_date=...&after_sale=...&after_item=...&limit=1000
+--   SELECT * FROM sales_report_lines(:from, :to, :after_date, :after_sale, :after_item, :limit);
+-- GET /orders/report?level=daily&from=...&to=...&tz=America/Sao_Paulo&after_day=...&limit=1000
+--   SELECT * FROM sales_report_daily(:from, :to, :tz, :after_day, :limit);
+-- GET /orders/report/count?level=lines|daily&from=...&to=...&tz=...
+--   SELECT sales_report_count(:from, :to) AS rows;
+--   SELECT sales_report_daily_count(:from, :to, :tz) AS rows;
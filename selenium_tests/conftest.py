@@ -0,0 +1,6 @@
+from driver_pool import warm_pool
+
+
+def pytest_sessionstart(session):
+    # Start the browsers once for the whole run; flows reuse them via acquire_driver()
+    warm_pool()
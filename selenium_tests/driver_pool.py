@@ -0,0 +1,277 @@
+"""Warm, offline-friendly Chrome sessions for the Selenium flows.
+
+ChromeDriverManager().install() asks the network for the latest driver on
+every call and each flow used to launch and quit its own browser. This module
+resolves chromedriver once and caches the path, then keeps headless browsers
+alive for the whole Python process. Between tests a browser is reset by
+closing extra tabs and clearing cookies, storage and cache instead of being
+relaunched.
+
+    from driver_pool import acquire_driver, release_driver
+
+    driver = acquire_driver()
+    try:
+        ...
+    finally:
+        release_driver(driver)
+
+Running several flows in one process (e.g. `pytest selenium_tests`) reuses
+the same browsers. Environment:
+
+    CHROMEDRIVER_PATH     use this driver, no lookup at all
+    SELENIUM_OFFLINE=1    never fall back to webdriver-manager (air-gapped runners)
+    SELENIUM_HEADED=1     show the browser window
+    SELENIUM_POOL_SIZE    browsers started up front by warm() (default 1)
+    SELENIUM_CACHE_DIR    where the resolved driver path is cached
+    CHROME_BIN            Chrome binary to read the version from, if not on PATH
+"""
+
+import atexit
+import glob
+import json
+import os
+import re
+import shutil
+import subprocess
+import threading
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from network_recorder import enable_performance_logging
+
+BASE_URL = os.environ.get("BASE_URL", "http://localhost:3000")
+API_ORIGIN = os.environ.get("API_ORIGIN", "http://127.0.0.1:8000")
+CACHE_DIR = os.environ.get("SELENIUM_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "pharmacare-selenium"))
+CACHE_FILE = os.path.join(CACHE_DIR, "chromedriver.json")
+CHROME_BINARIES = ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome"]
+# Standard install locations that are not on PATH (macOS app bundles, Windows)
+CHROME_INSTALL_PATHS = [
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+    "/Applications/Chromium.app/Contents/MacOS/Chromium",
+    os.path.expanduser("~/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"),
+    r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+    r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+]
+# Where webdriver-manager and Selenium Manager leave downloaded drivers
+DRIVER_GLOBS = [
+    os.path.join(os.path.expanduser("~"), ".wdm", "drivers", "chromedriver", "**", "chromedriver*"),
+    os.path.join(os.path.expanduser("~"), ".cache", "selenium", "chromedriver", "**", "chromedriver*"),
+]
+
+
+def chrome_major_version():
+    """Major version of the local Chrome, or None if it cannot be determined."""
+    candidates = [os.environ.get("CHROME_BIN")] + [shutil.which(name) for name in CHROME_BINARIES]
+    candidates += [path for path in CHROME_INSTALL_PATHS if os.path.isfile(path)]
+    for binary in filter(None, candidates):
+        try:
+            output = subprocess.run([binary, "--version"], capture_output=True, text=True, timeout=10).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+        match = re.search(r"(\d+)\.\d+\.\d+", output)
+        if match:
+            return match.group(1)
+    return None
+
+
+def _is_driver(path):
+    return os.path.isfile(path) and os.access(path, os.X_OK) and not path.endswith((".zip", ".json", ".txt"))
+
+
+def driver_version(path):
+    """Full version reported by a chromedriver binary, e.g. '120.0.6099.109', or None."""
+    try:
+        output = subprocess.run([path, "--version"], capture_output=True, text=True, timeout=10).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = re.search(r"(\d+(?:\.\d+)+)", output)
+    return match.group(1) if match else None
+
+
+def _version_key(version):
+    # Numeric, so 120.x sorts above 99.x
+    return tuple(int(part) for part in version.split("."))
+
+
+def _find_local_driver(major, offline):
+    """Looks for an already downloaded chromedriver matching Chrome's major version.
+
+    A driver for another major version (or any driver, when Chrome's version
+    is unknown) is only accepted offline; online, webdriver-manager fetches
+    the right one instead.
+    """
+    candidates = [shutil.which("chromedriver")]
+    for pattern in DRIVER_GLOBS:
+        candidates.extend(glob.glob(pattern, recursive=True))
+    found = {}
+    for path in filter(None, candidates):
+        if path not in found and _is_driver(path):
+            version = driver_version(path)
+            if version:
+                found[path] = version
+    if not found:
+        return None
+
+    by_version = sorted(found, key=lambda p: _version_key(found[p]), reverse=True)
+    if major:
+        for path in by_version:
+            if found[path].split(".")[0] == major:
+                return path
+    if offline:
+        print(f"   No chromedriver for Chrome {major or '?'} found offline; "
+              f"using {by_version[0]} ({found[by_version[0]]})")
+        return by_version[0]
+    return None
+
+
+def resolve_driver_path():
+    """Driver path from env, the local cache, a local scan, or (online only) webdriver-manager."""
+    if os.environ.get("CHROMEDRIVER_PATH"):
+        return os.environ["CHROMEDRIVER_PATH"]
+
+    offline = os.environ.get("SELENIUM_OFFLINE") == "1"
+    major = chrome_major_version()
+    try:
+        with open(CACHE_FILE) as f:
+            cached = json.load(f)
+        # The cached entry records the driver's own version, so a mismatched
+        # fallback is not reused once Chrome's version is known. If it can't
+        # be read here, trust the entry unless it was itself a recorded mismatch.
+        if _is_driver(cached["path"]):
+            driver_major = cached["driver_version"].split(".")[0]
+            if major:
+                if driver_major == major:
+                    return cached["path"]
+            elif cached.get("chrome_major") in (None, driver_major):
+                return cached["path"]
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+
+    path = _find_local_driver(major, offline)
+    if not path:
+        if offline:
+            raise RuntimeError(
+                f"No chromedriver for Chrome {major or '?'} found offline; set CHROMEDRIVER_PATH "
+                f"or place it under one of: {', '.join(DRIVER_GLOBS)}"
+            )
+        from webdriver_manager.chrome import ChromeDriverManager
+        path = ChromeDriverManager().install()
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(CACHE_FILE, "w") as f:
+        json.dump({"path": path, "driver_version": driver_version(path), "chrome_major": major}, f)
+    return path
+
+
+def chrome_options():
+    options = webdriver.ChromeOptions()
+    if os.environ.get("SELENIUM_HEADED") != "1":
+        options.add_argument("--headless=new")
+    # Fixed size instead of maximize_window(), which is a no-op when headless
+    options.add_argument("--window-size=1920,1080")
+    # Needed by network_recorder and pos_soak_test, so every pooled browser can serve any flow
+    options.add_argument("--enable-precise-memory-info")
+    return enable_performance_logging(options)
+
+
+class DriverPool:
+    """Keeps started Chrome sessions and hands them out with clean state."""
+
+    def __init__(self):
+        self._idle = []
+        self._all = []
+        self._lock = threading.Lock()
+        self._service_path = None
+
+    def _start(self):
+        if self._service_path is None:
+            self._service_path = resolve_driver_path()
+        driver = webdriver.Chrome(service=Service(self._service_path), options=chrome_options())
+        with self._lock:
+            self._all.append(driver)
+        return driver
+
+    def warm(self, size=None):
+        """Starts browsers up front, in parallel, so the first test does not pay for it."""
+        size = size or int(os.environ.get("SELENIUM_POOL_SIZE", 1))
+        missing = size - len(self._idle)
+        if missing <= 0:
+            return
+        if self._service_path is None:
+            self._service_path = resolve_driver_path()
+        started = []
+        threads = [threading.Thread(target=lambda: started.append(self._start())) for _ in range(missing)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        with self._lock:
+            self._idle.extend(started)
+
+    def acquire(self):
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return self._start()
+
+    def release(self, driver):
+        try:
+            self.reset(driver)
+        except Exception as e:
+            print(f"   Discarding browser that failed to reset: {e}")
+            self.discard(driver)
+            return
+        with self._lock:
+            self._idle.append(driver)
+
+    def reset(self, driver):
+        """Clears everything a test could leave behind, without relaunching Chrome."""
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        driver.get("about:blank")
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+        for origin in {BASE_URL.rstrip("/"), API_ORIGIN.rstrip("/")}:
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+        # Drop buffered performance entries so the next test's recorder starts empty
+        driver.get_log("performance")
+
+    def discard(self, driver):
+        with self._lock:
+            if driver in self._all:
+                self._all.remove(driver)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def close(self):
+        with self._lock:
+            drivers, self._all, self._idle = self._all, [], []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+
+_pool = DriverPool()
+atexit.register(_pool.close)
+
+
+def acquire_driver():
+    return _pool.acquire()
+
+
+def release_driver(driver):
+    _pool.release(driver)
+
+
+def warm_pool(size=None):
+    _pool.warm(size)
+
+
+if __name__ == "__main__":
+    print(f"chromedriver: {resolve_driver_path()} (cached in {CACHE_FILE})")
@@ -0,0 +1,332 @@
+"""Records API traffic during Selenium flows and flags wasteful request patterns.
+
+Browser traffic is read from Chrome's performance log (CDP Network events).
+Server actions show up there as POSTs carrying a ``Next-Action`` header, but
+the calls they make to the API happen inside the Next.js server; to see those
+too, start the frontend with ``NEXT_PUBLIC_API_URL=http://127.0.0.1:8010`` and
+set ``API_PROXY_PORT=8010`` so requests pass through ``ApiProxy``.
+
+Reports are JSON, grouped by flow step, and can be diffed between commits:
+
+    python selenium_tests/network_recorder.py diff old.json new.json
+"""
+
+import json
+import os
+import re
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+API_ORIGIN = os.environ.get("API_ORIGIN", "http://127.0.0.1:8000")
+API_PORT = urlsplit(API_ORIGIN).port or 8000
+
+# Query params that only defeat caching and must not make requests look distinct
+CACHE_BUSTERS = {"_t", "_", "ts", "timestamp"}
+PAGING_PARAMS = {"skip", "limit", "offset", "page", "page_size", "cursor"}
+# Query params whose values change from run to run (typed search terms, picked ids)
+VARIABLE_PARAMS = {"search", "q", "query", "term", "name", "cpf", "barcode", "ids", "id", "product_id", "cursor"}
+ID_SEGMENT = re.compile(r"^(\d+|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})$", re.I)
+FAN_OUT_THRESHOLD = 3
+
+
+def enable_performance_logging(options):
+    """Turns on the CDP performance log on Chrome options."""
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    return options
+
+
+def normalize_url(url):
+    """Drops cache-busting params and sorts the rest, so identical calls compare equal."""
+    parts = urlsplit(url)
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k not in CACHE_BUSTERS)
+    return parts.path + (f"?{urlencode(query)}" if query else "")
+
+
+def url_pattern(url):
+    """Replaces id-like path segments with {id}, e.g. /products/12/batches -> /products/{id}/batches."""
+    path = urlsplit(url).path
+    return "/".join("{id}" if ID_SEGMENT.match(seg) else seg for seg in path.split("/"))
+
+
+def endpoint_pattern(url):
+    """url_pattern plus the query with run-specific values replaced, e.g.
+    /users/?role=client&search=Client 1234 -> /users/?role=client&search={value}.
+
+    Counts and cross-commit diffs are keyed by this, so two runs of the same
+    code compare equal even though product ids and search terms differ.
+    """
+    query = []
+    for key, value in sorted(parse_qsl(urlsplit(url).query, keep_blank_values=True)):
+        if key in CACHE_BUSTERS:
+            continue
+        if key in VARIABLE_PARAMS:
+            value = "{value}"
+        elif key not in PAGING_PARAMS and ID_SEGMENT.match(value):
+            value = "{id}"
+        query.append(f"{key}={value}")
+    return url_pattern(url) + (f"?{'&'.join(query)}" if query else "")
+
+
+class NetworkRecorder:
+    """Collects API calls per flow step from the driver's performance log and an optional proxy."""
+
+    def __init__(self, driver, flow, api_ports=None):
+        self.driver = driver
+        self.flow = flow
+        self.api_ports = set(api_ports or [API_PORT])
+        self.current_step = "setup"
+        self.calls = []
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def begin(self, name):
+        """Starts a new flow step; calls seen from now on are attributed to it."""
+        # Let in-flight requests of the previous step land before switching
+        time.sleep(0.5)
+        self.drain()
+        self.current_step = name
+
+    @contextmanager
+    def step(self, name):
+        previous = self.current_step
+        self.begin(name)
+        try:
+            yield
+        finally:
+            self.begin(previous)
+
+    def record(self, source, method, url, body=None, status=None, response_headers=None):
+        with self._lock:
+            self.calls.append({
+                "step": self.current_step,
+                "source": source,
+                "method": method,
+                "url": normalize_url(url),
+                "raw_url": url,
+                "pattern": url_pattern(url),
+                "endpoint": endpoint_pattern(url),
+                "body": body,
+                "status": status,
+                "response_headers": {k.lower(): v for k, v in (response_headers or {}).items()},
+            })
+
+    def _is_api(self, url):
+        return urlsplit(url).port in self.api_ports
+
+    def drain(self):
+        """Moves Network events from the performance log into recorded calls."""
+        try:
+            entries = self.driver.get_log("performance")
+        except Exception:
+            return
+
+        for entry in entries:
+            message = json.loads(entry["message"])["message"]
+            params = message.get("params", {})
+            method = message.get("method")
+
+            if method == "Network.requestWillBeSent":
+                request = params["request"]
+                headers = {k.lower(): v for k, v in request.get("headers", {}).items()}
+                if self._is_api(request["url"]):
+                    self._pending[params["requestId"]] = ("browser", request["method"], request["url"], request.get("postData"))
+                elif "next-action" in headers:
+                    # Server action: the API calls it makes are only visible through ApiProxy
+                    action_url = f"{request['url'].split('?')[0]}#action={headers['next-action']}"
+                    self._pending[params["requestId"]] = ("server-action", "POST", action_url, request.get("postData"))
+            elif method == "Network.responseReceived" and params["requestId"] in self._pending:
+                source, req_method, url, body = self._pending.pop(params["requestId"])
+                response = params["response"]
+                self.record(source, req_method, url, body, response.get("status"), response.get("headers"))
+
+        # Requests that never got a response (failed, aborted) still count
+        for source, req_method, url, body in self._pending.values():
+            self.record(source, req_method, url, body)
+        self._pending.clear()
+
+    def report(self):
+        self.drain()
+        return build_report(self.flow, self.calls)
+
+    def save(self, directory=None):
+        directory = directory or os.path.join(os.path.dirname(os.path.abspath(__file__)), "reports")
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{self.flow}-network.json")
+        report = self.report()
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+        print_summary(report)
+        print(f"   Network report written to {path}")
+        return path
+
+
+def _is_cacheable(call):
+    headers = call["response_headers"]
+    cache_control = headers.get("cache-control", "")
+    if "no-store" in cache_control or "no-cache" in cache_control:
+        return False
+    return "etag" in headers or "last-modified" in headers or "max-age" in cache_control
+
+
+def build_report(flow, calls):
+    """Groups calls by step and flags duplicates, per-item fan-out and uncacheable full-list fetches."""
+    steps = defaultdict(list)
+    for call in calls:
+        steps[call["step"]].append(call)
+
+    report = {"flow": flow, "total_calls": len(calls), "steps": {}}
+    for step, step_calls in steps.items():
+        counts = Counter(f"{c['method']} {c['endpoint']}" for c in step_calls if c["source"] != "server-action")
+        actions = Counter(c["url"] for c in step_calls if c["source"] == "server-action")
+
+        # Duplicates are the same concrete request repeated within one run
+        concrete = Counter(f"{c['method']} {c['url']}" for c in step_calls if c["source"] != "server-action")
+        duplicates = {key: n for key, n in concrete.items() if n > 1}
+
+        ids_by_pattern = defaultdict(set)
+        for c in step_calls:
+            if "{id}" in c["pattern"]:
+                ids_by_pattern[f"{c['method']} {c['pattern']}"].add(c["url"])
+        fan_out = {key: len(urls) for key, urls in ids_by_pattern.items() if len(urls) >= FAN_OUT_THRESHOLD}
+
+        full_lists = sorted({
+            c["url"] for c in step_calls
+            if c["method"] == "GET"
+            and c["source"] != "server-action"
+            and urlsplit(c["raw_url"]).path.endswith("/")
+            and not PAGING_PARAMS & {k for k, _ in parse_qsl(urlsplit(c["raw_url"]).query)}
+            and not _is_cacheable(c)
+        })
+
+        report["steps"][step] = {
+            "calls": len(step_calls),
+            "by_endpoint": dict(sorted(counts.items())),
+            "server_actions": dict(sorted(actions.items())),
+            "duplicates": duplicates,
+            "fan_out": fan_out,
+            "uncacheable_full_lists": full_lists,
+        }
+    return report
+
+
+def print_summary(report):
+    print(f"\n--- Network report: {report['flow']} ({report['total_calls']} calls) ---")
+    for step, data in report["steps"].items():
+        print(f"   [{step}] {data['calls']} calls")
+        for key, n in data["duplicates"].items():
+            print(f"      DUPLICATE x{n}: {key}")
+        for key, n in data["fan_out"].items():
+            print(f"      FAN-OUT x{n}: {key}")
+        for url in data["uncacheable_full_lists"]:
+            print(f"      FULL LIST (uncacheable): GET {url}")
+
+
+def _by_pattern(by_endpoint):
+    """Re-keys by_endpoint counts by endpoint_pattern; also folds reports that keyed by concrete URL."""
+    counts = Counter()
+    for key, n in by_endpoint.items():
+        method, _, url = key.partition(" ")
+        counts[f"{method} {endpoint_pattern(url)}"] += n
+    return counts
+
+
+def diff_reports(old, new):
+    """Per step and endpoint-pattern call-count changes between two reports."""
+    changes = {}
+    for step in sorted(set(old["steps"]) | set(new["steps"])):
+        before = _by_pattern(old["steps"].get(step, {}).get("by_endpoint", {}))
+        after = _by_pattern(new["steps"].get(step, {}).get("by_endpoint", {}))
+        step_changes = {
+            key: (before.get(key, 0), after.get(key, 0))
+            for key in sorted(set(before) | set(after))
+            if before.get(key, 0) != after.get(key, 0)
+        }
+        if step_changes:
+            changes[step] = step_changes
+    return changes
+
+
+class ApiProxy:
+    """Pass-through HTTP proxy in front of the API that records server-side calls."""
+
+    def __init__(self, recorder, port, upstream=API_ORIGIN):
+        self.recorder = recorder
+        self.upstream = upstream.rstrip("/")
+        proxy = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _forward(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else None
+                headers = {k: v for k, v in self.headers.items() if k.lower() not in ("host", "content-length")}
+                request = urllib.request.Request(proxy.upstream + self.path, data=body, headers=headers, method=self.command)
+                try:
+                    with urllib.request.urlopen(request) as upstream_response:
+                        status, response_headers, payload = upstream_response.status, dict(upstream_response.headers), upstream_response.read()
+                except urllib.error.HTTPError as e:
+                    status, response_headers, payload = e.code, dict(e.headers), e.read()
+
+                # Browser calls (they carry Origin) are already captured from the performance log
+                if "Origin" not in self.headers and self.command != "OPTIONS":
+                    proxy.recorder.record("server", self.command, proxy.upstream + self.path,
+                                          body.decode("utf-8", "replace") if body else None, status, response_headers)
+
+                self.send_response(status)
+                for key, value in response_headers.items():
+                    if key.lower() not in ("transfer-encoding", "connection", "content-length"):
+                        self.send_header(key, value)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            do_GET = do_POST = do_PUT = do_DELETE = do_PATCH = do_OPTIONS = _forward
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def start_api_proxy(recorder):
+    """Starts ApiProxy when API_PROXY_PORT is set; returns None otherwise."""
+    port = os.environ.get("API_PROXY_PORT")
+    if not port:
+        return None
+    recorder.api_ports.add(int(port))
+    print(f"   Recording server-side API calls through proxy on :{port}")
+    return ApiProxy(recorder, int(port)).start()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 4 or sys.argv[1] != "diff":
+        print("Usage: python network_recorder.py diff OLD_REPORT.json NEW_REPORT.json")
+        sys.exit(2)
+
+    with open(sys.argv[2]) as f:
+        old_report = json.load(f)
+    with open(sys.argv[3]) as f:
+        new_report = json.load(f)
+
+    changes = diff_reports(old_report, new_report)
+    print(f"Total calls: {old_report['total_calls']} -> {new_report['total_calls']}")
+    for step, step_changes in changes.items():
+        print(f"[{step}]")
+        for key, (before, after) in step_changes.items():
+            print(f"   {before:>4} -> {after:<4} {key}")
+    sys.exit(1 if new_report["total_calls"] > old_report["total_calls"] else 0)
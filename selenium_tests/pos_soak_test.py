@@ -0,0 +1,265 @@
+"""Soak test for the POS screen: thousands of sales in one /sales/new tab.
+
+Runs the quick_sales_test checkout loop without reloading the page and samples
+JS heap, DOM node and event listener counts over CDP every N sales. Fails when
+growth since the warm-up baseline goes past the thresholds, which is what a
+register left open for a whole shift runs into.
+
+    python selenium_tests/pos_soak_test.py --sales 2000 --sample-every 50
+
+Samples are written to selenium_tests/reports/pos_soak.json.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from driver_pool import acquire_driver, release_driver
+from quick_sales_test import wait_and_click, wait_and_send_keys
+
+BASE_URL = os.environ.get("BASE_URL", "http://localhost:3000")
+
+# Finds a sellable product row (in stock, no prescription needed) and returns
+# its [batch button, add button]
+FIND_PRODUCT_JS = """
+const rows = document.evaluate(
+  "//input[@placeholder='Search by name or barcode...']/ancestor::div[contains(@class, 'space-y-4')][1]//div[contains(@class, 'border') and contains(@class, 'rounded-lg')]",
+  document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+for (let i = 0; i < rows.snapshotLength; i++) {
+  const row = rows.snapshotItem(i);
+  const buttons = row.querySelectorAll('button');
+  const needsRx = Array.from(row.querySelectorAll('div, span')).some((el) => el.children.length === 0 && el.textContent.trim() === 'Rx');
+  if (buttons.length >= 2 && !buttons[1].disabled && !needsRx) return [buttons[0], buttons[1]];
+}
+return null;
+"""
+
+# Trash buttons of the cart rows in the Sale Items card
+CART_REMOVE_BUTTONS_XPATH = (
+    "//*[starts-with(normalize-space(.), 'Sale Items (')]/ancestor::div[.//button][1]"
+    "//button[.//*[contains(@class, 'lucide-trash')]]"
+)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="POS soak test with heap / DOM / listener leak tracking")
+    parser.add_argument("--sales", type=int, default=int(os.environ.get("SOAK_SALES", 1000)))
+    parser.add_argument("--sample-every", type=int, default=int(os.environ.get("SOAK_SAMPLE_EVERY", 50)))
+    # Sales completed before the baseline sample, so lazy chunks and caches are already loaded
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--max-heap-growth-mb", type=float, default=20.0)
+    parser.add_argument("--max-node-growth", type=int, default=2000)
+    parser.add_argument("--max-listener-growth", type=int, default=500)
+    # A run that mostly fails its sales says nothing about leaks
+    parser.add_argument("--min-completion", type=float, default=0.95)
+    parser.add_argument("--max-consecutive-failures", type=int, default=5)
+    return parser.parse_args()
+
+
+def sample_memory(driver):
+    """Forces a GC, then reads heap, node and listener counts from CDP."""
+    driver.execute_cdp_cmd("HeapProfiler.collectGarbage", {})
+    metrics = {m["name"]: m["value"] for m in driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]}
+    page = driver.execute_script("""
+        const memory = performance.memory || {};
+        return {
+          used_js_heap: memory.usedJSHeapSize || 0,
+          attached_nodes: document.getElementsByTagName('*').length,
+        };
+    """)
+    return {
+        "js_heap_used": metrics.get("JSHeapUsedSize", page["used_js_heap"]),
+        "performance_memory_used": page["used_js_heap"],
+        # CDP counts nodes still referenced from JS too; the gap to attached_nodes is detached DOM
+        "nodes": int(metrics.get("Nodes", 0)),
+        "attached_nodes": page["attached_nodes"],
+        "listeners": int(metrics.get("JSEventListeners", 0)),
+        "documents": int(metrics.get("Documents", 0)),
+    }
+
+
+def checkout_once(driver, use_batch):
+    """One sale: add a product (optionally through the batch dialog), pay, close the receipt."""
+    wait = WebDriverWait(driver, 10)
+    buttons = wait.until(lambda d: d.execute_script(FIND_PRODUCT_JS))
+    batch_button, add_button = buttons
+
+    added = False
+    if use_batch:
+        driver.execute_script("arguments[0].click();", batch_button)
+        wait.until(EC.visibility_of_element_located((By.XPATH, "//h2[contains(text(), 'Select Batch')]")))
+        batch_rows = driver.find_elements(By.XPATH, "//div[@role='dialog']//div[contains(@class, 'cursor-pointer')]")
+        if batch_rows:
+            batch_rows[0].click()
+            added = True
+        else:
+            ActionChains(driver).send_keys(Keys.ESCAPE).perform()
+        wait.until(EC.invisibility_of_element_located((By.XPATH, "//div[@role='dialog']")))
+    if not added:
+        driver.execute_script("arguments[0].click();", add_button)
+
+    # The payment method is reset after every sale
+    payment_trigger = wait.until(EC.element_to_be_clickable(
+        (By.XPATH, "//label[contains(., 'Payment Method')]/parent::div//button[@role='combobox']")))
+    if "Select payment method" in payment_trigger.text:
+        payment_trigger.click()
+        wait.until(EC.element_to_be_clickable((By.XPATH, "//div[@role='option'][1]"))).click()
+
+    wait.until(EC.element_to_be_clickable((By.XPATH, "//button[contains(., 'Complete Sale')]"))).click()
+    wait.until(EC.visibility_of_element_located((By.XPATH, "//h2[contains(., 'Sale Receipt')]")))
+    wait.until(EC.element_to_be_clickable((By.XPATH, "//button[contains(., 'Print Receipt')]"))).click()
+    wait.until(EC.invisibility_of_element_located((By.XPATH, "//div[@role='dialog']")))
+
+
+def clear_cart(driver):
+    """Closes any open dialog and removes every cart row, so the next sale starts empty."""
+    ActionChains(driver).send_keys(Keys.ESCAPE).perform()
+    WebDriverWait(driver, 5).until(EC.invisibility_of_element_located((By.XPATH, "//div[@role='dialog']")))
+    for _ in range(50):
+        buttons = driver.find_elements(By.XPATH, CART_REMOVE_BUTTONS_XPATH)
+        if not buttons:
+            break
+        driver.execute_script("arguments[0].click();", buttons[0])
+        WebDriverWait(driver, 5).until(EC.staleness_of(buttons[0]))
+    WebDriverWait(driver, 5).until(
+        EC.visibility_of_element_located((By.XPATH, "//p[contains(., 'No items added yet')]")))
+
+
+def growth(baseline, sample):
+    return {key: sample[key] - baseline[key] for key in baseline}
+
+
+def threshold_failures(args, baseline, sample):
+    """Growth past the limits between the baseline and one sample."""
+    delta = growth(baseline, sample)
+    failures = []
+    if delta["js_heap_used"] > args.max_heap_growth_mb * 1e6:
+        failures.append(f"JS heap grew {delta['js_heap_used'] / 1e6:.1f} MB (limit {args.max_heap_growth_mb} MB)")
+    if delta["nodes"] > args.max_node_growth:
+        failures.append(f"DOM nodes grew by {delta['nodes']} (limit {args.max_node_growth}); "
+                        f"detached now {sample['nodes'] - sample['attached_nodes']}")
+    if delta["listeners"] > args.max_listener_growth:
+        failures.append(f"Event listeners grew by {delta['listeners']} (limit {args.max_listener_growth})")
+    return failures
+
+
+def run_soak(args):
+    print("Starting POS Soak Test...")
+    # Pooled browsers run with --enable-precise-memory-info, so performance.memory is unquantized
+    driver = acquire_driver()
+
+    samples = []
+    failures = []
+    baseline = None
+    completed = 0
+    attempted = 0
+    consecutive_failures = 0
+    started = time.time()
+
+    try:
+        print("\n--- Login ---")
+        driver.get(f"{BASE_URL}/auth/login")
+        wait_and_send_keys(driver, By.ID, "email", "admin@example.com")
+        wait_and_send_keys(driver, By.ID, "password", "admin")
+        wait_and_click(driver, By.XPATH, "//button[contains(text(), 'Sign In')]")
+        time.sleep(3)
+
+        print("\n--- Opening New Sale (kept open for the whole run) ---")
+        driver.get(f"{BASE_URL}/sales/new")
+        WebDriverWait(driver, 15).until(
+            EC.visibility_of_element_located((By.XPATH, "//input[@placeholder='Search by name or barcode...']"))
+        )
+        driver.execute_cdp_cmd("Performance.enable", {})
+
+        print(f"\n--- Running {args.sales} sales, sampling every {args.sample_every} ---")
+        for sale in range(1, args.sales + 1):
+            attempted = sale
+            try:
+                checkout_once(driver, use_batch=sale % 2 == 0)
+                completed += 1
+                consecutive_failures = 0
+            except Exception as e:
+                consecutive_failures += 1
+                print(f"   Sale {sale} failed: {e}")
+                if consecutive_failures >= args.max_consecutive_failures:
+                    failures.append(f"{consecutive_failures} sales in a row failed (last: sale {sale})")
+                    break
+                # A sale that failed after the add step leaves its items in the cart
+                try:
+                    clear_cart(driver)
+                except Exception as clear_error:
+                    print(f"   Could not clear the cart: {clear_error}")
+                continue
+
+            if baseline is None and completed >= args.warmup:
+                baseline = sample_memory(driver)
+                samples.append({"sale": sale, **baseline})
+                print(f"   Baseline after {completed} sales: {baseline}")
+            elif baseline and sale % args.sample_every == 0:
+                sample = sample_memory(driver)
+                samples.append({"sale": sale, **sample})
+                delta = growth(baseline, sample)
+                print(f"   [{sale}] heap {sample['js_heap_used'] / 1e6:.1f} MB ({delta['js_heap_used'] / 1e6:+.1f}), "
+                      f"nodes {sample['nodes']} ({delta['nodes']:+d}), "
+                      f"listeners {sample['listeners']} ({delta['listeners']:+d})")
+                # A leak shows up long before the last sale; stop at the first sample past a limit
+                failures = [f"after sale {sale}: {failure}" for failure in threshold_failures(args, baseline, sample)]
+                if failures:
+                    print(f"   Growth past thresholds after {sale} sales, stopping early")
+                    break
+
+        if baseline is None:
+            failures.append(f"Only {completed} sales completed; no baseline after {args.warmup} warm-up sales")
+        elif not failures:
+            final = sample_memory(driver)
+            samples.append({"sale": sale, **final})
+            failures = threshold_failures(args, baseline, final)
+
+        if attempted and completed / attempted < args.min_completion:
+            failures.append(f"Only {completed}/{attempted} sales completed "
+                            f"({completed / attempted:.0%}, minimum {args.min_completion:.0%})")
+
+    except Exception as e:
+        failures.append(f"Test aborted: {e}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        report_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "reports")
+        os.makedirs(report_dir, exist_ok=True)
+        report_path = os.path.join(report_dir, "pos_soak.json")
+        with open(report_path, "w") as f:
+            json.dump({
+                "sales_requested": args.sales,
+                "sales_attempted": attempted,
+                "sales_completed": completed,
+                "duration_s": round(time.time() - started, 1),
+                "thresholds": {
+                    "heap_growth_mb": args.max_heap_growth_mb,
+                    "node_growth": args.max_node_growth,
+                    "listener_growth": args.max_listener_growth,
+                    "min_completion": args.min_completion,
+                    "max_consecutive_failures": args.max_consecutive_failures,
+                },
+                "samples": samples,
+                "failures": failures,
+            }, f, indent=2)
+        print(f"   Samples written to {report_path}")
+        print("Releasing browser...")
+        release_driver(driver)
+
+    print(f"\n--- Soak result: {completed}/{args.sales} sales ---")
+    for failure in failures:
+        print(f"   FAIL: {failure}")
+    if not failures:
+        print("   No growth past thresholds.")
+    return not failures
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_soak(parse_args()) else 1)
@@ -1,12 +1,11 @@
 import time
 import random
 import datetime
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from driver_pool import acquire_driver, release_driver
+from network_recorder import NetworkRecorder, start_api_proxy
 
 def wait_and_click(driver, by, value, timeout=10):
     """Waits for an element to be clickable and clicks it."""
@@ -48,12 +47,13 @@ def wait_and_send_keys(driver, by, value, keys, timeout=10):
 def test_reorder_flow():
     print("Starting Quick Reorder Test...")
     
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service)
-    driver.maximize_window()
+    driver = acquire_driver()
+    recorder = NetworkRecorder(driver, "quick_reorder")
+    proxy = start_api_proxy(recorder)
     
     try:
         # 1. Login as Admin
+        recorder.begin("login")
         print("\n--- Login ---")
         driver.get("http://localhost:3000/auth/login")
         
@@ -67,6 +67,7 @@ def test_reorder_flow():
         print("   Logged in successfully.")
 
         # 2. Create Low Stock Product
+        recorder.begin("create_product")
         print("\n--- Creating Low Stock Product ---")
         driver.get("http://localhost:3000/products")
         time.sleep(2)
@@ -127,6 +128,7 @@ def test_reorder_flow():
         time.sleep(2)
 
         # 3. Go to Orders Page and Find Alert
+        recorder.begin("open_orders")
         print("\n--- Checking Stock Alerts ---")
         driver.get("http://localhost:3000/orders")
         time.sleep(3)
@@ -148,6 +150,7 @@ def test_reorder_flow():
         time.sleep(1)
         
         # 4. Fill Reorder Dialog
+        recorder.begin("reorder")
         print("\n--- Filling Reorder Request ---")
         wait_and_send_keys(driver, By.ID, "quantity", "50")
         
@@ -164,6 +167,7 @@ def test_reorder_flow():
         time.sleep(3)
         
         # 5. Receive Order
+        recorder.begin("receive")
         print("\n--- Receiving Order ---")
         driver.refresh()
         time.sleep(3)
@@ -199,6 +203,7 @@ def test_reorder_flow():
         time.sleep(3)
         
         # 6. Verify it moved to History (Optional but good)
+        recorder.begin("verify_history")
         print("\n--- Verifying History ---")
         try:
             # It should be in the history list now (green check circle)
@@ -210,6 +215,7 @@ def test_reorder_flow():
             print("   Warning: Order not found in history immediately (might need refresh or check logic).")
 
         # 7. Cleanup
+        recorder.begin("cleanup")
         print("\n--- Cleanup: Deleting Product ---")
         driver.get("http://localhost:3000/products")
         time.sleep(2)
@@ -237,7 +243,13 @@ def test_reorder_flow():
         import traceback
         traceback.print_exc()
     finally:
-        driver.quit()
+        try:
+            recorder.save()
+        except Exception as e:
+            print(f"Could not write network report: {e}")
+        if proxy:
+            proxy.stop()
+        release_driver(driver)
 
 if __name__ == "__main__":
     test_reorder_flow()
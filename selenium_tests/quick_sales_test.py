@@ -1,11 +1,10 @@
 import time
 import random
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from driver_pool import acquire_driver, release_driver
+from network_recorder import NetworkRecorder, start_api_proxy
 
 def wait_and_click(driver, by, value, timeout=10):
     try:
@@ -42,13 +41,14 @@ def wait_and_send_keys(driver, by, value, keys, timeout=10):
 
 def test_sales_only():
     print("Starting Quick Sales Test...")
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service)
-    driver.maximize_window()
+    driver = acquire_driver()
+    recorder = NetworkRecorder(driver, "quick_sales")
+    proxy = start_api_proxy(recorder)
     
     try:
         # Login
         print("Logging in...")
+        recorder.begin("login")
         driver.get("http://localhost:3000/auth/login")
         wait_and_send_keys(driver, By.ID, "email", "admin@example.com")
         wait_and_send_keys(driver, By.ID, "password", "admin")
@@ -57,11 +57,13 @@ def test_sales_only():
         
         # Go to Sales
         print("Navigating to New Sale...")
+        recorder.begin("open_new_sale")
         driver.get("http://localhost:3000/sales/new")
         time.sleep(3)
         
         # Debug Client Selection
         print("Attempting to select client...")
+        recorder.begin("select_client")
         
         # Strategy: Find the button that contains "client" (case insensitive)
         # The default value is "No client selected", so it should contain "client"
@@ -120,6 +122,7 @@ def test_sales_only():
         
         # Complete Sale
         print("Completing Sale...")
+        recorder.begin("complete_sale")
         try:
             complete_btn = driver.find_element(By.XPATH, "//button[contains(text(), 'Complete Sale')]")
             driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", complete_btn)
@@ -142,8 +145,14 @@ def test_sales_only():
         import traceback
         traceback.print_exc()
     finally:
-        print("Closing browser...")
-        driver.quit()
+        try:
+            recorder.save()
+        except Exception as e:
+            print(f"Could not write network report: {e}")
+        if proxy:
+            proxy.stop()
+        print("Releasing browser...")
+        release_driver(driver)
 
 if __name__ == "__main__":
     test_sales_only()
@@ -1,13 +1,11 @@
 import time
 import random
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.action_chains import ActionChains
-from webdriver_manager.chrome import ChromeDriverManager
+from driver_pool import acquire_driver, release_driver
 
 def wait_and_click(driver, by, value, timeout=10):
     """Waits for an element to be clickable and clicks it."""
@@ -72,10 +70,8 @@ def generate_valid_cpf():
 def test_frontend_flow():
     print("Starting Selenium Test...")
     
-    # Setup Chrome Driver
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service)
-    driver.maximize_window()
+    # Warm browser from the pool; state is cleared when it is released
+    driver = acquire_driver()
     
     try:
         # 1. Login
@@ -357,7 +353,7 @@ def test_frontend_flow():
         try:
             # Try case-insensitive text match for "Select client"
             client_btn = WebDriverWait(driver, 5).until(
-                EC.element_to_be_clickable((By.XPATH, "//button[@role='combobox']//span[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'select client')]"))
+                EC.element_to_be_clickable((By.XPATH, "//button[@role='combobox'][.//span[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'client selected')]]"))
             )
             print("   Found Client button by text.")
         except:
@@ -383,8 +379,12 @@ def test_frontend_flow():
         # Select the client from the list
         print("   Selecting client from list...")
         try:
+            # The picker only lists the top matches, so search for the client first
+            wait_and_send_keys(driver, By.XPATH, "//input[@placeholder='Search by name or CPF...']", f"Client {rand_id}")
+            time.sleep(1)
+
             # Try to find the specific client option
-            client_xpath = f"//div[@role='option']//span[contains(text(), 'Client {rand_id}')]"
+            client_xpath = f"//div[@role='option']//div[contains(text(), 'Client {rand_id}')]"
             
             # Wait for the option to be present in DOM
             option_element = WebDriverWait(driver, 5).until(
@@ -506,8 +506,8 @@ def test_frontend_flow():
         traceback.print_exc()
         print(f"Current URL: {driver.current_url}")
     finally:
-        print("Closing browser...")
-        driver.quit()
+        print("Releasing browser...")
+        release_driver(driver)
 
 if __name__ == "__main__":
     test_frontend_flow()
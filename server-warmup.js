@@ -0,0 +1,74 @@
+// Entry point for the standalone build (see Dockerfile).
+//
+// Starts the generated server.js and requests the critical routes once, so
+// their server bundles are loaded and rendered before real traffic arrives.
+// /api/health answers 503 until this finishes, which keeps the container
+// unhealthy (and out of the load balancer) while it is still cold.
+
+const http = require('http');
+
+const port = process.env.PORT || 3000;
+const routes = (process.env.WARMUP_ROUTES ?? '/auth/login,/dashboard,/sales/new')
+  .split(',')
+  .map((route) => route.trim())
+  .filter(Boolean);
+const timeoutMs = Number(process.env.WARMUP_TIMEOUT_MS || 60000);
+
+globalThis.__routeWarmup = routes.length > 0 ? 'pending' : 'done';
+
+function request(path, headers = {}) {
+  return new Promise((resolve, reject) => {
+    const started = Date.now();
+    const req = http.get({ host: '127.0.0.1', port, path, headers }, (res) => {
+      res.resume();
+      res.on('end', () => resolve({ status: res.statusCode, ms: Date.now() - started }));
+    });
+    req.on('error', reject);
+    req.setTimeout(timeoutMs, () => req.destroy(new Error(`Timed out warming ${path}`)));
+  });
+}
+
+async function waitForServer() {
+  const deadline = Date.now() + timeoutMs;
+  while (Date.now() < deadline) {
+    try {
+      await request('/api/health');
+      return;
+    } catch {
+      await new Promise((resolve) => setTimeout(resolve, 100));
+    }
+  }
+  throw new Error(`Server did not listen on port ${port} within ${timeoutMs}ms`);
+}
+
+async function warmup() {
+  const started = Date.now();
+  await waitForServer();
+
+  // The middleware only checks that a token cookie exists; the pages are
+  // client components, so a placeholder token renders their server shell
+  const cookie = 'token=warmup';
+  for (const route of routes) {
+    try {
+      const html = await request(route, { cookie });
+      // Flight payload used by client-side navigation to the route
+      const rsc = await request(route, { cookie, RSC: '1' });
+      console.log(`Warmed ${route}: ${html.status} in ${html.ms}ms, RSC ${rsc.status} in ${rsc.ms}ms`);
+    } catch (error) {
+      console.error(`Warm-up of ${route} failed:`, error.message);
+    }
+  }
+
+  globalThis.__routeWarmup = 'done';
+  console.log(`Warm-up finished in ${Date.now() - started}ms`);
+}
+
+require('./server.js');
+
+if (routes.length > 0) {
+  warmup().catch((error) => {
+    console.error('Warm-up failed:', error);
+    // Report ready anyway; a cold server is better than none
+    globalThis.__routeWarmup = 'done';
+  });
+}